@@ -0,0 +1 @@
+"""Offline benchmarks for mcp-youtube (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,92 @@
+"""Latency of MCP tool calls under concurrent clients: sync vs async handlers.
+
+Runs N in-memory MCP clients against a fake upstream, each requesting a
+different video, and reports p50/p99 per-call latency and total wall time.
+
+    python -m benchmarks.bench_async_tools --clients 50 --latency 0.2
+
+Variants:
+    sync-on-loop  original sync handler called directly in the event loop
+                  (how fastmcp<2.x-style servers dispatch sync tools)
+    sync          original sync handlers, dispatched by the installed fastmcp
+    async         the async handlers in mcp_youtube.server
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastmcp import Client, FastMCP
+
+from mcp_youtube import server
+from mcp_youtube.operations import transcripts, transcripts_async
+
+from .fake_upstream import FakeTranscriptApi, installed, percentile
+
+
+def _sync_server() -> FastMCP:
+    mcp = FastMCP("youtube-mcp-sync")
+
+    @mcp.tool
+    def get_transcript(video_url: str, language: str = "en") -> str:
+        return transcripts.get_transcript(video_url, language)
+
+    return mcp
+
+
+def _sync_on_loop_server() -> FastMCP:
+    mcp = FastMCP("youtube-mcp-blocking")
+
+    @mcp.tool
+    async def get_transcript(video_url: str, language: str = "en") -> str:
+        return transcripts.get_transcript(video_url, language)
+
+    return mcp
+
+
+async def _client(mcp: FastMCP, video_id: str, latencies: list[float]) -> None:
+    async with Client(mcp) as client:
+        started = time.perf_counter()
+        await client.call_tool("get_transcript", {"video_url": video_id})
+        latencies.append(time.perf_counter() - started)
+
+
+async def _run(mcp: FastMCP, clients: int) -> dict:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_client(mcp, f"vid{i:08d}", latencies) for i in range(clients))
+    )
+    wall = time.perf_counter() - started
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "wall_s": round(wall, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2, help="fake upstream seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="async upstream pool size")
+    args = parser.parse_args()
+    transcripts_async.configure_concurrency(args.concurrency)
+
+    variants = {
+        "sync-on-loop": _sync_on_loop_server(),
+        "sync": _sync_server(),
+        "async": server.mcp,
+    }
+    results = {}
+    for name, mcp in variants.items():
+        with installed(FakeTranscriptApi(latency=args.latency)):
+            results[name] = asyncio.run(_run(mcp, args.clients))
+    print(json.dumps({"clients": args.clients, "latency_s": args.latency, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
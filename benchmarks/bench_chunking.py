@@ -0,0 +1,91 @@
+"""RAG chunking of a long transcript: operations.chunking vs render-and-reparse.
+
+``reparse`` is what callers did before: render the timestamped JSON, parse it
+back into one dict per line, and accumulate lines into ~``--size``-token
+chunks. ``chunker`` cuts the same chunks straight from the columnar
+transcript. Reports time and peak traced memory of producing every chunk.
+
+    python -m benchmarks.bench_chunking --hours 10 --size 256 --overlap 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from mcp_youtube.operations import chunking, formats
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.paging import CHARS_PER_TOKEN
+
+from .fake_upstream import make_snippets, segments_for
+
+
+def _reparse(transcript: Transcript, size: int, overlap: int) -> list[dict[str, Any]]:
+    rows = json.loads(formats.render(transcript, "json"))
+    chunks: list[dict[str, Any]] = []
+    first = 0
+    while first < len(rows):
+        stop, used = first, -1
+        while stop < len(rows) and (used + 1 + len(rows[stop]["text"]) <= size * CHARS_PER_TOKEN or stop == first):
+            used += 1 + len(rows[stop]["text"])
+            stop += 1
+        window = rows[first:stop]
+        chunks.append(
+            {
+                "start": window[0]["start"],
+                "end": max(r["start"] + r["duration"] for r in window),
+                "text": " ".join(r["text"] for r in window),
+            }
+        )
+        if stop >= len(rows):
+            break
+        back, kept = stop, -1
+        while back - 1 > first and kept + 1 + len(rows[back - 1]["text"]) <= overlap * CHARS_PER_TOKEN:
+            back -= 1
+            kept += 1 + len(rows[back]["text"])
+        first = back
+    return chunks
+
+
+def _measure(fn: Callable[[], Any]) -> tuple[Any, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=10.0)
+    parser.add_argument("--size", type=int, default=256, help="tokens per chunk")
+    parser.add_argument("--overlap", type=int, default=32, help="tokens of overlap")
+    args = parser.parse_args()
+
+    lines = segments_for(args.hours * 60)
+    transcript = Transcript.from_rows(
+        (s.start, s.duration, s.text) for s in make_snippets("chunkbench01", lines)
+    )
+    results = {}
+    for name, fn in (
+        ("reparse", lambda: _reparse(transcript, args.size, args.overlap)),
+        ("chunker", lambda: list(chunking.chunks(transcript, args.size, "tokens", args.overlap))),
+        # Streaming consumer: one chunk alive at a time
+        ("chunker_streamed", lambda: sum(1 for _ in chunking.chunks(transcript, args.size, "tokens", args.overlap))),
+    ):
+        chunks, seconds, peak = _measure(fn)
+        results[name] = {
+            "chunks": chunks if isinstance(chunks, int) else len(chunks),
+            "ms": round(seconds * 1000, 1),
+            "peak_bytes": peak,
+        }
+    print(json.dumps({"hours": args.hours, "lines": lines, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Size, render time and peak memory of each timestamped output format.
+
+``baseline`` is the previous path: ``json.dumps(transcript.to_raw_data())``,
+which builds one dict per line before encoding. ``write`` streams the format
+to a discarding sink chunk by chunk, so its peak is one chunk, not the output.
+
+    python -m benchmarks.bench_formats --hours 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from mcp_youtube.operations import formats
+from mcp_youtube.operations.compact import Transcript
+
+from .fake_upstream import make_snippets, segments_for
+
+
+class _Sink(io.TextIOBase):
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+def _measure(fn: Callable[[], Any]) -> tuple[Any, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=10.0)
+    args = parser.parse_args()
+
+    lines = segments_for(args.hours * 60)
+    transcript = Transcript.from_rows(
+        (s.start, s.duration, s.text) for s in make_snippets("formatbench1", lines)
+    )
+    out, seconds, peak = _measure(lambda: json.dumps(transcript.to_raw_data()))
+    results = {
+        "baseline": {
+            "chars": len(out),
+            "render_ms": round(seconds * 1000, 1),
+            "peak_bytes": peak,
+        }
+    }
+    del out
+    for fmt in formats.FORMATS:
+        out, seconds, peak = _measure(lambda: formats.render(transcript, fmt))
+        _, write_seconds, write_peak = _measure(lambda: formats.write(transcript, _Sink(), fmt))
+        results[fmt] = {
+            "chars": len(out),
+            "render_ms": round(seconds * 1000, 1),
+            "peak_bytes": peak,
+            "write_ms": round(write_seconds * 1000, 1),
+            "write_peak_bytes": write_peak,
+        }
+        del out
+    print(json.dumps({"hours": args.hours, "lines": lines, "formats": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
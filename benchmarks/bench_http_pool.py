@@ -0,0 +1,132 @@
+"""Connection setup with and without the pooled upstream client.
+
+Runs a local keep-alive HTTP server that counts accepted connections, then
+issues the same GETs from many threads three ways:
+
+- ``per_call``: a fresh ``requests.Session`` per request, as when a new
+  ``YouTubeTranscriptApi()`` is created per call for thread safety;
+- ``shared_default``: one library-default session shared by every thread
+  (pool of 10, no timeouts);
+- ``pooled``: ``UpstreamClient`` per-thread sessions over one sized pool.
+
+    python -m benchmarks.bench_http_pool --requests 400 --threads 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+import requests
+
+from mcp_youtube.operations.http import HttpConfig, UpstreamClient
+
+from .fake_upstream import percentile
+
+BODY = b'{"ok": true}'
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with _CountingHandler.lock:
+            _CountingHandler.connections += 1
+
+    def do_GET(self) -> None:
+        latency = float(self.server.latency)  # type: ignore[attr-defined]
+        if latency:
+            time.sleep(latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def local_server(latency: float = 0.0) -> Iterator[str]:
+    """Serve on an ephemeral port; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    server.daemon_threads = True
+    server.latency = latency  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _run(get: Callable[[str], None], url: str, requests_: int, threads: int) -> dict:
+    _CountingHandler.connections = 0
+    latencies: list[float] = []
+
+    def one(_: int) -> None:
+        started = time.perf_counter()
+        get(url)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(requests_)))
+    elapsed = time.perf_counter() - started
+    return {
+        "connections": _CountingHandler.connections,
+        "requests_per_s": round(requests_ / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.005, help="server delay (s)")
+    args = parser.parse_args()
+
+    def per_call(url: str) -> None:
+        with requests.Session() as session:
+            session.get(url).content
+
+    shared = requests.Session()
+
+    def shared_default(url: str) -> None:
+        shared.get(url).content
+
+    client = UpstreamClient(HttpConfig(pool_size=args.threads))
+
+    def pooled(url: str) -> None:
+        client.session().get(url).content
+
+    results = {}
+    with local_server(args.latency) as url:
+        for name, get in (
+            ("per_call", per_call),
+            ("shared_default", shared_default),
+            ("pooled", pooled),
+        ):
+            results[name] = _run(get, url, args.requests, args.threads)
+    print(
+        json.dumps(
+            {"requests": args.requests, "threads": args.threads, **results}, indent=2
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
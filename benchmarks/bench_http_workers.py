@@ -0,0 +1,184 @@
+"""Throughput of the multi-worker HTTP server from 1 to N worker processes.
+
+For each worker count, starts ``mcp-youtube serve --http`` (via
+``serving.serve``) on a local port with the fake upstream installed in every
+worker. It then drives ``--clients`` concurrent JSON-RPC ``tools/call``
+requests for ``--seconds``, over a pool of ``--videos`` videos (so each worker
+sees cold and then cached transcripts). Reports requests/s, p50/p99, rejected
+(503) and timed-out (504) requests, the speedup over one worker, and how long
+a graceful SIGTERM shutdown took.
+
+    python -m benchmarks.bench_http_workers --workers 1,2,4 --clients 64 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from mcp_youtube import serving
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.config import env_float, env_int
+
+from .fake_upstream import FakeTranscriptApi, percentile
+
+ROOT = Path(__file__).resolve().parent.parent
+HEADERS = {"accept": "application/json, text/event-stream"}
+
+
+def create_app():
+    """Worker app factory: the real app over a fake upstream (settings via env)."""
+    transcripts._api = FakeTranscriptApi(
+        latency=env_float("BENCH_UPSTREAM_LATENCY", 0.05),
+        segments=env_int("BENCH_SEGMENTS", 300),
+    )
+    transcripts.configure_rate_limit(rate=0)
+    return serving.create_app()
+
+
+def _start(workers: int, port: int, latency: float, segments: int) -> subprocess.Popen:
+    code = (
+        "from mcp_youtube import serving; "
+        f"serving.serve(port={port}, workers={workers}, "
+        "app='benchmarks.bench_http_workers:create_app')"
+    )
+    env = {
+        **os.environ,
+        "BENCH_UPSTREAM_LATENCY": str(latency),
+        "BENCH_SEGMENTS": str(segments),
+        "MCP_YOUTUBE_HTTP_LOG_LEVEL": "warning",
+    }
+    return subprocess.Popen([sys.executable, "-c", code], cwd=ROOT, env=env)
+
+
+def _wait_healthy(base: str, workers: int, timeout: float = 60.0) -> None:
+    # Every worker imports fastmcp on its own; wait until they all answer.
+    deadline = time.monotonic() + timeout
+    pids: set[int] = set()
+    while time.monotonic() < deadline:
+        try:
+            pids.add(httpx.get(f"{base}/health", timeout=1).json()["pid"])
+        except (httpx.HTTPError, ValueError):
+            time.sleep(0.2)
+            continue
+        if len(pids) >= workers:
+            return
+        time.sleep(0.05)
+    if not pids:
+        raise RuntimeError(f"server at {base} did not become healthy")
+
+
+def _call(request_id: int, video_id: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": "get_transcript", "arguments": {"video_url": video_id}},
+    }
+
+
+async def _load(base: str, clients: int, seconds: float, videos: int, seed: int) -> dict:
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async def client(worker: int, http: httpx.AsyncClient) -> None:
+        rng = random.Random(seed * 1000 + worker)
+        n = 0
+        while time.perf_counter() < deadline:
+            n += 1
+            video_id = f"vid{rng.randrange(videos):08d}"
+            started = time.perf_counter()
+            try:
+                response = await http.post(
+                    f"{base}{serving.MCP_PATH}", json=_call(n, video_id), headers=HEADERS
+                )
+                status = str(response.status_code)
+                if response.status_code == 200 and '\\"error\\"' in response.text:
+                    status = "tool_error"
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    async with httpx.AsyncClient(limits=limits, timeout=60) as http:
+        await asyncio.gather(*(client(i, http) for i in range(clients)))
+    wall = time.perf_counter() - started
+    ok = statuses.get("200", 0)
+    return {
+        "requests": len(latencies),
+        "ok_per_s": round(ok / wall, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "statuses": statuses,
+    }
+
+
+def _stop(proc: subprocess.Popen) -> float:
+    started = time.perf_counter()
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    return round(time.perf_counter() - started, 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--videos", type=int, default=200, help="distinct videos requested")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake upstream seconds")
+    parser.add_argument("--segments", type=int, default=300, help="lines per transcript")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = []
+    for workers in (int(w) for w in args.workers.split(",")):
+        base = f"http://127.0.0.1:{args.port}"
+        proc = _start(workers, args.port, args.latency, args.segments)
+        try:
+            _wait_healthy(base, workers)
+            row = asyncio.run(
+                _load(base, args.clients, args.seconds, args.videos, args.seed)
+            )
+        finally:
+            shutdown_s = _stop(proc)
+        row = {"workers": workers, **row, "shutdown_s": shutdown_s}
+        results.append(row)
+        print(json.dumps(row), file=sys.stderr)
+    base_rate = results[0]["ok_per_s"] or 1.0
+    for row in results:
+        row["speedup"] = round(row["ok_per_s"] / base_rate, 2)
+    print(
+        json.dumps(
+            {
+                "cpus": os.cpu_count(),
+                "clients": args.clients,
+                "seconds": args.seconds,
+                "latency": args.latency,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
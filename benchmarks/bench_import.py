@@ -0,0 +1,131 @@
+"""Cold-start import cost of the entry points, from ``python -X importtime``.
+
+Each module is imported in fresh interpreters; per module the median of the
+runs is reported:
+
+- ``wall_ms``: whole process, interpreter start to exit;
+- ``import_ms``: cumulative import time of the module itself;
+- ``own_ms``: self time of ``mcp_youtube`` modules (our code, including
+  tool registration), excluding the dependencies they pull in;
+- ``fetch_stack``: fetch-stack modules that got imported; the server and
+  the CLI must not load any of them at startup;
+- ``heaviest``: the module's direct imports by cumulative time.
+
+Exits non-zero when the server or CLI exceeds a budget.
+
+    python -m benchmarks.bench_import --runs 5 --budget-ms 2500 --own-budget-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = (
+    "mcp_youtube.server",
+    "mcp_youtube.cli",
+    "mcp_youtube.langchain_tools",
+    "mcp_youtube.operations.transcripts",
+)
+# Entry points whose startup is on a client's critical path
+BUDGETED = ("mcp_youtube.server", "mcp_youtube.cli")
+FETCH_STACK = (
+    "youtube_transcript_api",
+    "mcp_youtube.operations.transcripts",
+    "mcp_youtube.operations.transcripts_async",
+    "mcp_youtube.operations.http",
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """``(module, depth, self_us, cumulative_us)`` per ``-X importtime`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(module: str) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+    rows = parse_importtime(proc.stderr)
+    imported = {name for name, _, _, _ in rows}
+    # Output is post-order: a module's direct imports precede its own line.
+    children: list[tuple[str, float]] = []
+    for name, depth, _, cumulative in rows:
+        if depth == 1:
+            children.append((name, cumulative / 1000))
+        elif depth == 0:
+            if name == module:
+                break
+            children = []
+    return {
+        "wall_ms": wall * 1000,
+        "import_ms": next(c for name, _, _, c in rows if name == module) / 1000,
+        "own_ms": sum(s for name, _, s, _ in rows if name.startswith("mcp_youtube")) / 1000,
+        "fetch_stack": sorted(imported & set(FETCH_STACK) - {module}),
+        "heaviest": sorted(children, key=lambda item: -item[1])[:8],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", default=",".join(MODULES))
+    parser.add_argument(
+        "--budget-ms", type=float, default=2500.0, help="max median wall time of an entry point"
+    )
+    parser.add_argument(
+        "--own-budget-ms", type=float, default=150.0, help="max median own_ms of an entry point"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    over = []
+    for module in filter(None, args.modules.split(",")):
+        runs = [measure(module) for _ in range(args.runs)]
+        result = {
+            key: round(statistics.median(run[key] for run in runs), 1)
+            for key in ("wall_ms", "import_ms", "own_ms")
+        }
+        result["fetch_stack"] = runs[-1]["fetch_stack"]
+        result["heaviest"] = [[name, round(ms, 1)] for name, ms in runs[-1]["heaviest"]]
+        results[module] = result
+        if module in BUDGETED:
+            if result["wall_ms"] > args.budget_ms:
+                over.append(f"{module}: wall {result['wall_ms']} ms > {args.budget_ms} ms")
+            if result["own_ms"] > args.own_budget_ms:
+                over.append(f"{module}: own {result['own_ms']} ms > {args.own_budget_ms} ms")
+            if result["fetch_stack"]:
+                over.append(f"{module}: imports {', '.join(result['fetch_stack'])}")
+    print(
+        json.dumps(
+            {
+                "runs": args.runs,
+                "budget_ms": args.budget_ms,
+                "own_budget_ms": args.own_budget_ms,
+                "modules": results,
+                "over_budget": over,
+            },
+            indent=2,
+        )
+    )
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""LangChain ``abatch`` over many videos: native coroutines vs sync-in-executor.
+
+Each variant runs ``yt_get_transcript.abatch`` over ``--videos`` distinct
+videos (each requested ``--repeat`` times, as agents re-ask) against a fake
+upstream, and reports wall time, upstream calls and peak thread count.
+
+    python -m benchmarks.bench_langchain_async --videos 60 --latency 0.2
+
+Variants:
+    executor  the sync tool only; LangChain runs each call on the loop's
+              default executor thread (the behavior before async tools)
+    native    the tool's coroutine: cache hits inline, misses coalesced on
+              the bounded transcripts_async pool
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+from mcp_youtube import langchain_tools
+from mcp_youtube.operations import transcripts_async
+
+from .fake_upstream import FakeTranscriptApi, installed
+
+
+def _sync_only(tool: StructuredTool) -> StructuredTool:
+    return StructuredTool.from_function(
+        func=tool.func, name=tool.name, description=tool.description, args_schema=tool.args_schema
+    )
+
+
+async def _peak_threads(stop: asyncio.Event) -> int:
+    peak = threading.active_count()
+    while not stop.is_set():
+        peak = max(peak, threading.active_count())
+        await asyncio.sleep(0.005)
+    return peak
+
+
+async def _run(tool: BaseTool, inputs: list[dict], max_concurrency: int | None) -> dict:
+    stop = asyncio.Event()
+    sampler = asyncio.ensure_future(_peak_threads(stop))
+    started = time.perf_counter()
+    results = await tool.abatch(inputs, config={"max_concurrency": max_concurrency})
+    wall = time.perf_counter() - started
+    stop.set()
+    return {
+        "wall_s": round(wall, 3),
+        "calls_per_s": round(len(inputs) / wall, 1),
+        "errors": sum(1 for r in results if r.startswith('{"error"')),
+        "peak_threads": await sampler,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=2, help="requests per video")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake upstream seconds")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=None, help="abatch max_concurrency (default: all)"
+    )
+    parser.add_argument("--pool", type=int, default=16, help="async upstream pool size")
+    parser.add_argument("--tool-limit", type=int, default=32, help="async tool calls in flight")
+    args = parser.parse_args()
+    transcripts_async.configure_concurrency(args.pool)
+    langchain_tools.configure_concurrency(args.tool_limit)
+
+    inputs = [
+        {"video_url": f"vid{i:08d}"} for _ in range(args.repeat) for i in range(args.videos)
+    ]
+    native = langchain_tools.yt_get_transcript
+    variants = {"executor": _sync_only(native), "native": native}
+    results = {}
+    for name, tool in variants.items():
+        with installed(FakeTranscriptApi(latency=args.latency)) as api:
+            results[name] = asyncio.run(_run(tool, inputs, args.max_concurrency))
+            results[name]["upstream_calls"] = api.calls
+    print(
+        json.dumps(
+            {
+                "videos": args.videos,
+                "calls": len(inputs),
+                "latency": args.latency,
+                "variants": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Memory footprint of transcript representations on a synthetic long video.
+
+Compares the raw-dict form (``to_raw_data()``, built on every call before),
+the library's FetchedTranscript (one dataclass per line) and the columnar
+compact.Transcript. Raw-dict bytes exclude the text strings, which are shared
+with the FetchedTranscript.
+
+    python -m benchmarks.bench_memory --hours 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from youtube_transcript_api import FetchedTranscript
+
+from mcp_youtube.operations.compact import Transcript
+
+from .fake_upstream import make_snippets
+
+# Average on-screen time of an auto-generated caption line
+SECONDS_PER_LINE = 3.0
+
+
+def _measure(build: Callable[[], Any]) -> tuple[Any, int, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=10.0)
+    args = parser.parse_args()
+
+    lines = int(args.hours * 3600 / SECONDS_PER_LINE)
+    fetched, fetched_bytes, _ = _measure(
+        lambda: FetchedTranscript(
+            snippets=make_snippets("memorybench1", lines),
+            video_id="memorybench1",
+            language="English",
+            language_code="en",
+            is_generated=True,
+        )
+    )
+    _, raw_bytes, raw_seconds = _measure(fetched.to_raw_data)
+    compact, compact_bytes, compact_seconds = _measure(
+        lambda: Transcript.from_fetched(fetched)
+    )
+
+    print(
+        json.dumps(
+            {
+                "hours": args.hours,
+                "lines": lines,
+                "raw_dicts": {"bytes": raw_bytes, "build_ms": round(raw_seconds * 1000, 1)},
+                "fetched_transcript": {"bytes": fetched_bytes},
+                "compact": {
+                    "bytes": compact_bytes,
+                    "build_ms": round(compact_seconds * 1000, 1),
+                    "nbytes_estimate": compact.nbytes(),
+                },
+                "raw_dicts_vs_compact": round(raw_bytes / compact_bytes, 1),
+                "fetched_vs_compact": round(fetched_bytes / compact_bytes, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
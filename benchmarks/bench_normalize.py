@@ -0,0 +1,64 @@
+"""Caption normalization: payload size and tokens per mode, and build cost.
+
+Runs every ``operations.normalize`` mode over an auto-generated-style
+transcript (rolling fragments that repeat the previous line's tail, plus
+``[Music]`` tags), and reports lines, characters and approximate tokens of the
+plain-text and JSON outputs relative to the raw track. The first ``apply``
+builds the normalized transcript; later ones hit the per-transcript cache.
+
+    python -m benchmarks.bench_normalize --hours 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from mcp_youtube.operations import formats, normalize
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.paging import CHARS_PER_TOKEN
+
+from .fake_upstream import make_auto_snippets, segments_for
+
+MODES = ("none", "clean", "sentences", "30s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # Auto-generated fragments are shorter than the fake upstream's lines.
+    lines = segments_for(args.hours * 60) * 2
+    transcript = Transcript.from_rows(
+        (s.start, s.duration, s.text) for s in make_auto_snippets("normbench01", lines)
+    )
+    results = {}
+    for mode in MODES:
+        started = time.perf_counter()
+        normalized = normalize.apply(transcript, mode)
+        build = time.perf_counter() - started
+        started = time.perf_counter()
+        normalize.apply(transcript, mode)
+        cached = time.perf_counter() - started
+        text_chars = len(normalized.blob)
+        json_chars = len(formats.render(normalized, "json"))
+        results[mode] = {
+            "lines": len(normalized),
+            "text_chars": text_chars,
+            "text_tokens": -(-text_chars // CHARS_PER_TOKEN),
+            "json_chars": json_chars,
+            "json_tokens": -(-json_chars // CHARS_PER_TOKEN),
+            "build_ms": round(build * 1000, 2),
+            "cached_us": round(cached * 1e6, 2),
+        }
+    raw = results["none"]
+    for result in results.values():
+        result["text_ratio"] = round(result["text_chars"] / raw["text_chars"], 3)
+        result["json_ratio"] = round(result["json_chars"] / raw["json_chars"], 3)
+    print(json.dumps({"hours": args.hours, "lines": lines, "modes": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Stale-while-revalidate vs plain TTL expiry under a skewed workload.
+
+Client threads request videos with Zipf-like popularity for ``--seconds``
+against the fake upstream, with a short cache TTL so hot entries expire many
+times during the run. ``ttl`` turns revalidation off, so every expiry is a
+blocking refetch on the request path. ``swr`` serves the stale entry at once
+and refreshes it in the background, within ``--budget`` refreshes per
+``--interval``. A ``--change-rate`` fraction of upstream fetches returns new
+text, so the refresh counters show refreshes against real changes.
+``blocked`` counts requests that waited on upstream (over half its latency).
+
+    python -m benchmarks.bench_refresh --seconds 10 --ttl 2 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from mcp_youtube.operations import transcripts
+
+from .fake_upstream import FakeTranscriptApi, installed, percentile
+
+
+class ChangingApi(FakeTranscriptApi):
+    """Fake upstream whose transcripts gain a line on some fetches."""
+
+    def __init__(self, change_rate: float, **kwargs):
+        super().__init__(**kwargs)
+        self.change_rate = change_rate
+        self.versions: dict[str, int] = {}
+
+    def _fetched(self, video_id, language_code, is_generated) -> FetchedTranscript:
+        fetched = super()._fetched(video_id, language_code, is_generated)
+        with self._lock:
+            if video_id in self.versions and self._rng.random() < self.change_rate:
+                self.versions[video_id] += 1
+            version = self.versions.setdefault(video_id, 0)
+        if version:
+            fetched.snippets.append(
+                FetchedTranscriptSnippet(text=f"[edit {version}]", start=1e6, duration=1.0)
+            )
+        return fetched
+
+
+def _run(args: argparse.Namespace, revalidate: bool) -> dict:
+    api = ChangingApi(args.change_rate, latency=args.latency, segments=args.segments)
+    weights = [1 / (rank + 1) for rank in range(args.videos)]
+    videos = [f"v{i:010d}" for i in range(args.videos)]
+    latencies: list[float] = []
+    lock = threading.Lock()
+    stop = time.monotonic() + args.seconds
+
+    def client(seed: int) -> None:
+        rng = random.Random(seed)
+        local = []
+        while time.monotonic() < stop:
+            video_id = rng.choices(videos, weights)[0]
+            started = time.perf_counter()
+            transcripts._fetch(video_id)
+            local.append(time.perf_counter() - started)
+            time.sleep(args.think)
+        with lock:
+            latencies.extend(local)
+
+    with installed(api):
+        transcripts.configure_cache(ttl=args.ttl)
+        transcripts.configure_refresh(
+            budget=args.budget if revalidate else 0, interval=args.interval
+        )
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        transcripts._refresher.wait_idle(args.latency * 10 + 5)
+        cache = transcripts.cache_stats()
+        refresh = transcripts.refresh_stats()
+        upstream_calls = api.calls
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+        "blocked": sum(1 for seconds in latencies if seconds > args.latency / 2),
+        "blocking_misses": cache["misses"],
+        "stale_hits": cache["stale_hits"],
+        "upstream_calls": upstream_calls,
+        "refreshed": refresh["refreshed"],
+        "changed": refresh["changed"],
+        "unchanged": refresh["unchanged"],
+        "coalesced": refresh["coalesced"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--think", type=float, default=0.005, help="pause between requests (s)")
+    parser.add_argument("--videos", type=int, default=50)
+    parser.add_argument("--ttl", type=float, default=2.0, help="cache TTL in seconds")
+    parser.add_argument("--latency", type=float, default=0.2, help="upstream latency (s)")
+    parser.add_argument("--segments", type=int, default=300)
+    parser.add_argument("--budget", type=int, default=20, help="refreshes per interval")
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--change-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    ttl, stale, budget = (
+        transcripts._cache.ttl,
+        transcripts._cache.stale_ttl,
+        transcripts._refresher.budget,
+    )
+    try:
+        results = {"ttl": _run(args, False), "swr": _run(args, True)}
+    finally:
+        transcripts.configure_cache(ttl=ttl)
+        transcripts.configure_refresh(budget=budget, stale_ttl=stale)
+    print(json.dumps({"args": vars(args), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
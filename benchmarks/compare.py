@@ -0,0 +1,72 @@
+"""Compare two ``benchmarks.suite`` result files.
+
+Prints p50/p99 ratios (new / old) per matching row and exits non-zero when
+any row slowed down by more than ``--threshold`` or its error rate rose.
+
+    python -m benchmarks.compare before.json after.json --threshold 1.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+KEY = ("scenario", "layer", "operation", "minutes")
+
+
+def _load(path: str) -> tuple[dict[str, Any], dict[tuple, dict[str, Any]]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("meta", {}), {tuple(row[k] for k in KEY): row for row in data["results"]}
+
+
+def _ratio(new: float, old: float) -> float:
+    return new / old if old else (1.0 if not new else float("inf"))
+
+
+def compare(old: dict[tuple, dict], new: dict[tuple, dict], threshold: float) -> list[dict]:
+    """One entry per row present in both runs, flagged when it regressed."""
+    rows = []
+    for key in sorted(old.keys() & new.keys(), key=lambda k: tuple(map(str, k))):
+        a, b = old[key], new[key]
+        p50 = _ratio(b["p50_ms"], a["p50_ms"])
+        p99 = _ratio(b["p99_ms"], a["p99_ms"])
+        rows.append(
+            {
+                **dict(zip(KEY, key)),
+                "p50_ratio": round(p50, 3),
+                "p99_ratio": round(p99, 3),
+                "error_rate": [a["error_rate"], b["error_rate"]],
+                "regressed": p50 > threshold or b["error_rate"] > a["error_rate"] + 0.01,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=1.25, help="max p50 ratio")
+    parser.add_argument("--all", action="store_true", help="print unchanged rows too")
+    args = parser.parse_args()
+
+    old_meta, old = _load(args.old)
+    new_meta, new = _load(args.new)
+    rows = compare(old, new, args.threshold)
+    print(f"{old_meta.get('commit')} -> {new_meta.get('commit')}: {len(rows)} rows")
+    for row in rows:
+        if args.all or row["regressed"]:
+            flag = "REGRESSED" if row["regressed"] else ""
+            print(
+                f"{row['scenario']:6} {row['layer']:10} {row['operation']:32} "
+                f"{str(row['minutes']):>6}  p50 x{row['p50_ratio']:<7} "
+                f"p99 x{row['p99_ratio']:<7} {flag}"
+            )
+    sys.exit(1 if any(row["regressed"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
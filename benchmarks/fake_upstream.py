@@ -0,0 +1,246 @@
+"""Deterministic fake YouTube transcript backend for benchmarks.
+
+``FakeTranscriptApi`` quacks like ``YouTubeTranscriptApi`` (``fetch`` / ``list``)
+and generates transcripts from the video id, with configurable latency,
+transcript length and injected failures. Listings hold ``FakeTrack`` objects
+that fetch and translate like the library's ``Transcript``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import random
+import threading
+import time
+import zlib
+from typing import Iterator, Mapping, Optional, Sequence, Union
+
+import requests
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    NoTranscriptFound,
+    VideoUnavailable,
+    YouTubeRequestFailed,
+)
+
+from mcp_youtube.operations import transcripts
+
+# Average on-screen time of an auto-generated caption line
+SECONDS_PER_LINE = 3.0
+
+# (language code, is_generated, is_translatable) of every fake video's tracks
+TRACKS = (("en", False, True), ("de", True, False), ("es-MX", False, False))
+TRANSLATIONS = ("fr", "ja", "pt", "ko")
+
+WORDS = (
+    "the quick brown fox jumps over a lazy dog while we talk about python "
+    "performance caching latency transcripts video search index memory"
+).split()
+
+
+def make_snippets(video_id: str, segments: int) -> list[FetchedTranscriptSnippet]:
+    rng = random.Random(video_id)
+    snippets = []
+    start = 0.0
+    for _ in range(segments):
+        duration = round(rng.uniform(1.5, 4.5), 2)
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 10)))
+        snippets.append(FetchedTranscriptSnippet(text=text, start=start, duration=duration))
+        start = round(start + duration, 2)
+    return snippets
+
+
+def make_auto_snippets(video_id: str, segments: int) -> list[FetchedTranscriptSnippet]:
+    """Lines shaped like an auto-generated track.
+
+    Each fragment repeats the tail of the previous one and overlaps it in
+    time, about one in forty is a ``[Music]``-style tag, and sentence-ending
+    punctuation is rare.
+    """
+    rng = random.Random(video_id)
+    snippets = []
+    start = 0.0
+    tail: list[str] = []
+    for _ in range(segments):
+        duration = round(rng.uniform(2.0, 4.0), 2)
+        if rng.random() < 0.025:
+            text, tail = rng.choice(("[Music]", "[Applause]", "[Laughter]")), []
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(2, 5))]
+            if rng.random() < 0.1:
+                words[-1] += "."
+            text = " ".join(tail + words)
+            tail = words[-rng.randint(1, 3) :]
+        snippets.append(FetchedTranscriptSnippet(text=text, start=start, duration=duration))
+        # The next fragment appears before this one leaves the screen.
+        start = round(start + duration * 0.6, 2)
+    return snippets
+
+
+def segments_for(minutes: float) -> int:
+    """Caption line count of a video ``minutes`` long."""
+    return max(1, round(minutes * 60 / SECONDS_PER_LINE))
+
+
+@functools.lru_cache(maxsize=32)
+def _template(segments: int) -> tuple[FetchedTranscriptSnippet, ...]:
+    # Shared by every video of this length, so generating a 12 hour transcript
+    # is paid once rather than inside each measured fetch.
+    return tuple(make_snippets(f"template-{segments}", segments))
+
+
+class FakeTrack:
+    """Stand-in for ``youtube_transcript_api.Transcript``."""
+
+    def __init__(
+        self,
+        api: FakeTranscriptApi,
+        video_id: str,
+        language_code: str,
+        is_generated: bool = False,
+        is_translatable: bool = False,
+    ):
+        self.api = api
+        self.video_id = video_id
+        self.language = language_code
+        self.language_code = language_code
+        self.is_generated = is_generated
+        self.is_translatable = is_translatable
+        self.translation_languages = [
+            _Language(code) for code in (TRANSLATIONS if is_translatable else ())
+        ]
+
+    def fetch(self, preserve_formatting: bool = False) -> FetchedTranscript:
+        self.api._call(self.video_id)
+        return self.api._fetched(self.video_id, self.language_code, self.is_generated)
+
+    def translate(self, language_code: str) -> FakeTrack:
+        return FakeTrack(self.api, self.video_id, language_code, is_generated=True)
+
+
+class _Language:
+    def __init__(self, language_code: str):
+        self.language_code = language_code
+        self.language = language_code
+
+
+class FakeTranscriptList(list):
+    def __init__(self, video_id: str, tracks: Sequence[FakeTrack]):
+        super().__init__(tracks)
+        self.video_id = video_id
+
+
+class FakeTranscriptApi:
+    """Stand-in for ``YouTubeTranscriptApi`` with fixed per-call latency.
+
+    Transcripts are ``segments`` lines long, or ``minutes`` long (one value, or
+    a per-video mapping falling back to ``segments``). A ``transient_rate``
+    fraction of calls fails with a retryable 503, and an ``unavailable_rate``
+    fraction of videos is permanently unavailable; both are seeded, so runs
+    are repeatable.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        segments: int = 300,
+        minutes: Optional[Union[float, Mapping[str, float]]] = None,
+        transient_rate: float = 0.0,
+        unavailable_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.segments = segments
+        self.minutes = minutes
+        self.transient_rate = transient_rate
+        self.unavailable_rate = unavailable_rate
+        self.seed = seed
+        self.calls = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _segments(self, video_id: str) -> int:
+        minutes = self.minutes
+        if isinstance(minutes, Mapping):
+            minutes = minutes.get(video_id)
+        return segments_for(minutes) if minutes is not None else self.segments
+
+    def _unavailable(self, video_id: str) -> bool:
+        digest = zlib.crc32(f"{self.seed}:{video_id}".encode()) / 2**32
+        return digest < self.unavailable_rate
+
+    def _call(self, video_id: str) -> None:
+        with self._lock:
+            self.calls += 1
+            failed = self._rng.random() < self.transient_rate
+            if failed:
+                self.errors += 1
+        time.sleep(self.latency)
+        if failed:
+            raise YouTubeRequestFailed(
+                video_id, requests.HTTPError("503 Server Error: Service Unavailable")
+            )
+        if self._unavailable(video_id):
+            raise VideoUnavailable(video_id)
+
+    def _fetched(
+        self, video_id: str, language_code: str, is_generated: bool
+    ) -> FetchedTranscript:
+        return FetchedTranscript(
+            snippets=list(_template(self._segments(video_id))),
+            video_id=video_id,
+            language=language_code,
+            language_code=language_code,
+            is_generated=is_generated,
+        )
+
+    def _listing(self, video_id: str) -> FakeTranscriptList:
+        return FakeTranscriptList(
+            video_id,
+            [FakeTrack(self, video_id, code, gen, tr) for code, gen, tr in TRACKS],
+        )
+
+    def fetch(self, video_id, languages=("en",), preserve_formatting=False):
+        # Like the library: list and fetch the first exact match in one call.
+        self._call(video_id)
+        listing = self._listing(video_id)
+        for code in languages:
+            for track in listing:
+                if track.language_code == code:
+                    return self._fetched(video_id, code, track.is_generated)
+        raise NoTranscriptFound(video_id, list(languages), listing)
+
+    def list(self, video_id):
+        self._call(video_id)
+        return self._listing(video_id)
+
+
+@contextlib.contextmanager
+def installed(api: FakeTranscriptApi) -> Iterator[FakeTranscriptApi]:
+    """Swap the operations module's upstream client for ``api``.
+
+    The upstream rate limit is lifted meanwhile so it does not dominate the
+    measurements; retries still apply.
+    """
+    original = transcripts._api
+    rate = transcripts._limiter.max_rate
+    transcripts._api = api
+    transcripts.configure_rate_limit(rate=0)
+    transcripts.clear_cache()
+    try:
+        yield api
+    finally:
+        transcripts._api = original
+        transcripts.configure_rate_limit(rate=rate)
+        transcripts.clear_cache()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,419 @@
+"""Offline benchmark suite over every operation and both tool layers.
+
+Runs against ``FakeTranscriptApi`` (no network) and writes one JSON document
+with a row per (scenario, layer, operation, transcript length):
+
+- ``cold``: each call is a new video, so it pays fake upstream latency;
+- ``warm``: the same video repeatedly, after one priming call;
+- ``mixed``: a seeded random mix of operations over a pool of videos of
+  mixed lengths, issued concurrently, with injected upstream failures.
+
+Layers are ``operations`` (sync functions), ``async`` (transcripts_async),
+``mcp`` (in-memory fastmcp client against mcp_youtube.server) and
+``langchain`` (``tool.invoke``). Compare two result files with
+``benchmarks.compare``.
+
+    python -m benchmarks.suite -o results.json
+    python -m benchmarks.suite --quick --layers operations,mcp
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from fastmcp import Client
+
+from mcp_youtube import langchain_tools, server
+from mcp_youtube.operations import transcripts, transcripts_async
+
+from .fake_upstream import FakeTranscriptApi, installed, percentile, segments_for
+
+LENGTHS = (1, 10, 60, 180, 720)  # minutes: 1 minute to 12 hours
+LAYERS = ("operations", "async", "mcp", "langchain")
+
+# Arguments for each operation / tool, given a video id. Batch operations use
+# sibling ids so they fetch several videos.
+WINDOWS = [(0, 60), (120, 180), (600, 660)]
+
+
+def _siblings(video_id: str, n: int = 4) -> list[str]:
+    return [f"{video_id}-{i}" for i in range(n)]
+
+
+OPERATIONS: dict[str, tuple[Callable[[str], tuple], dict[str, Any]]] = {
+    # name: (positional args from video id, keyword args)
+    "get_transcript": (lambda v: (v,), {}),
+    "get_transcript_with_timestamps": (lambda v: (v,), {}),
+    "get_transcript_page": (lambda v: (v,), {"max_tokens": 2000}),
+    "list_available_transcripts": (lambda v: (v,), {}),
+    "get_transcript_segment": (lambda v: (v, 30, 90), {}),
+    "get_transcript_segments": (lambda v: (v, WINDOWS), {}),
+    "search_transcript": (lambda v: (v, "python performance"), {}),
+    "get_transcripts_batch": (lambda v: (_siblings(v),), {}),
+    "search_transcripts_batch": (lambda v: (_siblings(v), "latency"), {}),
+    "get_transcripts_multilang": (lambda v: (v, ["en", "de", "fr"]), {}),
+    "search_corpus": (lambda v: ("quick brown fox",), {}),
+}
+SYNC_ONLY = {"ingest_videos": (lambda v: ([v],), {})}
+
+# Tool arguments per operation; the tool is named like the operation unless
+# listed in TOOL_NAMES (paging goes through get_transcript's budget).
+TOOL_ARGS: dict[str, Callable[[str], dict[str, Any]]] = {
+    "get_transcript": lambda v: {"video_url": v},
+    "get_transcript_page": lambda v: {"video_url": v, "max_tokens": 2000},
+    "get_transcript_with_timestamps": lambda v: {"video_url": v},
+    "list_available_transcripts": lambda v: {"video_url": v},
+    "get_transcript_segment": lambda v: {"video_url": v, "start_time": 30, "end_time": 90},
+    "get_transcript_segments": lambda v: {"video_url": v, "ranges": WINDOWS},
+    "search_transcript": lambda v: {"video_url": v, "search_term": "python performance"},
+    "get_transcripts_batch": lambda v: {"video_urls": _siblings(v)},
+    "search_transcripts_batch": lambda v: {"video_urls": _siblings(v), "search_term": "latency"},
+    "get_transcripts_multilang": lambda v: {"video_url": v, "languages": ["en", "de", "fr"]},
+    "search_corpus": lambda v: {"query": "quick brown fox"},
+}
+TOOL_NAMES = {"get_transcript_page": "get_transcript"}
+
+Call = Callable[[str], Any]
+AsyncCall = Callable[[str], Awaitable[Any]]
+
+
+class ToolError(Exception):
+    """A tool returned its structured ``{"error": ...}`` response."""
+
+
+def _check_tool(text: str) -> str:
+    if text.startswith("{") and text[:40].lstrip("{ \n").startswith('"error"'):
+        raise ToolError(json.loads(text)["error"]["code"])
+    return text
+
+
+def _sync_calls() -> dict[str, Call]:
+    calls = {}
+    for name, (args, kwargs) in {**OPERATIONS, **SYNC_ONLY}.items():
+        fn = getattr(transcripts, name)
+        calls[name] = lambda v, fn=fn, args=args, kwargs=kwargs: fn(*args(v), **kwargs)
+    return calls
+
+
+def _async_calls() -> dict[str, AsyncCall]:
+    calls = {}
+    for name, (args, kwargs) in OPERATIONS.items():
+        fn = getattr(transcripts_async, name)
+        calls[name] = lambda v, fn=fn, args=args, kwargs=kwargs: fn(*args(v), **kwargs)
+    return calls
+
+
+def _langchain_calls() -> dict[str, Call]:
+    tools = {t.name: t for t in langchain_tools.TOOLS}
+    return {
+        name: lambda v, tool=tools[f"yt_{TOOL_NAMES.get(name, name)}"], args=args: _check_tool(
+            tool.invoke(args(v))
+        )
+        for name, args in TOOL_ARGS.items()
+    }
+
+
+def _mcp_calls(client: Client) -> dict[str, AsyncCall]:
+    async def call(name: str, args: dict[str, Any]) -> str:
+        result = await client.call_tool(name, args, raise_on_error=False)
+        return _check_tool(result.content[0].text)
+
+    return {
+        name: lambda v, tool=TOOL_NAMES.get(name, name), args=args: call(tool, args(v))
+        for name, args in TOOL_ARGS.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+class Samples:
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.errors: dict[str, int] = {}
+
+    def record(self, started: float, error: Optional[BaseException] = None) -> None:
+        self.latencies.append(time.perf_counter() - started)
+        if error is not None:
+            code = str(error) if isinstance(error, ToolError) else type(error).__name__
+            self.errors[code] = self.errors.get(code, 0) + 1
+
+    def run(self, call: Call, video_id: str) -> None:
+        started = time.perf_counter()
+        try:
+            call(video_id)
+        except Exception as e:
+            self.record(started, e)
+        else:
+            self.record(started)
+
+    async def run_async(self, call: AsyncCall, video_id: str) -> None:
+        started = time.perf_counter()
+        try:
+            await call(video_id)
+        except Exception as e:
+            self.record(started, e)
+        else:
+            self.record(started)
+
+    def summary(self, wall: float) -> dict[str, Any]:
+        calls = len(self.latencies)
+        errors = sum(self.errors.values())
+        ms = [x * 1000 for x in self.latencies]
+        return {
+            "calls": calls,
+            "errors": errors,
+            "error_rate": round(errors / calls, 4) if calls else 0.0,
+            "error_codes": dict(sorted(self.errors.items())),
+            "mean_ms": round(sum(ms) / calls, 3) if calls else 0.0,
+            "p50_ms": round(percentile(ms, 50), 3),
+            "p99_ms": round(percentile(ms, 99), 3),
+            "max_ms": round(max(ms), 3) if ms else 0.0,
+            "ops_per_s": round(calls / wall, 1) if wall else 0.0,
+        }
+
+
+class Suite:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rows: list[dict[str, Any]] = []
+        self._videos = 0
+
+    def video(self, minutes: float) -> str:
+        self._videos += 1
+        return f"m{minutes:g}-v{self._videos:06d}"
+
+    def add(self, scenario: str, layer: str, operation: str, minutes: Any, **stats: Any) -> None:
+        row = {"scenario": scenario, "layer": layer, "operation": operation, "minutes": minutes}
+        self.rows.append({**row, **stats})
+        print(
+            f"{scenario:6} {layer:10} {operation:32} {str(minutes):>6} "
+            f"p50 {stats['p50_ms']:9.3f} ms  p99 {stats['p99_ms']:9.3f} ms  "
+            f"err {stats['error_rate']:.2%}",
+            file=sys.stderr,
+        )
+
+    @contextlib.contextmanager
+    def upstream(self, **kwargs: Any) -> Iterator[FakeTranscriptApi]:
+        api = FakeTranscriptApi(latency=self.args.latency, seed=self.args.seed, **kwargs)
+        with installed(api):
+            yield api
+
+    # -- cold and warm, per transcript length --------------------------------
+
+    def single(self, layer: str, minutes: float) -> None:
+        cold, warm = self.args.calls, self.args.repeat
+        if layer in ("operations", "langchain"):
+            calls = _sync_calls() if layer == "operations" else _langchain_calls()
+            for name, call in calls.items():
+                self._single_sync(layer, name, call, minutes, cold, warm)
+        else:
+            asyncio.run(self._single_async(layer, minutes, cold, warm))
+
+    def _single_sync(
+        self, layer: str, name: str, call: Call, minutes: float, cold: int, warm: int
+    ) -> None:
+        with self.upstream(minutes=minutes) as api:
+            samples, started = Samples(), time.perf_counter()
+            for _ in range(cold):
+                samples.run(call, self.video(minutes))
+            wall = time.perf_counter() - started
+            self.add("cold", layer, name, minutes, upstream_calls=api.calls, **samples.summary(wall))
+            video_id = self.video(minutes)
+            call(video_id)
+            samples, started = Samples(), time.perf_counter()
+            for _ in range(warm):
+                samples.run(call, video_id)
+            self.add("warm", layer, name, minutes, **samples.summary(time.perf_counter() - started))
+
+    async def _single_async(self, layer: str, minutes: float, cold: int, warm: int) -> None:
+        async with self._async_calls(layer) as calls:
+            for name, call in calls.items():
+                with self.upstream(minutes=minutes) as api:
+                    samples, started = Samples(), time.perf_counter()
+                    for _ in range(cold):
+                        await samples.run_async(call, self.video(minutes))
+                    wall = time.perf_counter() - started
+                    self.add(
+                        "cold", layer, name, minutes, upstream_calls=api.calls, **samples.summary(wall)
+                    )
+                    video_id = self.video(minutes)
+                    await call(video_id)
+                    samples, started = Samples(), time.perf_counter()
+                    for _ in range(warm):
+                        await samples.run_async(call, video_id)
+                    wall = time.perf_counter() - started
+                    self.add("warm", layer, name, minutes, **samples.summary(wall))
+
+    @contextlib.asynccontextmanager
+    async def _async_calls(self, layer: str):
+        if layer == "mcp":
+            async with Client(server.mcp) as client:
+                yield _mcp_calls(client)
+        else:
+            yield _async_calls()
+
+    # -- concurrent mixed workload --------------------------------------------
+
+    def _plan(self, names: list[str]) -> tuple[list[tuple[str, str]], dict[str, float]]:
+        rng = random.Random(self.args.seed)
+        lengths = {f"mix-{i:04d}": rng.choice(self.args.lengths) for i in range(self.args.videos)}
+        videos = list(lengths)
+        # Skewed toward a few popular videos, like real agent traffic
+        weights = [1 / (i + 1) for i in range(len(videos))]
+        plan = [
+            (rng.choice(names), rng.choices(videos, weights)[0])
+            for _ in range(self.args.mixed_calls)
+        ]
+        for sibling in (s for v in videos for s in _siblings(v)):
+            lengths[sibling] = lengths[sibling.rsplit("-", 1)[0]]
+        return plan, lengths
+
+    def mixed(self, layer: str) -> None:
+        sync = layer in ("operations", "langchain")
+        names = list(OPERATIONS)
+        plan, lengths = self._plan(names)
+        per_op = {name: Samples() for name in names}
+        with self.upstream(
+            minutes=lengths,
+            transient_rate=self.args.error_rate,
+            unavailable_rate=self.args.unavailable_rate,
+        ) as api:
+            started = time.perf_counter()
+            if sync:
+                calls = _sync_calls() if layer == "operations" else _langchain_calls()
+                with ThreadPoolExecutor(max_workers=self.args.concurrency) as pool:
+                    list(pool.map(lambda item: per_op[item[0]].run(calls[item[0]], item[1]), plan))
+            else:
+                asyncio.run(self._mixed_async(layer, plan, per_op))
+            wall = time.perf_counter() - started
+        total = Samples()
+        for name, samples in per_op.items():
+            if samples.latencies:
+                self.add("mixed", layer, name, "mixed", **samples.summary(wall))
+            total.latencies += samples.latencies
+            for code, n in samples.errors.items():
+                total.errors[code] = total.errors.get(code, 0) + n
+        self.add(
+            "mixed",
+            layer,
+            "all",
+            "mixed",
+            upstream_calls=api.calls,
+            upstream_errors=api.errors,
+            **total.summary(wall),
+        )
+
+    async def _mixed_async(
+        self, layer: str, plan: list[tuple[str, str]], per_op: dict[str, Samples]
+    ) -> None:
+        gate = asyncio.Semaphore(self.args.concurrency)
+
+        async def one(name: str, video_id: str, calls: dict[str, AsyncCall]) -> None:
+            async with gate:
+                await per_op[name].run_async(calls[name], video_id)
+
+        async with self._async_calls(layer) as calls:
+            await asyncio.gather(*(one(name, v, calls) for name, v in plan))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _lengths(value: str) -> list[float]:
+    return [float(x) for x in value.split(",") if x.strip()]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="-", help="JSON results file (default: stdout)")
+    parser.add_argument("--layers", default=",".join(LAYERS), help="comma-separated subset")
+    parser.add_argument(
+        "--lengths", type=_lengths, default=list(LENGTHS), help="transcript lengths in minutes"
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="fake upstream seconds")
+    parser.add_argument("--calls", type=int, default=3, help="cold calls per operation")
+    parser.add_argument("--repeat", type=int, default=20, help="warm calls per operation")
+    parser.add_argument("--videos", type=int, default=40, help="videos in the mixed pool")
+    parser.add_argument("--mixed-calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--error-rate", type=float, default=0.05, help="transient upstream failure rate (mixed)"
+    )
+    parser.add_argument(
+        "--unavailable-rate", type=float, default=0.05, help="fraction of unavailable videos (mixed)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="short lengths, few calls")
+    args = parser.parse_args(argv)
+    if args.quick:
+        if args.lengths == list(LENGTHS):
+            args.lengths = [1, 60]
+        args.calls, args.repeat, args.videos, args.mixed_calls = 2, 5, 10, 80
+    layers = [layer for layer in args.layers.split(",") if layer]
+    unknown = set(layers) - set(LAYERS)
+    if unknown:
+        parser.error(f"unknown layers: {', '.join(sorted(unknown))}")
+
+    suite = Suite(args)
+    original_corpus = transcripts._corpus
+    delays = transcripts._limiter.base_delay, transcripts._limiter.max_delay
+    # Retries still happen, but with short backoff so they do not dominate.
+    transcripts.configure_rate_limit(base_delay=0.005, max_delay=0.05)
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for layer in layers:
+                # A fresh corpus per layer keeps search_corpus rows comparable
+                # when only some layers are run.
+                transcripts.configure_corpus(f"{tmp}/{layer}.db")
+                for minutes in args.lengths:
+                    suite.single(layer, minutes)
+                suite.mixed(layer)
+        finally:
+            transcripts.configure_corpus(None)
+            transcripts._corpus = original_corpus
+            transcripts.configure_rate_limit(base_delay=delays[0], max_delay=delays[1])
+
+    result = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "elapsed_s": round(time.perf_counter() - started, 1),
+            "segments": {f"{m:g}": segments_for(m) for m in args.lengths},
+            "args": {k: v for k, v in vars(args).items() if k != "output"},
+        },
+        "results": suite.rows,
+    }
+    text = json.dumps(result, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
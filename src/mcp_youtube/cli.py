@@ -0,0 +1,420 @@
+"""mcp-youtube command line entry point.
+
+    mcp-youtube                      run the MCP stdio server
+    mcp-youtube serve                same as above
+    mcp-youtube serve --http         serve streamable HTTP with N worker processes
+    mcp-youtube cache stats          show persistent store statistics
+    mcp-youtube cache prune          evict least recently used transcripts
+    mcp-youtube cache export         dump stored transcripts as JSONL
+    mcp-youtube prefetch FILE        warm the store for a list of videos
+    mcp-youtube chunk FILE           stream embedding-ready chunks of many videos as JSONL
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import IO, Any, Iterable, Iterator, Optional, Sequence
+
+from .operations.config import env_int, env_str
+
+DEFAULT_STORE_PATH = "~/.cache/mcp-youtube/transcripts.db"
+
+
+def _open_store(args: argparse.Namespace):
+    from .operations.store import TranscriptStore
+
+    return TranscriptStore(
+        args.db,
+        max_bytes=env_int("MCP_YOUTUBE_STORE_MAX_BYTES", 512 * 1024 * 1024),
+    )
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    if getattr(args, "http", False):
+        from . import serving
+
+        serving.serve(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            request_timeout=args.timeout,
+            max_concurrency=args.max_concurrency,
+            max_queue=args.max_queue,
+            backlog=args.backlog,
+            shutdown_timeout=args.shutdown_timeout,
+        )
+        return 0
+
+    from . import server
+
+    server.main()
+    return 0
+
+
+def _cmd_cache_stats(args: argparse.Namespace) -> int:
+    print(json.dumps(_open_store(args).stats(), indent=2))
+    return 0
+
+
+def _cmd_cache_prune(args: argparse.Namespace) -> int:
+    store = _open_store(args)
+    removed = store.prune(args.max_bytes)
+    print(json.dumps({"removed": removed, **store.stats()}, indent=2))
+    return 0
+
+
+def _cmd_cache_export(args: argparse.Namespace) -> int:
+    store = _open_store(args)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record in store.export():
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def _read_video_ids(lines: Iterable[str]) -> Iterator[str]:
+    """Video ids from URL/id lines; blank lines and ``#`` comments are skipped."""
+    from .operations.transcripts import extract_video_id
+
+    seen: set[str] = set()
+    for line in lines:
+        for token in line.split("#", 1)[0].split():
+            video_id = extract_video_id(token)
+            if video_id not in seen:
+                seen.add(video_id)
+                yield video_id
+
+
+def _read_journal(path: str) -> set[str]:
+    """Ids recorded as done by a previous run (failures are retried)."""
+    done: set[str] = set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted run
+                if record.get("ok"):
+                    done.add(record["video_id"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+class _Progress:
+    """Single-line progress on stderr; silent when stderr is not a terminal."""
+
+    def __init__(self, total: int, stream: IO[str], enabled: bool):
+        self.total = total
+        self.stream = stream
+        self.enabled = enabled and stream.isatty()
+        self.started = time.perf_counter()
+
+    def update(self, done: int, failures: int) -> None:
+        if not self.enabled:
+            return
+        rate = done / max(time.perf_counter() - self.started, 1e-9)
+        self.stream.write(
+            f"\r[{done}/{self.total}] {rate:.1f} videos/s, {failures} failed"
+        )
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.enabled:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+def _cmd_prefetch(args: argparse.Namespace) -> int:
+    from .operations import transcripts
+
+    if args.db:
+        transcripts.configure_store(args.db)
+    if args.input == "-":
+        video_ids = list(_read_video_ids(sys.stdin))
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            video_ids = list(_read_video_ids(f))
+    done = _read_journal(args.resume) if args.resume else set()
+    pending = [v for v in video_ids if v not in done]
+
+    summary: dict[str, Any] = {
+        "videos": len(video_ids),
+        "skipped": len(video_ids) - len(pending),
+        "fetched": 0,
+        "failed": 0,
+        "bytes": 0,
+    }
+    failures: list[dict[str, Any]] = []
+    progress = _Progress(len(pending), sys.stderr, not args.quiet)
+    journal = open(args.resume, "a", encoding="utf-8") if args.resume else None
+    started = time.perf_counter()
+    try:
+        results = transcripts.iter_prefetch(
+            pending, args.language.split(","), args.concurrency
+        )
+        for count, item in enumerate(results, 1):
+            if item["ok"]:
+                summary["fetched"] += 1
+                summary["bytes"] += item["bytes"]
+            else:
+                summary["failed"] += 1
+                failures.append(
+                    {k: item[k] for k in ("video_id", "error_code", "error")}
+                )
+            if journal is not None:
+                journal.write(json.dumps(item) + "\n")
+                journal.flush()
+            progress.update(count, summary["failed"])
+    finally:
+        progress.close()
+        if journal is not None:
+            journal.close()
+    elapsed = time.perf_counter() - started
+    summary["elapsed_s"] = round(elapsed, 3)
+    summary["videos_per_s"] = round(summary["fetched"] / elapsed, 2) if elapsed else 0.0
+    summary["failures"] = failures
+    print(json.dumps(summary, indent=2))
+    return 1 if failures else 0
+
+
+def _parse_metadata(pairs: Sequence[str]) -> dict[str, str]:
+    metadata = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise SystemExit(f"--meta expects KEY=VALUE, got {pair!r}")
+        metadata[key] = value
+    return metadata
+
+
+def _cmd_chunk(args: argparse.Namespace) -> int:
+    from .operations import transcripts
+
+    if args.db:
+        transcripts.configure_store(args.db)
+    metadata = _parse_metadata(args.meta)
+    lines = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    done = _read_journal(args.resume) if args.resume else set()
+    # Resumed runs append, so chunks of finished videos are not written twice.
+    mode = "a" if args.resume else "w"
+    out = sys.stdout if args.output == "-" else open(args.output, mode, encoding="utf-8")
+    journal = open(args.resume, "a", encoding="utf-8") if args.resume else None
+
+    summary: dict[str, Any] = {"videos": 0, "skipped": 0, "chunked": 0, "failed": 0, "chunks": 0}
+    failures: list[dict[str, Any]] = []
+    started = time.perf_counter()
+
+    def pending() -> Iterator[str]:
+        # Read lazily so a huge input list is never held in memory.
+        for video_id in _read_video_ids(lines):
+            summary["videos"] += 1
+            if video_id in done:
+                summary["skipped"] += 1
+            else:
+                yield video_id
+
+    try:
+        results = transcripts.iter_chunks_batch(
+            pending(),
+            args.size,
+            args.unit,
+            args.overlap,
+            args.language.split(","),
+            args.concurrency,
+            metadata,
+        )
+        for item in results:
+            if item["ok"]:
+                # One write per video: a video's chunks are bounded by one transcript.
+                rows = [json.dumps(chunk, ensure_ascii=False) for chunk in item.pop("chunks")]
+                count = len(rows)
+                if rows:
+                    out.write("\n".join(rows) + "\n")
+                    out.flush()
+                item["chunks"] = count
+                summary["chunked"] += 1
+                summary["chunks"] += count
+            else:
+                summary["failed"] += 1
+                failures.append({k: item[k] for k in ("video_id", "error_code", "error")})
+            if journal is not None:
+                journal.write(json.dumps(item) + "\n")
+                journal.flush()
+            if not args.quiet and sys.stderr.isatty():
+                sys.stderr.write(
+                    f"\r{summary['chunked']} videos, {summary['chunks']} chunks, "
+                    f"{summary['failed']} failed"
+                )
+                sys.stderr.flush()
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+        if out is not sys.stdout:
+            out.close()
+        if journal is not None:
+            journal.close()
+    if not args.quiet and sys.stderr.isatty():
+        sys.stderr.write("\n")
+    elapsed = time.perf_counter() - started
+    summary["elapsed_s"] = round(elapsed, 3)
+    summary["chunks_per_s"] = round(summary["chunks"] / elapsed, 1) if elapsed else 0.0
+    summary["failures"] = failures
+    # stdout may be the chunk stream, so the summary goes to stderr.
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+    return 1 if failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mcp-youtube",
+        description="YouTube transcript MCP server and tools.",
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    serve = sub.add_parser("serve", help="Run the MCP server (default)")
+    serve.add_argument(
+        "--http", action="store_true", help="Serve streamable HTTP instead of stdio"
+    )
+    serve.add_argument("--host", help="Bind address (default: $MCP_YOUTUBE_HTTP_HOST or 127.0.0.1)")
+    serve.add_argument("--port", type=int, help="Port (default: $MCP_YOUTUBE_HTTP_PORT or 8000)")
+    serve.add_argument(
+        "-w", "--workers", type=int, help="Worker processes (default: $MCP_YOUTUBE_HTTP_WORKERS or 1)"
+    )
+    serve.add_argument(
+        "--timeout",
+        type=float,
+        help="Per-request timeout in seconds, 0 for none (default: $MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT or 60)",
+    )
+    serve.add_argument(
+        "--max-concurrency",
+        type=int,
+        help="Requests run at once per worker (default: $MCP_YOUTUBE_HTTP_MAX_CONCURRENCY or 64)",
+    )
+    serve.add_argument(
+        "--max-queue",
+        type=int,
+        help="Requests waiting per worker before rejecting with 503 "
+        "(default: $MCP_YOUTUBE_HTTP_MAX_QUEUE or 256)",
+    )
+    serve.add_argument(
+        "--backlog", type=int, help="Pending connections queued by the OS (default: 2048)"
+    )
+    serve.add_argument(
+        "--shutdown-timeout",
+        type=float,
+        help="Seconds in-flight requests get to finish on shutdown (default: 30)",
+    )
+    serve.set_defaults(func=_cmd_serve)
+
+    cache = sub.add_parser("cache", help="Inspect or maintain the persistent store")
+    cache.add_argument(
+        "--db",
+        default=env_str("MCP_YOUTUBE_STORE_PATH", DEFAULT_STORE_PATH),
+        help="SQLite store path (default: $MCP_YOUTUBE_STORE_PATH or %(default)s)",
+    )
+    cache_sub = cache.add_subparsers(dest="cache_command", required=True)
+
+    stats = cache_sub.add_parser("stats", help="Show store statistics")
+    stats.set_defaults(func=_cmd_cache_stats)
+
+    prune = cache_sub.add_parser("prune", help="Evict until under a byte budget")
+    prune.add_argument(
+        "--max-bytes",
+        type=int,
+        default=None,
+        help="Byte budget (default: $MCP_YOUTUBE_STORE_MAX_BYTES or 512 MiB)",
+    )
+    prune.set_defaults(func=_cmd_cache_prune)
+
+    export = cache_sub.add_parser("export", help="Write stored transcripts as JSONL")
+    export.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    export.set_defaults(func=_cmd_cache_export)
+
+    prefetch = sub.add_parser(
+        "prefetch", help="Fetch many videos ahead of time to warm the store"
+    )
+    prefetch.add_argument(
+        "input", nargs="?", default="-", help="File of URLs or ids, one per line (default: stdin)"
+    )
+    prefetch.add_argument(
+        "--db",
+        default=env_str("MCP_YOUTUBE_STORE_PATH", DEFAULT_STORE_PATH),
+        help="SQLite store to fill (default: $MCP_YOUTUBE_STORE_PATH or %(default)s)",
+    )
+    prefetch.add_argument("-l", "--language", default="en", help="Language code or comma-separated preference list")
+    prefetch.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=env_int("MCP_YOUTUBE_BATCH_CONCURRENCY", 8),
+        help="Parallel fetches (default: $MCP_YOUTUBE_BATCH_CONCURRENCY or %(default)s)",
+    )
+    prefetch.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="JSONL journal of finished videos; ones already done are skipped",
+    )
+    prefetch.add_argument("-q", "--quiet", action="store_true", help="No progress line")
+    prefetch.set_defaults(func=_cmd_prefetch)
+
+    chunk = sub.add_parser(
+        "chunk", help="Stream time-aligned chunks of many videos to JSONL (for embedding)"
+    )
+    chunk.add_argument(
+        "input", nargs="?", default="-", help="File of URLs or ids, one per line (default: stdin)"
+    )
+    chunk.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    chunk.add_argument("--size", type=float, default=256, help="Max chunk size in --unit (default: 256)")
+    chunk.add_argument(
+        "--unit", choices=("tokens", "chars", "seconds"), default="tokens", help="Unit of --size and --overlap"
+    )
+    chunk.add_argument("--overlap", type=float, default=0, help="Overlap between consecutive chunks")
+    chunk.add_argument("-l", "--language", default="en", help="Language code or comma-separated preference list")
+    chunk.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=env_int("MCP_YOUTUBE_BATCH_CONCURRENCY", 8),
+        help="Parallel fetches (default: $MCP_YOUTUBE_BATCH_CONCURRENCY or %(default)s)",
+    )
+    chunk.add_argument(
+        "--meta",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Extra field added to every chunk (repeatable)",
+    )
+    chunk.add_argument(
+        "--db",
+        default=env_str("MCP_YOUTUBE_STORE_PATH"),
+        help="Optional SQLite store to read and fill (default: $MCP_YOUTUBE_STORE_PATH)",
+    )
+    chunk.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="JSONL journal of finished videos; ones already done are skipped and output is appended",
+    )
+    chunk.add_argument("-q", "--quiet", action="store_true", help="No progress line")
+    chunk.set_defaults(func=_cmd_chunk)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the ``mcp-youtube`` command."""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        return _cmd_serve(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
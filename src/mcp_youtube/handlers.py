@@ -0,0 +1,201 @@
+"""Tool bodies shared by the MCP server and the LangChain tools.
+
+Each handler is written once against an operations module: it calls
+operations.transcripts for the sync tools and operations.transcripts_async
+for the async ones (the two share signatures), then renders the result as
+the tool's string output. Calling a handler runs it synchronously;
+``await handler.acall(...)`` runs it on the event loop. Either way page
+dispatch, argument checks and error responses are the same, and failures
+come back as JSON ``{"error": {"code", "message", "retryable"}}``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+from .operations import formats
+from .operations.lazy import LazyModule
+
+# Imported on first tool call, so registering tools stays cheap
+transcripts = LazyModule("mcp_youtube.operations.transcripts")
+transcripts_async = LazyModule("mcp_youtube.operations.transcripts_async")
+errors = LazyModule("mcp_youtube.operations.errors")
+
+Languages = Union[str, list[str]]
+# ``(operation result, or a coroutine for it; function rendering it as a str)``
+Call = tuple[Any, Callable[[Any], str]]
+
+
+class Handler:
+    """One tool body, runnable sync (``handler(...)``) or async (``handler.acall(...)``)."""
+
+    def __init__(self, message: str, body: Callable[..., Call]):
+        self.message = message
+        self.body = body
+        self.__name__ = body.__name__
+        self.__doc__ = body.__doc__
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        try:
+            result, render = self.body(transcripts, *args, **kwargs)
+            return render(result)
+        except Exception as e:
+            return errors.error_response(self.message, e)
+
+    async def acall(self, *args: Any, **kwargs: Any) -> str:
+        try:
+            result, render = self.body(transcripts_async, *args, **kwargs)
+            return render(await result)
+        except Exception as e:
+            return errors.error_response(self.message, e)
+
+
+def handler(message: str) -> Callable[[Callable[..., Call]], Handler]:
+    """Make ``body(ops, ...)`` a ``Handler`` whose failures report ``message``."""
+
+    def decorate(body: Callable[..., Call]) -> Handler:
+        return Handler(message, body)
+
+    return decorate
+
+
+def _indented(result: Any) -> str:
+    return json.dumps(result, indent=2)
+
+
+def _text(result: str) -> str:
+    return result
+
+
+def _or_no_matches(term: Any, render: Callable[[Any], str]) -> Callable[[Any], str]:
+    return lambda hits: render(hits) if hits else f"No matches found for '{term}'"
+
+
+def _paged(
+    max_chars: Optional[int], max_tokens: Optional[int], cursor: Optional[str]
+) -> bool:
+    return bool(max_chars or max_tokens or cursor)
+
+
+@handler("Error fetching transcript")
+def get_transcript(
+    ops,
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    normalize: str = "none",
+) -> Call:
+    """Plain text, or with a budget or cursor one JSON page of it."""
+    if _paged(max_chars, max_tokens, cursor):
+        page = ops.get_transcript_page(
+            video_url, language, max_chars, max_tokens, cursor, False, translate, normalize
+        )
+        return page, _indented
+    return ops.get_transcript(video_url, language, translate, normalize), _text
+
+
+@handler("Error fetching transcript")
+def get_transcript_with_timestamps(
+    ops,
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    format: str = "json",
+    normalize: str = "none",
+) -> Call:
+    """Timestamped lines as ``format``, or with a budget or cursor one JSON page."""
+    if _paged(max_chars, max_tokens, cursor):
+        if format != "json":
+            raise ValueError(f"pages are JSON only, got format={format!r}")
+        page = ops.get_transcript_page(
+            video_url, language, max_chars, max_tokens, cursor, True, translate, normalize
+        )
+        return page, _indented
+    result = ops.get_transcript_with_timestamps(video_url, language, translate, format, normalize)
+    return result, _text
+
+
+@handler("Error listing transcripts")
+def list_available_transcripts(ops, video_url: str, compact: bool = False) -> Call:
+    return ops.list_available_transcripts(video_url), lambda r: formats.dumps(r, compact)
+
+
+@handler("Error fetching transcript segment")
+def get_transcript_segment(
+    ops,
+    video_url: str,
+    start_time: int,
+    end_time: int,
+    language: Languages = "en",
+    mode: str = "start",
+) -> Call:
+    result = ops.get_transcript_segment(video_url, start_time, end_time, language, mode)
+    return result, _text
+
+
+@handler("Error fetching transcript segments")
+def get_transcript_segments(
+    ops,
+    video_url: str,
+    ranges: list[tuple[float, float]],
+    language: Languages = "en",
+    mode: str = "start",
+) -> Call:
+    return ops.get_transcript_segments(video_url, ranges, language, mode), _indented
+
+
+@handler("Error searching transcript")
+def search_transcript(
+    ops,
+    video_url: str,
+    search_term: Languages,
+    language: Languages = "en",
+    context: float = 0,
+    compact: bool = False,
+    normalize: str = "none",
+) -> Call:
+    matches = ops.search_transcript(video_url, search_term, language, context, normalize)
+    return matches, _or_no_matches(search_term, lambda m: formats.dumps(m, compact))
+
+
+@handler("Error fetching transcripts")
+def get_transcripts_batch(
+    ops,
+    video_urls: list[str],
+    language: Languages = "en",
+    max_concurrency: Optional[int] = None,
+) -> Call:
+    return ops.get_transcripts_batch(video_urls, language, max_concurrency), _indented
+
+
+@handler("Error searching transcripts")
+def search_transcripts_batch(
+    ops,
+    video_urls: list[str],
+    search_term: Languages,
+    language: Languages = "en",
+    max_concurrency: Optional[int] = None,
+) -> Call:
+    result = ops.search_transcripts_batch(video_urls, search_term, language, max_concurrency)
+    return result, _indented
+
+
+@handler("Error fetching transcripts")
+def get_transcripts_multilang(
+    ops, video_url: str, languages: list[str], max_concurrency: Optional[int] = None
+) -> Call:
+    return ops.get_transcripts_multilang(video_url, languages, max_concurrency), _indented
+
+
+@handler("Error searching corpus")
+def search_corpus(
+    ops, query: str, top_k: int = 10, video_filter: Optional[list[str]] = None
+) -> Call:
+    return ops.search_corpus(query, top_k, video_filter), _or_no_matches(query, _indented)
@@ -5,17 +5,71 @@ Usage:
 
     # Or import individual tools:
     from mcp_youtube.langchain_tools import yt_get_transcript, yt_search_transcript
+
+Tool bodies live in ``handlers``, shared with the MCP server. Every tool has
+a native coroutine, so ``ainvoke`` / ``abatch`` run on the event loop through
+operations.transcripts_async (bounded upstream pool, coalesced misses)
+instead of one default-executor thread per call. Async calls in flight are
+capped by a limit shared by all tools.
 """
 
 from __future__ import annotations
 
-import json
-from typing import Optional
+import asyncio
+import weakref
+from typing import Any, Callable, Optional, Union
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-from .operations import transcripts
+from . import handlers
+from .handlers import Handler
+from .operations import metrics
+from .operations.config import env_int
+
+# Max async tool calls running at once, shared by every tool
+_max_concurrency = env_int("MCP_YOUTUBE_TOOL_CONCURRENCY", 32)
+# asyncio semaphores belong to one event loop, so there is one per loop
+_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def configure_concurrency(max_concurrency: int) -> None:
+    """Cap async tool calls in flight (across all tools) at ``max_concurrency``."""
+    global _max_concurrency
+    _max_concurrency = max(1, max_concurrency)
+    _limits.clear()
+
+
+def _limit() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _limits.get(loop)
+    if semaphore is None:
+        semaphore = _limits[loop] = asyncio.Semaphore(_max_concurrency)
+    return semaphore
+
+
+def _tool(
+    args_schema: type[BaseModel], handler: Handler
+) -> Callable[[Callable[..., str]], StructuredTool]:
+    """``@tool`` with ``handler.acall`` as the native coroutine for ``ainvoke``; both are timed."""
+
+    def decorate(func: Callable[..., str]) -> StructuredTool:
+        timed = metrics.tool("langchain", func.__name__)(handler.acall)
+
+        async def limited(*args: Any, **kwargs: Any) -> str:
+            async with _limit():
+                return await timed(*args, **kwargs)
+
+        return StructuredTool.from_function(
+            func=metrics.tool("langchain")(func),
+            coroutine=limited,
+            name=func.__name__,
+            args_schema=args_schema,
+        )
+
+    return decorate
 
 
 # =============================================================================
@@ -25,16 +79,50 @@ from .operations import transcripts
 
 class GetTranscriptInput(BaseModel):
     video_url: str = Field(description="YouTube video URL or video ID")
-    language: str = Field(default="en", description="Language code (e.g. 'en', 'es', 'fr')")
-
+    language: Union[str, list[str]] = Field(
+        default="en",
+        description="Language code (e.g. 'en', 'es') or preference list (e.g. ['en-US', 'en'])",
+    )
+    translate: bool = Field(
+        default=False,
+        description="If no listed language exists, translate an available track",
+    )
+    max_chars: Optional[int] = Field(
+        default=None, description="Return one page of at most this many characters"
+    )
+    max_tokens: Optional[int] = Field(
+        default=None, description="Return one page of roughly this many tokens"
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="next_cursor from a previous page, to continue reading"
+    )
+    normalize: str = Field(
+        default="none",
+        description=(
+            "'none' (default), 'clean' (drop [Music]-style tags and repeated words), "
+            "'sentences', or fixed windows such as '30s'"
+        ),
+    )
+
+
+@_tool(GetTranscriptInput, handlers.get_transcript)
+def yt_get_transcript(
+    video_url: str,
+    language: Union[str, list[str]] = "en",
+    translate: bool = False,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    normalize: str = "none",
+) -> str:
+    """Get full transcript for a YouTube video as plain text.
 
-@tool(args_schema=GetTranscriptInput)
-def yt_get_transcript(video_url: str, language: str = "en") -> str:
-    """Get full transcript for a YouTube video as plain text."""
-    try:
-        return transcripts.get_transcript(video_url, language)
-    except Exception as e:
-        return f"Error fetching transcript: {e}"
+    With max_chars/max_tokens or a cursor, returns one JSON page with a
+    next_cursor for the rest.
+    """
+    return handlers.get_transcript(
+        video_url, language, translate, max_chars, max_tokens, cursor, normalize
+    )
 
 
 # =============================================================================
@@ -42,13 +130,32 @@ def yt_get_transcript(video_url: str, language: str = "en") -> str:
 # =============================================================================
 
 
-@tool(args_schema=GetTranscriptInput)
-def yt_get_transcript_with_timestamps(video_url: str, language: str = "en") -> str:
-    """Get transcript with timestamps for a YouTube video in JSON format."""
-    try:
-        return transcripts.get_transcript_with_timestamps(video_url, language)
-    except Exception as e:
-        return f"Error fetching transcript: {e}"
+class GetTimestampsInput(GetTranscriptInput):
+    format: str = Field(
+        default="json",
+        description="'json', 'compact' ([[start, duration, text], ...]), 'ndjson', 'srt' or 'vtt'",
+    )
+
+
+@_tool(GetTimestampsInput, handlers.get_transcript_with_timestamps)
+def yt_get_transcript_with_timestamps(
+    video_url: str,
+    language: Union[str, list[str]] = "en",
+    translate: bool = False,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    normalize: str = "none",
+    format: str = "json",
+) -> str:
+    """Get transcript with timestamps for a YouTube video as JSON, compact JSON, NDJSON, SRT or VTT.
+
+    With max_chars/max_tokens or a cursor, returns one JSON page with a
+    next_cursor for the rest.
+    """
+    return handlers.get_transcript_with_timestamps(
+        video_url, language, translate, max_chars, max_tokens, cursor, format, normalize
+    )
 
 
 # =============================================================================
@@ -58,20 +165,19 @@ def yt_get_transcript_with_timestamps(video_url: str, language: str = "en") -> s
 
 class ListTranscriptsInput(BaseModel):
     video_url: str = Field(description="YouTube video URL or video ID")
+    compact: bool = Field(
+        default=False, description="Return single-line JSON instead of indented JSON"
+    )
 
 
-@tool(args_schema=ListTranscriptsInput)
-def yt_list_available_transcripts(video_url: str) -> str:
+@_tool(ListTranscriptsInput, handlers.list_available_transcripts)
+def yt_list_available_transcripts(video_url: str, compact: bool = False) -> str:
     """List all available transcript languages for a YouTube video."""
-    try:
-        result = transcripts.list_available_transcripts(video_url)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error listing transcripts: {e}"
+    return handlers.list_available_transcripts(video_url, compact)
 
 
 # =============================================================================
-# Get Transcript Segment
+# Get Transcript Segment(s)
 # =============================================================================
 
 
@@ -79,18 +185,50 @@ class GetSegmentInput(BaseModel):
     video_url: str = Field(description="YouTube video URL or video ID")
     start_time: int = Field(description="Start time in seconds")
     end_time: int = Field(description="End time in seconds")
-    language: str = Field(default="en", description="Language code (e.g. 'en', 'es')")
+    language: Union[str, list[str]] = Field(
+        default="en", description="Language code or preference list (e.g. ['en-US', 'en'])"
+    )
+    mode: str = Field(
+        default="start",
+        description="'start' (lines starting in the window) or 'overlap' (lines overlapping it)",
+    )
 
 
-@tool(args_schema=GetSegmentInput)
+@_tool(GetSegmentInput, handlers.get_transcript_segment)
 def yt_get_transcript_segment(
-    video_url: str, start_time: int, end_time: int, language: str = "en"
+    video_url: str,
+    start_time: int,
+    end_time: int,
+    language: Union[str, list[str]] = "en",
+    mode: str = "start",
 ) -> str:
     """Get transcript segment between specific timestamps (in seconds)."""
-    try:
-        return transcripts.get_transcript_segment(video_url, start_time, end_time, language)
-    except Exception as e:
-        return f"Error fetching transcript segment: {e}"
+    return handlers.get_transcript_segment(video_url, start_time, end_time, language, mode)
+
+
+class GetSegmentsInput(BaseModel):
+    video_url: str = Field(description="YouTube video URL or video ID")
+    ranges: list[tuple[float, float]] = Field(
+        description="List of [start_time, end_time] pairs in seconds"
+    )
+    language: Union[str, list[str]] = Field(
+        default="en", description="Language code or preference list (e.g. ['en-US', 'en'])"
+    )
+    mode: str = Field(
+        default="start",
+        description="'start' (lines starting in each window) or 'overlap'",
+    )
+
+
+@_tool(GetSegmentsInput, handlers.get_transcript_segments)
+def yt_get_transcript_segments(
+    video_url: str,
+    ranges: list[tuple[float, float]],
+    language: Union[str, list[str]] = "en",
+    mode: str = "start",
+) -> str:
+    """Get several time windows from one YouTube video transcript in a single call."""
+    return handlers.get_transcript_segments(video_url, ranges, language, mode)
 
 
 # =============================================================================
@@ -100,22 +238,134 @@ def yt_get_transcript_segment(
 
 class SearchTranscriptInput(BaseModel):
     video_url: str = Field(description="YouTube video URL or video ID")
-    search_term: str = Field(description="Term to search for in the transcript")
-    language: str = Field(default="en", description="Language code (e.g. 'en', 'es')")
-
-
-@tool(args_schema=SearchTranscriptInput)
+    search_term: Union[str, list[str]] = Field(
+        description="Term to search for in the transcript, or a list of terms"
+    )
+    language: Union[str, list[str]] = Field(
+        default="en", description="Language code or preference list (e.g. ['en-US', 'en'])"
+    )
+    context: float = Field(
+        default=0, description="Also return the text within this many seconds of each match"
+    )
+    compact: bool = Field(
+        default=False, description="Return single-line JSON instead of indented JSON"
+    )
+    normalize: str = Field(
+        default="none",
+        description=(
+            "'none' (default), 'clean' (drop [Music]-style tags and repeated words), "
+            "'sentences', or fixed windows such as '30s'"
+        ),
+    )
+
+
+@_tool(SearchTranscriptInput, handlers.search_transcript)
 def yt_search_transcript(
-    video_url: str, search_term: str, language: str = "en"
+    video_url: str,
+    search_term: Union[str, list[str]],
+    language: Union[str, list[str]] = "en",
+    context: float = 0,
+    compact: bool = False,
+    normalize: str = "none",
 ) -> str:
     """Search for a term in a YouTube video transcript. Returns matching segments with timestamps."""
-    try:
-        matches = transcripts.search_transcript(video_url, search_term, language)
-        if not matches:
-            return f"No matches found for '{search_term}'"
-        return json.dumps(matches, indent=2)
-    except Exception as e:
-        return f"Error searching transcript: {e}"
+    return handlers.search_transcript(
+        video_url, search_term, language, context, compact, normalize
+    )
+
+
+# =============================================================================
+# Batch: Transcripts / Search across many videos
+# =============================================================================
+
+
+class GetTranscriptsBatchInput(BaseModel):
+    video_urls: list[str] = Field(description="YouTube video URLs or video IDs")
+    language: Union[str, list[str]] = Field(
+        default="en", description="Language code or preference list (e.g. ['en-US', 'en'])"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max videos fetched at once (default: MCP_YOUTUBE_BATCH_CONCURRENCY)",
+    )
+
+
+@_tool(GetTranscriptsBatchInput, handlers.get_transcripts_batch)
+def yt_get_transcripts_batch(
+    video_urls: list[str],
+    language: Union[str, list[str]] = "en",
+    max_concurrency: Optional[int] = None,
+) -> str:
+    """Get transcripts for many YouTube videos in one call. Failures are reported per video."""
+    return handlers.get_transcripts_batch(video_urls, language, max_concurrency)
+
+
+class SearchTranscriptsBatchInput(BaseModel):
+    video_urls: list[str] = Field(description="YouTube video URLs or video IDs")
+    search_term: Union[str, list[str]] = Field(
+        description="Term to search for in each transcript, or a list of terms"
+    )
+    language: Union[str, list[str]] = Field(
+        default="en", description="Language code or preference list (e.g. ['en-US', 'en'])"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max videos fetched at once (default: MCP_YOUTUBE_BATCH_CONCURRENCY)",
+    )
+
+
+@_tool(SearchTranscriptsBatchInput, handlers.search_transcripts_batch)
+def yt_search_transcripts_batch(
+    video_urls: list[str],
+    search_term: Union[str, list[str]],
+    language: Union[str, list[str]] = "en",
+    max_concurrency: Optional[int] = None,
+) -> str:
+    """Search for a term across many YouTube video transcripts. Returns matches per video."""
+    return handlers.search_transcripts_batch(video_urls, search_term, language, max_concurrency)
+
+
+# =============================================================================
+# Multi-language Transcripts
+# =============================================================================
+
+
+class GetTranscriptsMultilangInput(BaseModel):
+    video_url: str = Field(description="YouTube video URL or video ID")
+    languages: list[str] = Field(description="Language codes, e.g. ['en', 'es', 'de']")
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max languages fetched at once (default: MCP_YOUTUBE_BATCH_CONCURRENCY)",
+    )
+
+
+@_tool(GetTranscriptsMultilangInput, handlers.get_transcripts_multilang)
+def yt_get_transcripts_multilang(
+    video_url: str, languages: list[str], max_concurrency: Optional[int] = None
+) -> str:
+    """Get one YouTube video's transcript in several languages, translating missing ones."""
+    return handlers.get_transcripts_multilang(video_url, languages, max_concurrency)
+
+
+# =============================================================================
+# Search Corpus
+# =============================================================================
+
+
+class SearchCorpusInput(BaseModel):
+    query: str = Field(description="Words to search for")
+    top_k: int = Field(default=10, description="Max number of hits to return")
+    video_filter: Optional[list[str]] = Field(
+        default=None, description="Optional video URLs or IDs to restrict the search to"
+    )
+
+
+@_tool(SearchCorpusInput, handlers.search_corpus)
+def yt_search_corpus(
+    query: str, top_k: int = 10, video_filter: Optional[list[str]] = None
+) -> str:
+    """Search across all locally indexed YouTube transcripts. Returns ranked video/timestamp hits."""
+    return handlers.search_corpus(query, top_k, video_filter)
 
 
 # =============================================================================
@@ -127,5 +377,10 @@ TOOLS = [
     yt_get_transcript_with_timestamps,
     yt_list_available_transcripts,
     yt_get_transcript_segment,
+    yt_get_transcript_segments,
     yt_search_transcript,
+    yt_get_transcripts_batch,
+    yt_search_transcripts_batch,
+    yt_get_transcripts_multilang,
+    yt_search_corpus,
 ]
@@ -0,0 +1,97 @@
+"""Circuit breaker for upstream calls.
+
+After ``failure_threshold`` consecutive transient failures the circuit opens
+and calls fail fast with ``CircuitOpenError`` for ``reset_timeout`` seconds.
+Then a single trial call is let through (half-open): success closes the
+circuit, failure opens it again. Permanent errors such as a disabled
+transcript mean upstream answered, so they count as successes here.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from .errors import CircuitOpenError, is_transient
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def _before(self) -> None:
+        with self._lock:
+            if not self.enabled or self.state == CLOSED:
+                return
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(max(remaining, 0.0))
+
+    def _after(self, failed: bool) -> None:
+        with self._lock:
+            self._trial_running = False
+            if not failed:
+                self.state = CLOSED
+                self._failures = 0
+                return
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = self._clock()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        self._before()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._after(failed=is_transient(e))
+            raise
+        self._after(failed=False)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,228 @@
+"""In-process transcript cache - bounded LRU with per-entry TTL.
+
+Keys are (canonical video id, language) tuples. Entries are evicted when the
+cache exceeds its entry count or approximate byte budget (least recently used
+first), and lazily dropped once their TTL has passed.
+
+With a ``stale_ttl``, an expired entry is kept that much longer: ``get`` and
+``peek`` treat it as a miss, but ``lookup`` still returns it, flagged stale,
+so callers can serve it while they revalidate in the background.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class _Entry:
+    __slots__ = ("value", "nbytes", "expires")
+
+    def __init__(self, value: Any, nbytes: int, expires: float):
+        self.value = value
+        self.nbytes = nbytes
+        self.expires = expires
+
+
+class TranscriptCache:
+    """Thread-safe LRU cache with a max entry count, byte budget and TTL.
+
+    A ``ttl`` of 0 (or ``max_entries`` of 0) disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+        stale_ttl: float = 0.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` or None on miss/expiry."""
+        found = self.lookup(key, stale=False)
+        return None if found is None else found[0]
+
+    def lookup(self, key: Hashable, stale: bool = True) -> Optional[tuple[Any, bool]]:
+        """Return ``(value, is_stale)`` for ``key``, or None on miss.
+
+        Expired entries still within ``stale_ttl`` are returned flagged stale
+        (and counted as stale hits) unless ``stale`` is False.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            now = self._clock()
+            if entry.expires + self.stale_ttl <= now:
+                self._drop(key)
+                self.misses += 1
+                return None
+            expired = entry.expires <= now
+            if expired and not stale:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.stale_hits += expired
+            return entry.value, expired
+
+    def peek(self, key: Hashable, stale: bool = False) -> Optional[Any]:
+        """Like ``get`` but without touching counters or LRU order.
+
+        With ``stale``, entries within ``stale_ttl`` of expiry are returned too.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires = entry.expires + (self.stale_ttl if stale else 0.0)
+            return entry.value if expires > self._clock() else None
+
+    def put(
+        self, key: Hashable, value: Any, nbytes: int = 0, ttl: Optional[float] = None
+    ) -> None:
+        """Store ``value`` under ``key``, evicting LRU entries to stay in budget."""
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0 or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(value, nbytes, self._clock() + ttl)
+            self._bytes += nbytes
+            self._evict()
+
+    def resize(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Re-account ``key`` at ``nbytes`` if it still holds ``value``.
+
+        For values that grow after insertion; evicts to stay in budget, and
+        drops the entry itself if it no longer fits at all.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.value is not value:
+                return
+            if nbytes > self.max_bytes:
+                self._drop(key)
+                self.evictions += 1
+                return
+            self._bytes += nbytes - entry.nbytes
+            entry.nbytes = nbytes
+            self._evict()
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop a single entry. Returns True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def invalidate_video(
+        self,
+        video_id: str,
+        match: Optional[Callable[[Hashable, Any], bool]] = None,
+    ) -> int:
+        """Drop every entry for ``video_id`` (all languages). Returns the count.
+
+        With ``match``, only entries for which ``match(key, value)`` is true.
+        """
+        with self._lock:
+            keys = [
+                k
+                for k, entry in self._entries.items()
+                if isinstance(k, tuple)
+                and k[0] == video_id
+                and (match is None or match(k, entry.value))
+            ]
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.stale_hits = self.evictions = 0
+
+    def configure(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """Change limits in place, evicting immediately if the cache shrank."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if ttl is not None:
+                self.ttl = ttl
+            if stale_ttl is not None:
+                self.stale_ttl = stale_ttl
+            if not self.enabled:
+                self._entries.clear()
+                self._bytes = 0
+            self._evict()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "stale_ttl": self.stale_ttl,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires > self._clock()
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            self.evictions += 1
@@ -0,0 +1,112 @@
+"""Time-aligned, embedding-ready chunks of a transcript.
+
+Chunks hold whole caption lines and are cut by one of three units:
+
+    seconds  lines starting within ``size`` seconds of the chunk's first line
+    chars    at most ``size`` characters of text (lines joined by spaces)
+    tokens   at most ~``size`` tokens, at ``paging.CHARS_PER_TOKEN`` chars each
+
+Consecutive chunks share about ``overlap`` units of trailing lines. Cut points
+are found by bisecting the transcript's start and offset columns, and each
+chunk's text is one slice of the text blob, so chunking a transcript is a
+single pass that copies its text once.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from operator import add
+from typing import Any, Iterator, Mapping
+
+from .compact import Transcript
+from .paging import CHARS_PER_TOKEN
+
+UNITS = ("seconds", "chars", "tokens")
+
+
+def video_url(video_id: str, start: float = 0.0) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}&t={int(start)}s"
+
+
+def check(size: float, unit: str, overlap: float) -> None:
+    if unit not in UNITS:
+        raise ValueError(f"unit must be one of {UNITS}, got {unit!r}")
+    if size <= 0:
+        raise ValueError(f"size must be positive, got {size!r}")
+    if not 0 <= overlap < size:
+        raise ValueError(f"overlap must be at least 0 and less than size, got {overlap!r}")
+
+
+def _spans(
+    transcript: Transcript, size: float, unit: str, overlap: float
+) -> Iterator[tuple[int, int]]:
+    """Line ranges ``[first, stop)`` of successive chunks."""
+    n = len(transcript)
+    starts, offsets = transcript.starts, transcript.offsets
+    if unit == "tokens":
+        size, overlap = size * CHARS_PER_TOKEN, overlap * CHARS_PER_TOKEN
+    first = 0
+    while first < n:
+        if unit == "seconds":
+            stop = bisect_left(starts, starts[first] + size, first + 1)
+        else:
+            # Lines [first, stop) joined by spaces are offsets[stop] - offsets[first] - 1 chars.
+            stop = bisect_right(offsets, offsets[first] + size + 1, first + 1) - 1
+        stop = max(stop, first + 1)
+        yield first, stop
+        if stop >= n:
+            return
+        if not overlap:
+            first = stop
+        elif unit == "seconds":
+            first = bisect_left(starts, starts[stop] - overlap, first + 1, stop)
+        else:
+            first = bisect_left(offsets, offsets[stop] - 1 - overlap, first + 1, stop)
+
+
+def _chunks(
+    transcript: Transcript,
+    size: float,
+    unit: str,
+    overlap: float,
+    metadata: Mapping[str, Any] | None,
+) -> Iterator[dict[str, Any]]:
+    starts, durations = transcript.starts, transcript.durations
+    blob, offsets = transcript.blob, transcript.offsets
+    video_id, code = transcript.video_id, transcript.language_code
+    for index, (first, stop) in enumerate(_spans(transcript, size, unit, overlap)):
+        text = blob[offsets[first] : offsets[stop] - 1].replace("\n", " ")
+        start = starts[first]
+        yield {
+            "id": f"{video_id}:{code}:{index}",
+            "video_id": video_id,
+            "language_code": code,
+            "is_generated": transcript.is_generated,
+            "index": index,
+            "start": start,
+            "end": max(map(add, starts[first:stop], durations[first:stop])),
+            "first_line": first,
+            "last_line": stop - 1,
+            "tokens": -(-len(text) // CHARS_PER_TOKEN),
+            "url": video_url(video_id, start),
+            "text": text,
+            **(metadata or {}),
+        }
+
+
+def chunks(
+    transcript: Transcript,
+    size: float = 256,
+    unit: str = "tokens",
+    overlap: float = 0,
+    metadata: Mapping[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield chunks of ``transcript`` of up to ``size`` ``unit``.
+
+    A single caption line larger than ``size`` becomes a chunk of its own.
+    Each chunk carries its ``start``/``end`` time, line range, approximate
+    token count, a timestamped ``url`` and the video's metadata, plus any
+    extra ``metadata`` fields. Arguments are checked before the first chunk.
+    """
+    check(size, unit, overlap)
+    return _chunks(transcript, size, unit, overlap, metadata)
@@ -0,0 +1,290 @@
+"""Compact columnar transcript representation.
+
+A ``Transcript`` keeps start and duration columns in ``array('d')`` and every
+caption line in a single newline-joined text blob with an offset column,
+instead of one dict or dataclass per line. Long livestreams (tens of thousands
+of lines) then cost a handful of allocations rather than tens of thousands.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+_MAGIC = b"YTT1"
+_HEADER = struct.Struct("<4sI")
+
+
+class Segment(NamedTuple):
+    """One caption line (field order matches FetchedTranscriptSnippet)."""
+
+    text: str
+    start: float
+    duration: float
+
+
+def digest(parts: Iterable[bytes]) -> str:
+    """Short content hash of ``parts``."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def _array_bytes(column: array) -> int:
+    return column.itemsize * len(column)
+
+
+def _sizeof(value: Any) -> int:
+    """Approximate size of a derived structure (its ``nbytes()`` if it has one)."""
+    if isinstance(value, array):
+        return _array_bytes(value)
+    nbytes = getattr(value, "nbytes", None)
+    return nbytes() if callable(nbytes) else sys.getsizeof(value)
+
+
+class Transcript:
+    """Immutable columnar transcript for one video and language."""
+
+    __slots__ = (
+        "video_id",
+        "language",
+        "language_code",
+        "is_generated",
+        "starts",
+        "durations",
+        "blob",
+        "offsets",
+        "_derived",
+        "_on_grow",
+    )
+
+    def __init__(
+        self,
+        video_id: str,
+        language: str,
+        language_code: str,
+        is_generated: bool,
+        starts: array,
+        durations: array,
+        blob: str,
+        offsets: array,
+    ):
+        self.video_id = video_id
+        self.language = language
+        self.language_code = language_code
+        self.is_generated = is_generated
+        self.starts = starts
+        self.durations = durations
+        # Line i is blob[offsets[i]:offsets[i + 1] - 1]; lines are joined by "\n".
+        self.blob = blob
+        self.offsets = offsets
+        # Lazily built indexes and views, computed once per transcript.
+        self._derived: dict[str, Any] = {}
+        self._on_grow: Callable[[], None] | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[float, float, str]],
+        video_id: str = "",
+        language: str = "",
+        language_code: str = "",
+        is_generated: bool = False,
+    ) -> Transcript:
+        """Build from ``(start, duration, text)`` rows."""
+        rows = list(rows)
+        if any(rows[i][0] > rows[i + 1][0] for i in range(len(rows) - 1)):
+            # Range lookups bisect over starts, so keep lines in time order.
+            rows.sort(key=lambda row: row[0])
+        starts = array("d")
+        durations = array("d")
+        offsets = array("q", [0])
+        texts = []
+        position = 0
+        for start, duration, text in rows:
+            starts.append(start)
+            durations.append(duration)
+            texts.append(text)
+            position += len(text) + 1
+            offsets.append(position)
+        return cls(
+            video_id,
+            language,
+            language_code,
+            is_generated,
+            starts,
+            durations,
+            "\n".join(texts),
+            offsets,
+        )
+
+    @classmethod
+    def from_fetched(cls, fetched: Any) -> Transcript:
+        """Build from a youtube_transcript_api ``FetchedTranscript``."""
+        return cls.from_rows(
+            ((s.start, s.duration, s.text) for s in fetched),
+            video_id=fetched.video_id,
+            language=fetched.language,
+            language_code=fetched.language_code,
+            is_generated=fetched.is_generated,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def text_at(self, index: int) -> str:
+        return self.blob[self.offsets[index] : self.offsets[index + 1] - 1]
+
+    def texts(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        stop = len(self) if stop is None else stop
+        blob, offsets = self.blob, self.offsets
+        for i in range(start, stop):
+            yield blob[offsets[i] : offsets[i + 1] - 1]
+
+    def __iter__(self) -> Iterator[Segment]:
+        for i, text in enumerate(self.texts()):
+            yield Segment(text, self.starts[i], self.durations[i])
+
+    def __getitem__(self, index: int) -> Segment:
+        if index < 0:
+            index += len(self)
+        return Segment(self.text_at(index), self.starts[index], self.durations[index])
+
+    def slice(self, start: int, stop: int) -> Transcript:
+        """Sub-transcript of lines ``[start, stop)``."""
+        return Transcript.from_rows(
+            zip(self.starts[start:stop], self.durations[start:stop], self.texts(start, stop)),
+            self.video_id,
+            self.language,
+            self.language_code,
+            self.is_generated,
+        )
+
+    def derived(self, name: str, build: Callable[[Transcript], T]) -> T:
+        """Return a cached derived structure, building it on first use."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = build(self)
+            if isinstance(value, Transcript):
+                # Indexes built later on a derived view grow this transcript too.
+                value.watch(self._grew)
+            self._grew()
+            return value
+
+    def watch(self, callback: Callable[[], None] | None) -> None:
+        """Call ``callback`` whenever a derived structure is added, growing ``nbytes()``."""
+        self._on_grow = callback
+
+    def _grew(self) -> None:
+        if self._on_grow is not None:
+            self._on_grow()
+
+    def content_hash(self) -> str:
+        """Hash of the timed text and track identity, to tell if a refetch changed it."""
+
+        def build(t: Transcript) -> str:
+            identity = f"{t.language_code}|{t.is_generated}".encode("utf-8")
+            return digest(
+                (identity, t.starts.tobytes(), t.durations.tobytes(), t.blob.encode("utf-8"))
+            )
+
+        return self.derived("content_hash", build)
+
+    def _max_ends(self) -> array:
+        # Running maximum of line end times; non-decreasing, so bisectable.
+        def build(t: Transcript) -> array:
+            max_ends = array("d")
+            current = float("-inf")
+            for start, duration in zip(t.starts, t.durations):
+                current = max(current, start + duration)
+                max_ends.append(current)
+            return max_ends
+
+        return self.derived("max_ends", build)
+
+    def find_range(self, start_time: float, end_time: float, overlap: bool = False) -> list[int]:
+        """Indices of lines in ``[start_time, end_time]``, in time order.
+
+        By default a line matches when its start falls inside the window.
+        With ``overlap=True`` any line whose on-screen span intersects the
+        window matches. O(log n + k) via bisect over the start column.
+        """
+        if end_time < start_time:
+            return []
+        hi = bisect_right(self.starts, end_time)
+        if not overlap:
+            return list(range(bisect_left(self.starts, start_time), hi))
+        lo = bisect_left(self._max_ends(), start_time)
+        starts, durations = self.starts, self.durations
+        return [i for i in range(lo, hi) if starts[i] + durations[i] >= start_time]
+
+    def to_raw_data(self) -> list[dict[str, Any]]:
+        """Same shape as ``FetchedTranscript.to_raw_data()``."""
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in self
+        ]
+
+    def nbytes(self) -> int:
+        """Approximate memory footprint in bytes, derived structures included."""
+        return (
+            sys.getsizeof(self.blob)
+            + _array_bytes(self.starts)
+            + _array_bytes(self.durations)
+            + _array_bytes(self.offsets)
+            + 256
+            + sum(map(_sizeof, list(self._derived.values())))
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize columns to a compact zlib-compressed binary form."""
+        columns = [self.starts, self.durations, self.offsets]
+        if sys.byteorder != "little":
+            columns = [array(c.typecode, c) for c in columns]
+            for c in columns:
+                c.byteswap()
+        payload = b"".join(
+            [_HEADER.pack(_MAGIC, len(self))]
+            + [c.tobytes() for c in columns]
+            + [self.blob.encode("utf-8")]
+        )
+        return zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        video_id: str = "",
+        language: str = "",
+        language_code: str = "",
+        is_generated: bool = False,
+    ) -> Transcript:
+        payload = zlib.decompress(data)
+        if not payload.startswith(_MAGIC):
+            raise ValueError("not a serialized Transcript")
+        _, n = _HEADER.unpack_from(payload)
+        position = _HEADER.size
+        columns = []
+        for typecode, count in (("d", n), ("d", n), ("q", n + 1)):
+            column = array(typecode)
+            size = column.itemsize * count
+            column.frombytes(payload[position : position + size])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns.append(column)
+            position += size
+        starts, durations, offsets = columns
+        blob = payload[position:].decode("utf-8")
+        return cls(
+            video_id, language, language_code, is_generated, starts, durations, blob, offsets
+        )
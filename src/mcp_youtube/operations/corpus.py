@@ -0,0 +1,239 @@
+"""Cross-video corpus index with BM25 ranking.
+
+Transcripts are split into short time windows ("passages") and stored in an
+on-disk inverted index (SQLite), so a query across hundreds of videos is
+answered locally with ranked (video, timestamp, snippet) hits. Adding a video
+replaces its previous passages; videos can be deleted individually.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import sqlite3
+from collections import Counter
+from typing import Any, Iterable, Iterator, Optional
+
+from . import formats
+from .compact import Transcript
+from .db import ThreadConnections
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS passages (
+    doc_id INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    language_code TEXT NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passages_video ON passages (video_id, language_code);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+CREATE TABLE IF NOT EXISTS corpus_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    doc_count INTEGER NOT NULL,
+    total_length INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO corpus_stats VALUES (0, 0, 0);
+"""
+
+_TOKEN = re.compile(r"\w+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.casefold())
+
+
+def passages(
+    transcript: Transcript, window: float = 30.0
+) -> Iterator[tuple[float, float, str]]:
+    """Split a transcript into ``(start, end, text)`` windows of ~``window`` s."""
+    first = 0
+    n = len(transcript)
+    while first < n:
+        limit = transcript.starts[first] + window
+        last = first
+        while last + 1 < n and transcript.starts[last + 1] < limit:
+            last += 1
+        end = transcript.starts[last] + transcript.durations[last]
+        yield transcript.starts[first], end, " ".join(transcript.texts(first, last + 1))
+        first = last + 1
+
+
+class CorpusIndex:
+    """SQLite-backed inverted index over transcript passages.
+
+    Connections are opened lazily, one per thread; the database runs in WAL
+    mode so it can be shared between processes.
+    """
+
+    def __init__(self, path: str, window: float = 30.0):
+        self._db = ThreadConnections(path, _SCHEMA)
+        self.path = self._db.path
+        self.window = window
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._db.get()
+
+    def contains(self, video_id: str, language_code: Optional[str] = None) -> bool:
+        query = "SELECT 1 FROM passages WHERE video_id = ?"
+        params: tuple = (video_id,)
+        if language_code is not None:
+            query += " AND language_code = ?"
+            params += (language_code,)
+        return self._conn().execute(query + " LIMIT 1", params).fetchone() is not None
+
+    def add(self, transcript: Transcript) -> int:
+        """Index (or re-index) one transcript. Returns the passage count."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._delete(conn, transcript.video_id, transcript.language_code)
+            added = total = 0
+            for start, end, text in passages(transcript, self.window):
+                tokens = tokenize(text)
+                if not tokens:
+                    continue
+                doc_id = conn.execute(
+                    "INSERT INTO passages (video_id, language_code, start, end, text, length) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (transcript.video_id, transcript.language_code, start, end, text, len(tokens)),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO postings VALUES (?, ?, ?)",
+                    ((term, doc_id, tf) for term, tf in Counter(tokens).items()),
+                )
+                added += 1
+                total += len(tokens)
+            conn.execute(
+                "UPDATE corpus_stats SET doc_count = doc_count + ?, "
+                "total_length = total_length + ? WHERE id = 0",
+                (added, total),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def delete(self, video_id: str, language_code: Optional[str] = None) -> int:
+        """Remove a video's passages (one language or all). Returns the count."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = self._delete(conn, video_id, language_code)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def _delete(
+        self, conn: sqlite3.Connection, video_id: str, language_code: Optional[str]
+    ) -> int:
+        where = "video_id = ?"
+        params: tuple = (video_id,)
+        if language_code is not None:
+            where += " AND language_code = ?"
+            params += (language_code,)
+        count, total = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(length), 0) FROM passages WHERE {where}", params
+        ).fetchone()
+        if not count:
+            return 0
+        conn.execute(
+            f"DELETE FROM postings WHERE doc_id IN (SELECT doc_id FROM passages WHERE {where})",
+            params,
+        )
+        conn.execute(f"DELETE FROM passages WHERE {where}", params)
+        conn.execute(
+            "UPDATE corpus_stats SET doc_count = doc_count - ?, "
+            "total_length = total_length - ? WHERE id = 0",
+            (count, total),
+        )
+        return count
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        video_filter: Optional[Iterable[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """BM25-ranked passages for ``query``, best first."""
+        terms = set(tokenize(query))
+        if not terms or top_k <= 0:
+            return []
+        conn = self._conn()
+        doc_count, total_length = conn.execute(
+            "SELECT doc_count, total_length FROM corpus_stats WHERE id = 0"
+        ).fetchone()
+        if not doc_count:
+            return []
+        avg_length = total_length / doc_count
+        allowed = set(video_filter) if video_filter else None
+
+        scores: dict[int, float] = {}
+        for term in terms:
+            rows = conn.execute(
+                "SELECT p.doc_id, p.tf, d.length, d.video_id FROM postings p "
+                "JOIN passages d ON d.doc_id = p.doc_id WHERE p.term = ?",
+                (term,),
+            ).fetchall()
+            if not rows:
+                continue
+            df = len(rows)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf, length, video_id in rows:
+                if allowed is not None and video_id not in allowed:
+                    continue
+                norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        results = []
+        for doc_id, score in best:
+            video_id, language_code, start, end, text = conn.execute(
+                "SELECT video_id, language_code, start, end, text FROM passages "
+                "WHERE doc_id = ?",
+                (doc_id,),
+            ).fetchone()
+            results.append(
+                {
+                    "video_id": video_id,
+                    "language": language_code,
+                    "timestamp": formats.timestamp(start),
+                    "start": start,
+                    "end": end,
+                    "score": round(score, 4),
+                    "snippet": text,
+                }
+            )
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        conn = self._conn()
+        doc_count, total_length = conn.execute(
+            "SELECT doc_count, total_length FROM corpus_stats WHERE id = 0"
+        ).fetchone()
+        videos = conn.execute("SELECT COUNT(DISTINCT video_id) FROM passages").fetchone()[0]
+        return {
+            "path": self.path,
+            "videos": videos,
+            "passages": doc_count,
+            "tokens": total_length,
+        }
+
+    def close(self) -> None:
+        self._db.close()
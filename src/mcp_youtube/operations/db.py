@@ -0,0 +1,47 @@
+"""Shared SQLite plumbing for the on-disk transcript store and corpus index.
+
+Both open one connection per thread, in autocommit mode, with WAL journaling
+so several server processes can share a database file, and create their
+schema once per process on first use.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+
+
+class ThreadConnections:
+    """Lazily opened per-thread connections to the WAL-mode database at ``path``."""
+
+    def __init__(self, path: str, schema: str):
+        self.path = os.path.expanduser(path)
+        self._schema = schema
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def get(self) -> sqlite3.Connection:
+        """This thread's connection, opened (and the schema applied) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(self._schema)
+                    self._initialized = True
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection, if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
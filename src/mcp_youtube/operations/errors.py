@@ -0,0 +1,129 @@
+"""Upstream error classification and structured error responses.
+
+Permanent errors (transcripts disabled, no transcript in that language, video
+unavailable, ...) fail the same way on every attempt, so they are negatively
+cached and never retried. Throttling and transient errors may succeed later;
+they are retried by the rate limiter and counted by the circuit breaker.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import requests
+from youtube_transcript_api import (
+    AgeRestricted,
+    InvalidVideoId,
+    NoTranscriptFound,
+    NotTranslatable,
+    RequestBlocked,
+    TranscriptsDisabled,
+    TranslationLanguageNotAvailable,
+    VideoUnavailable,
+    VideoUnplayable,
+    YouTubeRequestFailed,
+)
+
+from . import metrics
+
+# Error codes returned to tool callers
+TRANSCRIPTS_DISABLED = "TRANSCRIPTS_DISABLED"
+NO_TRANSCRIPT = "NO_TRANSCRIPT"
+VIDEO_UNAVAILABLE = "VIDEO_UNAVAILABLE"
+INVALID_VIDEO_ID = "INVALID_VIDEO_ID"
+AGE_RESTRICTED = "AGE_RESTRICTED"
+NOT_TRANSLATABLE = "NOT_TRANSLATABLE"
+RATE_LIMITED = "RATE_LIMITED"
+UPSTREAM_ERROR = "UPSTREAM_ERROR"
+CIRCUIT_OPEN = "CIRCUIT_OPEN"
+INVALID_ARGUMENT = "INVALID_ARGUMENT"
+INTERNAL_ERROR = "INTERNAL_ERROR"
+
+# Most specific first: the first matching class decides the code.
+PERMANENT_ERRORS: tuple[tuple[type[BaseException], str], ...] = (
+    (TranscriptsDisabled, TRANSCRIPTS_DISABLED),
+    (NoTranscriptFound, NO_TRANSCRIPT),
+    (VideoUnavailable, VIDEO_UNAVAILABLE),
+    (VideoUnplayable, VIDEO_UNAVAILABLE),
+    (InvalidVideoId, INVALID_VIDEO_ID),
+    (AgeRestricted, AGE_RESTRICTED),
+    (NotTranslatable, NOT_TRANSLATABLE),
+    (TranslationLanguageNotAvailable, NOT_TRANSLATABLE),
+)
+
+# Upstream signals that we are sending too much traffic.
+THROTTLE_ERRORS: tuple[type[BaseException], ...] = (RequestBlocked,)
+# Failures that may succeed if simply tried again.
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    YouTubeRequestFailed,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"YouTube appears to be unavailable; retry in {retry_after:.0f}s"
+        )
+        self.retry_after = retry_after
+
+
+def is_permanent(exc: BaseException) -> bool:
+    return any(isinstance(exc, cls) for cls, _ in PERMANENT_ERRORS)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Throttling or transient upstream failure (worth retrying later)."""
+    return isinstance(exc, THROTTLE_ERRORS + TRANSIENT_ERRORS)
+
+
+def detached(exc: BaseException) -> BaseException:
+    """A copy of ``exc`` (same args and attributes) with no traceback.
+
+    Re-raising one shared exception object appends to its ``__traceback__``
+    on every raise, from every thread, so remembered failures are stored and
+    raised as copies.
+    """
+    copy = type(exc).__new__(type(exc), *exc.args)
+    copy.args = exc.args
+    copy.__dict__.update(exc.__dict__)
+    return copy
+
+
+def classify(exc: BaseException) -> tuple[str, bool]:
+    """Return ``(code, retryable)`` for an exception raised by an operation."""
+    for cls, code in PERMANENT_ERRORS:
+        if isinstance(exc, cls):
+            return code, False
+    if isinstance(exc, CircuitOpenError):
+        return CIRCUIT_OPEN, True
+    if isinstance(exc, THROTTLE_ERRORS):
+        return RATE_LIMITED, True
+    if isinstance(exc, TRANSIENT_ERRORS):
+        return UPSTREAM_ERROR, True
+    if isinstance(exc, (ValueError, TypeError)):
+        return INVALID_ARGUMENT, False
+    return INTERNAL_ERROR, False
+
+
+def error_info(exc: BaseException) -> dict[str, Any]:
+    """Structured ``{code, retryable}`` fields for an exception."""
+    code, retryable = classify(exc)
+    info: dict[str, Any] = {"code": code, "retryable": retryable}
+    if isinstance(exc, CircuitOpenError):
+        info["retry_after"] = round(exc.retry_after, 1)
+    return info
+
+
+def error_response(message: str, exc: BaseException) -> str:
+    """JSON tool response ``{"error": {code, message, retryable}}``.
+
+    Also counts the error against the tool call in progress (see metrics).
+    """
+    info = error_info(exc)
+    metrics.tool_error(info["code"])
+    return json.dumps({"error": {"message": f"{message}: {exc}", **info}}, indent=2)
@@ -0,0 +1,131 @@
+"""Timed transcript output formats, serialized incrementally.
+
+Every format is rendered by one serializer that walks the transcript columns
+and yields string chunks of ``CHUNK_LINES`` lines each, so writing a long
+livestream to a file or socket never holds more than one chunk, and building
+the full string needs no per-line dicts or intermediate list of rows.
+
+    json     [{"text": ..., "start": ..., "duration": ...}, ...]  (the default)
+    compact  [[start,duration,"text"],...]
+    ndjson   one {"text","start","duration"} object per line
+    srt      SubRip cues
+    vtt      WebVTT cues
+"""
+
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Callable, Iterator
+
+from . import metrics
+from .compact import Transcript
+
+FORMATS = ("json", "compact", "ndjson", "srt", "vtt")
+
+# Caption lines per yielded chunk
+CHUNK_LINES = 512
+
+_quote = json.encoder.encode_basestring_ascii
+
+
+def _number(value: float) -> str:
+    # float.__repr__ is what json.dumps writes for finite floats.
+    return repr(value)
+
+
+def timestamp(seconds: float) -> str:
+    """Short ``m:ss`` display form used in search hits."""
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def _clock(seconds: float, separator: str) -> str:
+    millis = int(seconds * 1000 + 0.5) if seconds > 0 else 0
+    secs, millis = divmod(millis, 1000)
+    minutes, secs = divmod(secs, 60)
+    return "%02d:%02d:%02d%s%03d" % (minutes // 60, minutes % 60, secs, separator, millis)
+
+
+def _json_row(i: int, text: str, start: float, duration: float) -> str:
+    return (
+        f'{", " if i else ""}{{"text": {_quote(text)}, '
+        f'"start": {_number(start)}, "duration": {_number(duration)}}}'
+    )
+
+
+def _compact_row(i: int, text: str, start: float, duration: float) -> str:
+    return f'{"," if i else ""}[{_number(start)},{_number(duration)},{_quote(text)}]'
+
+
+def _ndjson_row(i: int, text: str, start: float, duration: float) -> str:
+    return (
+        f'{{"text":{_quote(text)},"start":{_number(start)},'
+        f'"duration":{_number(duration)}}}\n'
+    )
+
+
+def _srt_row(i: int, text: str, start: float, duration: float) -> str:
+    return f"{i + 1}\n{_clock(start, ',')} --> {_clock(start + duration, ',')}\n{text}\n\n"
+
+
+def _vtt_row(i: int, text: str, start: float, duration: float) -> str:
+    return f"{_clock(start, '.')} --> {_clock(start + duration, '.')}\n{text}\n\n"
+
+
+# format -> (header, row renderer, footer)
+_WRITERS: dict[str, tuple[str, Callable[[int, str, float, float], str], str]] = {
+    "json": ("[", _json_row, "]"),
+    "compact": ("[", _compact_row, "]"),
+    "ndjson": ("", _ndjson_row, ""),
+    "srt": ("", _srt_row, ""),
+    "vtt": ("WEBVTT\n\n", _vtt_row, ""),
+}
+
+
+def check_format(fmt: str) -> str:
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}, got {fmt!r}")
+    return fmt
+
+
+def iter_chunks(
+    transcript: Transcript, fmt: str = "json", chunk_lines: int = CHUNK_LINES
+) -> Iterator[str]:
+    """Yield ``transcript`` rendered as ``fmt``, ``chunk_lines`` lines at a time."""
+    header, row, footer = _WRITERS[check_format(fmt)]
+    starts, durations = transcript.starts, transcript.durations
+    total = len(transcript)
+    if header:
+        yield header
+    for lo in range(0, total, chunk_lines):
+        hi = min(lo + chunk_lines, total)
+        yield "".join(
+            [
+                row(i, text, starts[i], durations[i])
+                for i, text in zip(range(lo, hi), transcript.texts(lo, hi))
+            ]
+        )
+    if footer:
+        yield footer
+
+
+@metrics.staged(metrics.FORMAT)
+def render(transcript: Transcript, fmt: str = "json") -> str:
+    """Whole transcript as one ``fmt`` string."""
+    return "".join(iter_chunks(transcript, fmt))
+
+
+def write(transcript: Transcript, out: IO[str], fmt: str = "json") -> int:
+    """Stream ``transcript`` to ``out`` as ``fmt``; returns characters written."""
+    written = 0
+    for chunk in iter_chunks(transcript, fmt):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def dumps(value: Any, compact: bool = False) -> str:
+    """JSON for tool results: indented by default, minimal separators if ``compact``."""
+    if compact:
+        return json.dumps(value, separators=(",", ":"))
+    return json.dumps(value, indent=2)
@@ -0,0 +1,151 @@
+"""Pooled, thread-safe HTTP client for the upstream API.
+
+``YouTubeTranscriptApi`` is documented as not thread-safe because it owns a
+``requests.Session``. ``UpstreamClient`` gives every thread its own API
+instance and session, but all sessions share one sized ``HTTPAdapter``, so
+keep-alive connections are pooled across threads instead of being opened per
+call. Sessions apply default connect/read timeouts and, optionally, rotate
+through a list of proxies per request.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import threading
+from typing import Any, NamedTuple, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api import YouTubeTranscriptApi
+
+from .config import env_float, env_int, env_str
+
+
+class HttpConfig(NamedTuple):
+    """Upstream HTTP settings; see ``from_env`` for the variables."""
+
+    pool_size: int = 16
+    connect_timeout: float = 5.0
+    read_timeout: float = 20.0
+    proxies: tuple[str, ...] = ()
+
+    @classmethod
+    def from_env(cls) -> HttpConfig:
+        proxies = env_str("MCP_YOUTUBE_PROXIES", "")
+        return cls(
+            pool_size=env_int("MCP_YOUTUBE_HTTP_POOL_SIZE", cls._field_defaults["pool_size"]),
+            connect_timeout=env_float(
+                "MCP_YOUTUBE_HTTP_CONNECT_TIMEOUT", cls._field_defaults["connect_timeout"]
+            ),
+            read_timeout=env_float(
+                "MCP_YOUTUBE_HTTP_READ_TIMEOUT", cls._field_defaults["read_timeout"]
+            ),
+            proxies=tuple(p.strip() for p in proxies.split(",") if p.strip()),
+        )
+
+
+class ProxyRotation:
+    """Round-robin over proxy URLs, shared by every session."""
+
+    def __init__(self, urls: Sequence[str]):
+        self.urls = tuple(urls)
+        self._cycle = itertools.cycle(self.urls)
+        self._lock = threading.Lock()
+
+    def next(self) -> dict[str, str]:
+        with self._lock:
+            url = next(self._cycle)
+        return {"http": url, "https": url}
+
+
+class PooledSession(requests.Session):
+    """Session with default timeouts and optional per-request proxy rotation."""
+
+    def __init__(
+        self,
+        adapter: HTTPAdapter,
+        timeout: tuple[float, float],
+        proxies: Optional[ProxyRotation] = None,
+    ):
+        super().__init__()
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.default_timeout = timeout
+        self.rotation = proxies
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.default_timeout)
+        if self.rotation is not None and not kwargs.get("proxies"):
+            kwargs["proxies"] = self.rotation.next()
+        return super().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        # The adapter is shared with other threads' sessions; keep it open.
+        pass
+
+
+class UpstreamClient:
+    """Drop-in for the ``YouTubeTranscriptApi`` singleton, safe across threads."""
+
+    def __init__(self, config: Optional[HttpConfig] = None):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.configure(config or HttpConfig())
+
+    def configure(self, config: HttpConfig) -> None:
+        """Apply new settings; each thread rebuilds its session on next use."""
+        with self._lock:
+            self.config = config
+            self._adapter = HTTPAdapter(
+                pool_connections=config.pool_size, pool_maxsize=config.pool_size
+            )
+            self._rotation = ProxyRotation(config.proxies) if config.proxies else None
+            self._generation += 1
+            self.sessions = 0
+
+    def session(self) -> PooledSession:
+        """This thread's session (created on first use)."""
+        return self._thread_api()[0]
+
+    def _thread_api(self) -> tuple[PooledSession, YouTubeTranscriptApi]:
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            with self._lock:
+                session = PooledSession(
+                    self._adapter,
+                    (self.config.connect_timeout, self.config.read_timeout),
+                    self._rotation,
+                )
+                local.generation = self._generation
+                self.sessions += 1
+            local.session = session
+            local.api = YouTubeTranscriptApi(http_client=session)
+        return local.session, local.api
+
+    def fetch(self, video_id: str, languages: Sequence[str] = ("en",)):
+        return self._thread_api()[1].fetch(video_id, languages=languages)
+
+    def list(self, video_id: str):
+        return self._thread_api()[1].list(video_id)
+
+    def bind(self, track):
+        """A copy of ``track`` that fetches through this thread's session.
+
+        Tracks keep the session of the thread that listed them, so a cached
+        TranscriptList would otherwise share one ``requests.Session`` across
+        threads.
+        """
+        bound = copy.copy(track)
+        bound._http_client = self.session()
+        return bound
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.config.pool_size,
+            "connect_timeout": self.config.connect_timeout,
+            "read_timeout": self.config.read_timeout,
+            "proxies": len(self.config.proxies),
+            "sessions": self.sessions,
+        }
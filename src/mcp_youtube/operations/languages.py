@@ -0,0 +1,93 @@
+"""Transcript language resolution against a video's TranscriptList.
+
+A request names one language or a preference list. Tracks are matched in
+this order, trying the preferences in order within each step:
+
+1. exact language code, manually created track before auto-generated;
+2. regional variant sharing the base language (``en-US`` <-> ``en``,
+   ``pt`` <-> ``pt-BR``), manual before generated;
+3. optionally, a translation of an available track into the first
+   preferred language it can be translated to.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence, Union
+
+from youtube_transcript_api import NoTranscriptFound
+
+# A language code or a preference list of codes
+Languages = Union[str, Sequence[str]]
+
+
+def preferences(language: Languages) -> tuple[str, ...]:
+    """Normalize a language code or list of codes to a de-duplicated tuple."""
+    codes = [language] if isinstance(language, str) else list(language)
+    result: list[str] = []
+    for code in codes:
+        code = code.strip()
+        if code and code not in result:
+            result.append(code)
+    if not result:
+        raise ValueError("at least one language code is required")
+    return tuple(result)
+
+
+def spec(codes: Sequence[str], translate: bool = False) -> str:
+    """Cache-key form of a language request (``"en"`` for a single code)."""
+    joined = ",".join(codes)
+    return f"{joined}|translate" if translate else joined
+
+
+def parse_spec(value: str) -> tuple[tuple[str, ...], bool]:
+    """Inverse of ``spec``: ``(codes, translate)``."""
+    codes, _, flag = value.partition("|")
+    return tuple(codes.split(",")), flag == "translate"
+
+
+def base_language(code: str) -> str:
+    return code.replace("_", "-").split("-", 1)[0].casefold()
+
+
+def _ordered(tracks: Iterable[Any]) -> list[Any]:
+    # Manual tracks first; otherwise keep the listing order.
+    return sorted(tracks, key=lambda t: bool(t.is_generated))
+
+
+EXACT = "exact"
+REGIONAL = "regional"
+TRANSLATION = "translation"
+
+
+def match(
+    transcript_list: Any, codes: Sequence[str], translate: bool = False
+) -> tuple[Any, str]:
+    """Pick the best track for ``codes``; return it with how it matched.
+
+    The second element is ``EXACT``, ``REGIONAL`` or ``TRANSLATION``.
+    Raises NoTranscriptFound when nothing matches.
+    """
+    tracks = _ordered(transcript_list)
+    for code in codes:
+        for track in tracks:
+            if track.language_code == code:
+                return track, EXACT
+    for code in codes:
+        wanted = base_language(code)
+        for track in tracks:
+            if base_language(track.language_code) == wanted:
+                return track, REGIONAL
+    if translate:
+        sources = [t for t in tracks if t.is_translatable]
+        for code in codes:
+            for track in sources:
+                available = {lang.language_code for lang in track.translation_languages}
+                if code in available:
+                    return track.translate(code), TRANSLATION
+    video_id = getattr(transcript_list, "video_id", "")
+    raise NoTranscriptFound(video_id, list(codes), transcript_list)
+
+
+def resolve(transcript_list: Any, codes: Sequence[str], translate: bool = False) -> Any:
+    """Pick the best transcript track for ``codes`` from ``transcript_list``."""
+    return match(transcript_list, codes, translate)[0]
@@ -0,0 +1,46 @@
+"""Deferred module imports.
+
+The tool layers reference the operations modules through ``LazyModule`` so
+that importing ``mcp_youtube.server`` (or ``langchain_tools``) registers tools
+without loading youtube_transcript_api, requests and the fetch stack. The
+real module is imported on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            # The import system serializes concurrent first imports.
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
@@ -0,0 +1,352 @@
+"""In-process metrics: latency histograms and counters.
+
+Cheap enough to leave on: one ``perf_counter`` pair and a short locked
+update per observation. Recorded:
+
+- ``tool``: end-to-end latency of each MCP / LangChain tool call, and tool
+  errors by structured error code;
+- ``operation``: latency of each public operation in ``operations``;
+- ``stage``: time spent fetching (upstream and store reads), parsing
+  upstream responses, normalizing captions, formatting output and searching
+  transcripts;
+- upstream calls and upstream errors by code;
+- gauges and counters read from registered collectors (cache hit/miss).
+
+``snapshot()`` returns everything as a dict; ``prometheus()`` renders the
+Prometheus text exposition format. Set ``MCP_YOUTUBE_METRICS=0`` to disable.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import env_int
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Latency bucket upper bounds in seconds (+Inf is implicit)
+BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)  # fmt: skip
+
+FETCH = "fetch"
+PARSE = "parse"
+FORMAT = "format"
+SEARCH = "search"
+NORMALIZE = "normalize"
+
+PREFIX = "mcp_youtube"
+
+# Metric name -> (type, help); label names come from the recorded samples.
+_DESCRIPTIONS = {
+    "tool_duration_seconds": ("histogram", "Tool call latency"),
+    "tool_errors_total": ("counter", "Tool calls that returned an error"),
+    "operation_duration_seconds": ("histogram", "Operation latency"),
+    "stage_duration_seconds": ("histogram", "Time spent per stage: fetch, parse, normalize, format, search"),
+    "upstream_requests_total": ("counter", "Upstream calls (retries count once)"),
+    "upstream_errors_total": ("counter", "Upstream calls that failed"),
+}
+# Collector keys that only ever increase (exported as counters)
+_COLLECTOR_COUNTERS = frozenset(
+    {
+        "hits",
+        "misses",
+        "stale_hits",
+        "evictions",
+        "requested",
+        "coalesced",
+        "dropped",
+        "refreshed",
+        "changed",
+        "unchanged",
+        "failed",
+    }
+)
+
+_enabled = env_int("MCP_YOUTUBE_METRICS", 1) != 0
+# (layer, tool) of the tool call running in this context, for error attribution
+_current_tool: contextvars.ContextVar[Optional[tuple[str, str]]] = contextvars.ContextVar(
+    "mcp_youtube_tool", default=None
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "sum", "count", "_lock")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts = [0] * (len(BUCKETS) + 1)
+            self.sum = 0.0
+            self.count = 0
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(BUCKETS, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative, running = [], 0
+        for bound, n in zip(BUCKETS + (float("inf"),), counts):
+            running += n
+            cumulative.append((bound, running))
+        return {"count": count, "sum": total, "buckets": cumulative}
+
+
+class Registry:
+    """Histograms and counters keyed by metric name and label values."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        key = (name, tuple(sorted(labels.items())))
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, Histogram())
+        return hist
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def register_collector(self, name: str, fn: Callable[[], dict[str, Any]]) -> None:
+        """Read ``fn()`` (numeric stats) at scrape time, as ``<name>_<key>``."""
+        with self._lock:
+            self._collectors[name] = fn
+
+    def reset(self) -> None:
+        # Histograms are zeroed in place: decorated functions hold references.
+        with self._lock:
+            histograms = list(self._histograms.values())
+            self._counters.clear()
+        for hist in histograms:
+            hist.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            histograms = list(self._histograms.items())
+            counters = list(self._counters.items())
+            collectors = list(self._collectors.items())
+        result: dict[str, Any] = {"histograms": {}, "counters": {}, "collectors": {}}
+        for (name, labels), hist in histograms:
+            data = hist.snapshot()
+            if data["count"]:
+                result["histograms"].setdefault(name, []).append(
+                    {"labels": dict(labels), **data}
+                )
+        for (name, labels), value in counters:
+            result["counters"].setdefault(name, []).append(
+                {"labels": dict(labels), "value": value}
+            )
+        for name, fn in collectors:
+            result["collectors"][name] = {
+                k: v
+                for k, v in fn().items()
+                if isinstance(v, (int, float)) and not isinstance(v, bool)
+            }
+        return result
+
+
+_registry = Registry()
+
+
+class _Timer:
+    __slots__ = ("hist", "started")
+
+    def __init__(self, hist: Optional[Histogram]):
+        self.hist = hist
+
+    def __enter__(self) -> _Timer:
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self.hist is not None:
+            self.hist.observe(time.perf_counter() - self.started)
+
+
+def stage(name: str) -> _Timer:
+    """``with stage(FETCH): ...`` records the block under that stage."""
+    return _Timer(_registry.histogram("stage_duration_seconds", stage=name) if _enabled else None)
+
+
+def _timed(fn: F, hist: Histogram, before: Optional[Callable[[], Any]] = None) -> F:
+    """Wrap sync or async ``fn`` so each call is observed in ``hist``.
+
+    ``before`` runs first and returns a contextvars token, reset afterwards.
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return await fn(*args, **kwargs)
+            token = before() if before else None
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - started)
+                if token is not None:
+                    _current_tool.reset(token)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return fn(*args, **kwargs)
+        token = before() if before else None
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            hist.observe(time.perf_counter() - started)
+            if token is not None:
+                _current_tool.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def staged(name: str) -> Callable[[F], F]:
+    """Decorator form of ``stage``."""
+
+    def decorate(fn: F) -> F:
+        return _timed(fn, _registry.histogram("stage_duration_seconds", stage=name))
+
+    return decorate
+
+
+def operation(fn: F) -> F:
+    """Record latency of a public operation, labelled by function name."""
+    return _timed(fn, _registry.histogram("operation_duration_seconds", operation=fn.__name__))
+
+
+def tool(layer: str, name: Optional[str] = None) -> Callable[[F], F]:
+    """Record latency of a tool call; errors it reports are attributed to it.
+
+    The tool is labelled ``name``, by default the function's name.
+    """
+
+    def decorate(fn: F) -> F:
+        current = (layer, name or fn.__name__)
+        return _timed(
+            fn,
+            _registry.histogram("tool_duration_seconds", layer=layer, tool=current[1]),
+            lambda: _current_tool.set(current),
+        )
+
+    return decorate
+
+
+def tool_error(code: str) -> None:
+    """Count an error returned by the tool running in this context."""
+    current = _current_tool.get()
+    if _enabled and current is not None:
+        _registry.inc("tool_errors_total", layer=current[0], tool=current[1], code=code)
+
+
+def upstream_request(call: str) -> None:
+    if _enabled:
+        _registry.inc("upstream_requests_total", call=call)
+
+
+def upstream_error(call: str, code: str) -> None:
+    if _enabled:
+        _registry.inc("upstream_errors_total", call=call, code=code)
+
+
+def register_collector(name: str, fn: Callable[[], dict[str, Any]]) -> None:
+    _registry.register_collector(name, fn)
+
+
+def configure(enabled: bool) -> None:
+    """Turn recording on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def reset() -> None:
+    """Drop recorded histograms and counters (collectors are kept)."""
+    _registry.reset()
+
+
+def snapshot() -> dict[str, Any]:
+    """All metrics as a JSON-serializable dict."""
+    data = _registry.snapshot()
+    for series in data["histograms"].values():
+        for item in series:
+            item["buckets"] = [
+                ["+Inf" if bound == float("inf") else bound, n]
+                for bound, n in item["buckets"]
+            ]
+    return data
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str], **extra: str) -> str:
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in sorted(pairs.items())) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def prometheus() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    data = _registry.snapshot()
+    lines: list[str] = []
+    for name, series in sorted(data["histograms"].items()):
+        full = f"{PREFIX}_{name}"
+        kind, help_text = _DESCRIPTIONS.get(name, ("histogram", name))
+        lines += [f"# HELP {full} {help_text}", f"# TYPE {full} {kind}"]
+        for item in series:
+            labels = item["labels"]
+            for bound, n in item["buckets"]:
+                lines.append(f"{full}_bucket{_labels(labels, le=_format_bound(bound))} {n}")
+            lines.append(f"{full}_sum{_labels(labels)} {item['sum']!r}")
+            lines.append(f"{full}_count{_labels(labels)} {item['count']}")
+    for name, series in sorted(data["counters"].items()):
+        full = f"{PREFIX}_{name}"
+        kind, help_text = _DESCRIPTIONS.get(name, ("counter", name))
+        lines += [f"# HELP {full} {help_text}", f"# TYPE {full} {kind}"]
+        for item in series:
+            lines.append(f"{full}{_labels(item['labels'])} {item['value']:g}")
+    for collector, values in sorted(data["collectors"].items()):
+        for key, value in sorted(values.items()):
+            full = f"{PREFIX}_{collector}_{key}"
+            kind = "counter" if key in _COLLECTOR_COUNTERS else "gauge"
+            if kind == "counter":
+                full += "_total"
+            lines += [f"# TYPE {full} {kind}", f"{full} {value:g}"]
+    return "\n".join(lines) + "\n"
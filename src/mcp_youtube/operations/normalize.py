@@ -0,0 +1,153 @@
+"""Caption normalization: fewer, cleaner lines for LLM consumption.
+
+Auto-generated tracks split speech into short fragments that overlap in time
+and repeat the tail of the previous line, and are peppered with ``[Music]``
+style tags. A normalization mode rewrites a transcript into a new one:
+
+    none       as fetched
+    clean      noise tags stripped, words repeated from the previous line
+               dropped, empty lines removed; line boundaries kept
+    sentences  clean, then lines merged up to sentence-ending punctuation, a
+               pause, or ``MAX_SENTENCE_SECONDS``
+    <N>s       clean, then lines merged into fixed windows of N seconds
+               (e.g. ``"30s"``)
+
+Merged lines start at their first fragment and last until the latest end
+among them. Results are cached on the transcript (``Transcript.derived``), so
+each mode is computed once per cached transcript.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator
+
+from . import metrics
+from .compact import Transcript
+
+NONE = "none"
+MODES = (NONE, "clean", "sentences", "<N>s")
+
+# Bracketed tags ([Music], [Applause], [ __ ]), music notes, and parenthesised
+# sound descriptions.
+_NOISE = re.compile(
+    r"\[[^\]\n]*\]|[♪♫]+"
+    r"|\((?:[^)\n]*\b)?(?:music|applause|laughter|laughs|inaudible)\b[^)\n]*\)",
+    re.IGNORECASE,
+)
+_SENTENCE_END = re.compile(r"[.?!…][\"'”’)\]]*$")
+_WINDOW = re.compile(r"^(\d+(?:\.\d+)?)s$")
+_STRIP = ".,;:!?…\"'”’“‘()"
+
+# A repeated word only counts as overlap when the lines are this close in time.
+DEDUP_GAP_SECONDS = 1.0
+# Unpunctuated speech is cut into sentences at pauses, or at this length.
+PAUSE_SECONDS = 1.5
+MAX_SENTENCE_SECONDS = 30.0
+
+Row = tuple[float, float, str]
+
+
+def check(mode: str) -> None:
+    if mode not in (NONE, "clean", "sentences") and not _window(mode):
+        raise ValueError(f"normalize must be one of {MODES}, got {mode!r}")
+
+
+def _window(mode: str) -> float:
+    match = _WINDOW.match(mode)
+    return float(match.group(1)) if match else 0.0
+
+
+def _duration(start: float, end: float) -> float:
+    # Rounded so float error does not bloat rendered timestamps
+    return round(end - start, 3)
+
+
+def _key(word: str) -> str:
+    return word.strip(_STRIP).casefold()
+
+
+def _overlap(previous: list[str], words: list[str]) -> int:
+    """Length of the longest tail of ``previous`` that ``words`` starts with."""
+    for k in range(min(len(previous), len(words)), 0, -1):
+        if previous[-k:] == words[:k]:
+            return k
+    return 0
+
+
+def _clean(transcript: Transcript) -> Iterator[Row]:
+    previous: list[str] = []  # comparison keys of the last emitted line
+    previous_end = float("-inf")
+    pending: list[float] | None = None  # [start, end] of the row not yet emitted
+    pending_text = ""
+    for text, start, end in zip(
+        transcript.texts(),
+        transcript.starts,
+        map(sum, zip(transcript.starts, transcript.durations)),
+    ):
+        words = _NOISE.sub(" ", text).split()
+        if not words:
+            continue
+        keys = [_key(w) for w in words]
+        if pending is not None and start - previous_end <= DEDUP_GAP_SECONDS:
+            drop = _overlap(previous, keys)
+            if drop == len(words):
+                # A full repeat: its words end the previous line, which
+                # stays on screen until this one ends.
+                pending[1] = max(pending[1], end)
+                previous_end = max(previous_end, end)
+                continue
+            words, keys = words[drop:], keys[drop:]
+        if pending is not None:
+            yield pending[0], _duration(pending[0], pending[1]), pending_text
+        pending, pending_text = [start, end], " ".join(words)
+        previous, previous_end = keys, end
+    if pending is not None:
+        yield pending[0], _duration(pending[0], pending[1]), pending_text
+
+
+def _merge(rows: Iterable[Row], window: float) -> Iterator[Row]:
+    """Merge rows into sentences (``window`` 0) or fixed windows of seconds."""
+    first = end = 0.0
+    texts: list[str] = []
+    for start, duration, text in rows:
+        if texts:
+            if window:
+                cut = start >= first + window
+            else:
+                cut = (
+                    _SENTENCE_END.search(texts[-1]) is not None
+                    or start - end > PAUSE_SECONDS
+                    or start + duration - first > MAX_SENTENCE_SECONDS
+                )
+            if cut:
+                yield first, _duration(first, end), " ".join(texts)
+                texts = []
+        if not texts:
+            first = end = start
+        texts.append(text)
+        end = max(end, start + duration)
+    if texts:
+        yield first, _duration(first, end), " ".join(texts)
+
+
+@metrics.staged(metrics.NORMALIZE)
+def _build(transcript: Transcript, mode: str) -> Transcript:
+    rows = _clean(transcript)
+    if mode != "clean":
+        rows = _merge(rows, _window(mode))
+    return Transcript.from_rows(
+        rows,
+        transcript.video_id,
+        transcript.language,
+        transcript.language_code,
+        transcript.is_generated,
+    )
+
+
+def apply(transcript: Transcript, mode: str = NONE) -> Transcript:
+    """``transcript`` normalized by ``mode``, built once and cached on it."""
+    if mode == NONE:
+        return transcript
+    check(mode)
+    return transcript.derived(f"normalize:{mode}", lambda t: _build(t, mode))
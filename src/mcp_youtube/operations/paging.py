@@ -0,0 +1,125 @@
+"""Budgeted pagination over a cached transcript.
+
+A page holds whole caption lines up to a character budget (or an approximate
+token budget, at ~4 characters per token). The opaque cursor records the video,
+language, output kind, character budget, normalization mode and the next line
+index, so a cursor alone continues reading, and continuation pages are cut
+from the same cached transcript instead of being refetched.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from bisect import bisect_right
+from typing import Any, Optional
+
+from . import metrics
+from .compact import Transcript
+
+CHARS_PER_TOKEN = 4
+KINDS = ("text", "json")
+
+
+def encode_cursor(
+    video_id: str,
+    language: str,
+    kind: str,
+    index: int,
+    budget: int,
+    normalize: str = "none",
+) -> str:
+    fields: list[Any] = [video_id, language, kind, index, budget]
+    if normalize != "none":
+        fields.append(normalize)
+    payload = json.dumps(fields, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str, str, int, int, str]:
+    """``(video_id, language, kind, index, budget, normalize)`` of a cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        video_id, language, kind, index, budget, *rest = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+        (normalize,) = rest or ["none"]
+        index, budget = int(index), int(budget)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if budget <= 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return video_id, language, kind, index, budget, normalize
+
+
+def char_budget(max_chars: Optional[int], max_tokens: Optional[int]) -> Optional[int]:
+    """Effective character budget, or None when pagination is not requested."""
+    budgets = [b for b in (max_chars, max_tokens and max_tokens * CHARS_PER_TOKEN) if b]
+    return min(budgets) if budgets else None
+
+
+def _text_end(transcript: Transcript, start: int, budget: int) -> int:
+    # Lines [start, j) render to offsets[j] - offsets[start] - 1 characters,
+    # so the last line that fits is found by bisecting the offset column.
+    offsets = transcript.offsets
+    end = bisect_right(offsets, offsets[start] + budget + 1, start + 1) - 1
+    return max(end, start + 1)
+
+
+def _json_rows(transcript: Transcript, start: int, budget: int) -> tuple[list[str], int]:
+    rows: list[str] = []
+    used = 2  # surrounding brackets
+    end = start
+    while end < len(transcript):
+        row = json.dumps(
+            {
+                "text": transcript.text_at(end),
+                "start": transcript.starts[end],
+                "duration": transcript.durations[end],
+            }
+        )
+        used += len(row) + (2 if rows else 0)
+        if rows and used > budget:
+            break
+        rows.append(row)
+        end += 1
+    return rows, end
+
+
+@metrics.staged(metrics.FORMAT)
+def page(
+    transcript: Transcript,
+    kind: str,
+    start: int,
+    budget: int,
+    language: str,
+    normalize: str = "none",
+) -> dict[str, Any]:
+    """Render lines from ``start`` within ``budget`` characters.
+
+    ``language`` is the requested language spec (as in the cache key) and
+    ``normalize`` the normalization mode ``transcript`` was rendered with;
+    the continuation cursor carries both forward, along with ``budget``.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+    total = len(transcript)
+    if start >= total:
+        content, end = ("" if kind == "text" else "[]"), total
+    elif kind == "text":
+        end = _text_end(transcript, start, budget)
+        content = transcript.blob[transcript.offsets[start] : transcript.offsets[end] - 1]
+    else:
+        rows, end = _json_rows(transcript, start, budget)
+        content = "[" + ", ".join(rows) + "]"
+    return {
+        "content": content,
+        "start_index": start,
+        "end_index": end,
+        "total_segments": total,
+        "next_cursor": (
+            encode_cursor(transcript.video_id, language, kind, end, budget, normalize)
+            if end < total
+            else None
+        ),
+    }
@@ -0,0 +1,170 @@
+"""Adaptive upstream rate limiting with retries.
+
+Every upstream call takes a token from one shared bucket. When YouTube
+throttles (429 / IP or request blocked) the refill rate is cut
+multiplicatively; each success raises it additively back toward the ceiling
+(AIMD). Throttled and transient failures are retried with full-jitter
+exponential backoff, bounded per request by an attempt count and a total
+sleep budget.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from .errors import THROTTLE_ERRORS, TRANSIENT_ERRORS
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """Token bucket with AIMD rate adaptation and a per-request retry budget.
+
+    ``rate`` is the ceiling in requests per second (0 disables limiting, but
+    retries still apply); ``burst`` is the bucket size. Thread-safe; waiting
+    callers sleep outside the lock.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: float = 20.0,
+        min_rate: float = 0.2,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_budget: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.configure(
+            rate=rate,
+            burst=burst,
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            retry_budget=retry_budget,
+        )
+        self._tokens = self.burst
+        self._updated = clock()
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def configure(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        max_attempts: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        retry_budget: float | None = None,
+    ) -> None:
+        with self._lock:
+            if rate is not None:
+                self.max_rate = rate
+                self.rate = rate
+            if burst is not None:
+                self.burst = max(1.0, burst)
+            if max_attempts is not None:
+                self.max_attempts = max(1, max_attempts)
+            if base_delay is not None:
+                self.base_delay = base_delay
+            if max_delay is not None:
+                self.max_delay = max_delay
+            if retry_budget is not None:
+                self.retry_budget = retry_budget
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_rate > 0
+
+    def _reserve(self) -> float:
+        """Take a token; return how long the caller must wait before using it."""
+        with self._lock:
+            if not self.enabled:
+                return 0.0
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Tokens go negative to queue callers in arrival order.
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            with self._lock:
+                self.waited += delay
+            self._sleep(delay)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.enabled:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttled += 1
+            if self.enabled:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return ceiling * self._rng()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` under the limiter, retrying throttled/transient failures."""
+        slept = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            self.acquire()
+            with self._lock:
+                self.calls += 1
+            try:
+                result = fn(*args, **kwargs)
+            except THROTTLE_ERRORS + TRANSIENT_ERRORS as e:
+                if isinstance(e, THROTTLE_ERRORS):
+                    self.on_throttle()
+                delay = self.backoff(attempt)
+                if attempt >= self.max_attempts or slept + delay > self.retry_budget:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                slept += delay
+                self._sleep(delay)
+                continue
+            self.on_success()
+            return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "calls": self.calls,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "waited": round(self.waited, 3),
+            }
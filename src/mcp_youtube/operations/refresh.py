@@ -0,0 +1,189 @@
+"""Background revalidation of stale cache entries (stale-while-revalidate).
+
+A request that finds an expired entry still inside the cache's stale window
+is answered from it at once and asks the ``RefreshScheduler`` to refresh the
+key. Refreshes run on a few daemon threads, at most ``budget`` started per
+``interval`` seconds, hottest keys first (most stale hits while waiting), and
+never more than one per key at a time. Keys that miss out stay stale and are
+requested again on their next hit, until the stale window runs out and they
+become ordinary misses.
+
+A refresh reports whether the content actually changed, judged by comparing
+content hashes, so ``stats()`` separates refreshes that only extended a TTL
+from real changes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+
+class RefreshScheduler:
+    """Budgeted background refreshes on up to ``workers`` threads.
+
+    ``budget`` of 0 disables refreshing: ``request`` queues nothing.
+    """
+
+    def __init__(
+        self,
+        budget: int = 10,
+        interval: float = 60.0,
+        workers: int = 2,
+        max_pending: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget = budget
+        self.interval = interval
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._clock = clock
+        self._cond = threading.Condition()
+        # key -> [stale hits while waiting, refresh callable]
+        self._pending: dict[Hashable, list[Any]] = {}
+        self._running: set[Hashable] = set()
+        self._window_start = float("-inf")
+        self._used = 0
+        self._threads = 0  # worker threads started (they live for the process)
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.requested = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.refreshed = 0
+        self.changed = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget > 0
+
+    def request(self, key: Hashable, refresh: Callable[[], bool]) -> bool:
+        """Ask for ``key`` to be refreshed by calling ``refresh``.
+
+        ``refresh`` returns whether the content changed. Returns False when
+        nothing new was queued: refreshing is disabled, the key is already
+        queued or running, or the queue is full.
+        """
+        with self._cond:
+            if not self.enabled:
+                return False
+            self.requested += 1
+            if key in self._running:
+                self.coalesced += 1
+                return False
+            if key in self._pending:
+                self._pending[key][0] += 1
+                self.coalesced += 1
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending[key] = [1, refresh]
+            # Workers are started lazily, one per queued key up to ``workers``.
+            if self._threads < min(self.workers, len(self._pending) + len(self._running)):
+                self._threads += 1
+                threading.Thread(
+                    target=self._run, name="mcp-youtube-refresh", daemon=True
+                ).start()
+            self._cond.notify_all()
+            return True
+
+    def _next(self) -> tuple[Hashable, Callable[[], bool]]:
+        with self._cond:
+            while True:
+                now = self._clock()
+                if now >= self._window_start + self.interval:
+                    self._window_start, self._used = now, 0
+                if self._pending and self._used < self.budget:
+                    break
+                # Sleep until there is work and budget for it.
+                self._cond.wait(
+                    self._window_start + self.interval - now if self._pending else None
+                )
+            key = max(self._pending, key=lambda k: self._pending[k][0])
+            _, refresh = self._pending.pop(key)
+            self._running.add(key)
+            self._used += 1
+            return key, refresh
+
+    def _run(self) -> None:
+        while True:
+            key, refresh = self._next()
+            try:
+                changed = refresh()
+            except Exception:
+                # The entry stays stale; its next hit asks again.
+                with self._cond:
+                    self.failed += 1
+            else:
+                with self._cond:
+                    self.refreshed += 1
+                    self.changed += bool(changed)
+            finally:
+                with self._cond:
+                    self._running.discard(key)
+                    self._cond.notify_all()
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """Block until nothing is queued or running. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def configure(
+        self,
+        budget: Optional[int] = None,
+        interval: Optional[float] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """Change limits in place. ``workers`` can only grow; new ones start as work is queued."""
+        with self._cond:
+            if budget is not None:
+                self.budget = budget
+            if interval is not None:
+                self.interval = interval
+            if workers is not None:
+                self.workers = max(self.workers, workers)
+            if max_pending is not None:
+                self.max_pending = max_pending
+            if not self.enabled:
+                self._pending.clear()
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        """Drop queued refreshes, reset counters and start a fresh budget window.
+
+        Running refreshes finish.
+        """
+        with self._cond:
+            self._pending.clear()
+            self._reset_counters()
+            self._window_start = float("-inf")
+            self._used = 0
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "budget": self.budget,
+                "interval": self.interval,
+                "workers": self._threads,
+                "pending": len(self._pending),
+                "running": len(self._running),
+                "requested": self.requested,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "refreshed": self.refreshed,
+                "changed": self.changed,
+                "unchanged": self.refreshed - self.changed,
+                "failed": self.failed,
+            }
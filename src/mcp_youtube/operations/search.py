@@ -0,0 +1,110 @@
+"""Per-transcript search index.
+
+The index is one normalized (casefolded, whitespace-collapsed) string of the
+whole transcript, lines joined by a single space, plus a column of line start
+offsets. It is built once and cached on the Transcript, so repeated queries
+skip re-lowercasing every line, and phrases split across two caption lines
+still match.
+
+Several terms are matched in a single pass with one compiled alternation
+(longest term first), evaluated by the C regex engine.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, Sequence
+
+from . import formats
+from .compact import Transcript
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+class SearchIndex:
+    __slots__ = ("text", "line_offsets")
+
+    def __init__(self, text: str, line_offsets: array):
+        self.text = text
+        self.line_offsets = line_offsets
+
+    @classmethod
+    def build(cls, transcript: Transcript) -> SearchIndex:
+        parts = []
+        line_offsets = array("q")
+        position = 0
+        for text in transcript.texts():
+            part = normalize(text)
+            line_offsets.append(position)
+            parts.append(part)
+            position += len(part) + 1
+        return cls(" ".join(parts), line_offsets)
+
+    def nbytes(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return sys.getsizeof(self.text) + self.line_offsets.itemsize * len(self.line_offsets)
+
+    def line_at(self, position: int) -> int:
+        """Index of the caption line containing character ``position``."""
+        return bisect_right(self.line_offsets, position) - 1
+
+    def find(self, terms: Iterable[str]) -> list[tuple[int, int, str]]:
+        """Return ``(first_line, last_line, term)`` for every match, in text order."""
+        normalized = sorted({normalize(t) for t in terms} - {""}, key=len, reverse=True)
+        if not normalized:
+            return []
+        pattern = re.compile(
+            "(?=(" + "|".join(re.escape(term) for term in normalized) + "))"
+        )
+        hits = []
+        for match in pattern.finditer(self.text):
+            term = match.group(1)
+            start = match.start()
+            hits.append((self.line_at(start), self.line_at(start + len(term) - 1), term))
+        return hits
+
+
+def index_for(transcript: Transcript) -> SearchIndex:
+    """The transcript's search index, built on first use."""
+    return transcript.derived("search_index", SearchIndex.build)
+
+
+def search(
+    transcript: Transcript, terms: str | Sequence[str], context: float = 0
+) -> list[dict[str, Any]]:
+    """Search one or more terms; one result per matching line span, in time order.
+
+    Each result has ``timestamp``, ``start`` and the matched line ``text``
+    (several lines when a phrase crosses a caption boundary). With several
+    terms, ``terms`` lists which ones hit; with ``context`` > 0, ``context``
+    holds the text of lines starting within ±``context`` seconds.
+    """
+    term_list = [terms] if isinstance(terms, str) else list(terms)
+    spans: dict[int, tuple[int, set[str]]] = {}
+    for first, last, term in index_for(transcript).find(term_list):
+        previous_last, hit_terms = spans.get(first, (first, set()))
+        hit_terms.add(term)
+        spans[first] = (max(previous_last, last), hit_terms)
+
+    results = []
+    for first in sorted(spans):
+        last, hit_terms = spans[first]
+        start = transcript.starts[first]
+        result: dict[str, Any] = {
+            "timestamp": formats.timestamp(start),
+            "start": start,
+            "text": " ".join(transcript.texts(first, last + 1)),
+        }
+        if len(term_list) > 1:
+            result["terms"] = sorted(hit_terms)
+        if context > 0:
+            end = transcript.starts[last] + transcript.durations[last]
+            window = transcript.find_range(start - context, end + context)
+            result["context"] = " ".join(transcript.text_at(i) for i in window)
+        results.append(result)
+    return results
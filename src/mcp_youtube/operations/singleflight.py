@@ -0,0 +1,94 @@
+"""Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight execution and
+receive its result (or its exception). Works for threads via ``do`` and for
+asyncio tasks via ``do_async``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls by key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` once per key across threads; other callers wait for it."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+            else:
+                self.followers += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._forget_call(key)
+            future.set_exception(e)
+            raise
+        self._forget_call(key)
+        future.set_result(result)
+        return result
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run coroutine function ``fn`` once per key across tasks on this loop.
+
+        The shared task is shielded, so cancelling one waiter does not cancel
+        the upstream call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = loop.create_task(fn(*args, **kwargs))
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda t: self._forget_task(task_key, t))
+                self.leaders += 1
+            else:
+                self.followers += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
+
+    def _forget_call(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def _forget_task(self, task_key: tuple[int, Hashable], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
@@ -0,0 +1,179 @@
+"""Persistent on-disk transcript store backed by SQLite.
+
+Optional second cache tier that survives process restarts. Segment data is
+stored as compressed ``Transcript`` columns, keyed by (video_id, language,
+is_generated). The database runs in WAL mode so several server processes can
+share one file.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from typing import Any, Iterator, Optional
+
+from .compact import Transcript
+from .db import ThreadConnections
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT NOT NULL,
+    language_code TEXT NOT NULL,
+    is_generated INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (video_id, language_code, is_generated)
+);
+CREATE INDEX IF NOT EXISTS transcripts_accessed ON transcripts (accessed_at);
+"""
+
+
+class TranscriptStore:
+    """SQLite transcript store with size-based (least recently used) eviction.
+
+    Connections are opened lazily, one per thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        self._db = ThreadConnections(path, _SCHEMA)
+        self.path = self._db.path
+        self.max_bytes = max_bytes
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._db.get()
+
+    def get(self, video_id: str, language: str) -> Optional[Transcript]:
+        """Return the stored transcript (manual preferred over generated) or None."""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT is_generated, language, data FROM transcripts "
+            "WHERE video_id = ? AND language_code = ? "
+            "ORDER BY is_generated LIMIT 1",
+            (video_id, language),
+        ).fetchone()
+        if row is None:
+            return None
+        is_generated, language_name, data = row
+        conn.execute(
+            "UPDATE transcripts SET accessed_at = ? "
+            "WHERE video_id = ? AND language_code = ? AND is_generated = ?",
+            (time.time(), video_id, language, is_generated),
+        )
+        return Transcript.from_bytes(
+            data,
+            video_id=video_id,
+            language=language_name,
+            language_code=language,
+            is_generated=bool(is_generated),
+        )
+
+    def put(self, transcript: Transcript) -> None:
+        """Insert or replace a transcript, then evict if over budget."""
+        data = transcript.to_bytes()
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                transcript.video_id,
+                transcript.language_code,
+                int(transcript.is_generated),
+                transcript.language,
+                data,
+                len(data),
+                now,
+                now,
+            ),
+        )
+        self.prune()
+
+    def delete(self, video_id: str, language: Optional[str] = None) -> int:
+        """Remove a video's transcripts (one language or all). Returns row count."""
+        if language is None:
+            cur = self._conn().execute(
+                "DELETE FROM transcripts WHERE video_id = ?", (video_id,)
+            )
+        else:
+            cur = self._conn().execute(
+                "DELETE FROM transcripts WHERE video_id = ? AND language_code = ?",
+                (video_id, language),
+            )
+        return cur.rowcount
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently accessed rows until under ``max_bytes``."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+        if total <= budget:
+            return 0
+        removed = 0
+        rows = conn.execute(
+            "SELECT video_id, language_code, is_generated, size FROM transcripts "
+            "ORDER BY accessed_at"
+        ).fetchall()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for video_id, language_code, is_generated, size in rows:
+                if total <= budget:
+                    break
+                conn.execute(
+                    "DELETE FROM transcripts "
+                    "WHERE video_id = ? AND language_code = ? AND is_generated = ?",
+                    (video_id, language_code, is_generated),
+                )
+                total -= size
+                removed += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def clear(self) -> int:
+        return self._conn().execute("DELETE FROM transcripts").rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Row count, compressed payload bytes and on-disk file size."""
+        entries, videos, size = self._conn().execute(
+            "SELECT COUNT(*), COUNT(DISTINCT video_id), COALESCE(SUM(size), 0) "
+            "FROM transcripts"
+        ).fetchone()
+        file_bytes = sum(
+            os.path.getsize(p)
+            for p in (self.path, self.path + "-wal")
+            if os.path.exists(p)
+        )
+        return {
+            "path": self.path,
+            "entries": entries,
+            "videos": videos,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "file_bytes": file_bytes,
+        }
+
+    def export(self) -> Iterator[dict[str, Any]]:
+        """Yield every stored transcript as a JSON-serializable dict."""
+        cursor = self._conn().execute(
+            "SELECT video_id, language_code, is_generated, language, data, fetched_at "
+            "FROM transcripts ORDER BY video_id, language_code"
+        )
+        for video_id, language_code, is_generated, language, data, fetched_at in cursor:
+            transcript = Transcript.from_bytes(data)
+            yield {
+                "video_id": video_id,
+                "language": language,
+                "language_code": language_code,
+                "is_generated": bool(is_generated),
+                "fetched_at": fetched_at,
+                "segments": [
+                    [start, duration, text] for text, start, duration in transcript
+                ],
+            }
+
+    def close(self) -> None:
+        self._db.close()
@@ -2,20 +2,103 @@
 
 No auth required. Uses youtube-transcript-api for public video transcripts.
 The library uses an instance-based API: YouTubeTranscriptApi().fetch() / .list().
-Formatters expect FetchedTranscript objects; raw data ops use .to_raw_data().
+Fetched transcripts are converted once to the columnar compact.Transcript,
+which is what the cache, the store and every operation below work on.
 """
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Any
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import JSONFormatter, TextFormatter
+from youtube_transcript_api import NoTranscriptFound
 
-# Singleton API instance
-_api = YouTubeTranscriptApi()
+from . import chunking, formats, languages, metrics, paging
+from . import normalize as _normalize
+from .breaker import CircuitBreaker
+from .cache import TranscriptCache
+from .compact import Transcript, digest
+from .config import env_float, env_int, env_str
+from .corpus import CorpusIndex
+from .errors import classify, detached, is_permanent
+from .http import HttpConfig, UpstreamClient
+from .languages import Languages, preferences as _preferences
+from .ratelimit import RateLimiter
+from .refresh import RefreshScheduler
+from .search import search as _search
+from .singleflight import SingleFlight
+from .store import TranscriptStore
+
+# Singleton API client: per-thread YouTubeTranscriptApi instances sharing one
+# keep-alive connection pool (see operations.http)
+_api = UpstreamClient(HttpConfig.from_env())
+
+# Shared transcript cache, keyed by (video_id, language)
+_cache = TranscriptCache(
+    max_entries=env_int("MCP_YOUTUBE_CACHE_MAX_ENTRIES", 256),
+    max_bytes=env_int("MCP_YOUTUBE_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+    ttl=env_float("MCP_YOUTUBE_CACHE_TTL", 3600.0),
+    # Expired entries are served for this long while they are revalidated
+    stale_ttl=env_float("MCP_YOUTUBE_CACHE_STALE_TTL", 86400.0),
+)
+
+# Background refreshes of stale transcripts and listings, hottest first,
+# at most MCP_YOUTUBE_REFRESH_BUDGET per interval (0 disables revalidation)
+_refresher = RefreshScheduler(
+    budget=env_int("MCP_YOUTUBE_REFRESH_BUDGET", 10),
+    interval=env_float("MCP_YOUTUBE_REFRESH_INTERVAL", 60.0),
+    workers=env_int("MCP_YOUTUBE_REFRESH_WORKERS", 2),
+)
+
+# Shared limiter and retry policy for every upstream call
+_limiter = RateLimiter(
+    rate=env_float("MCP_YOUTUBE_RATE_LIMIT", 10.0),
+    burst=env_float("MCP_YOUTUBE_RATE_BURST", 20.0),
+    max_attempts=env_int("MCP_YOUTUBE_RETRY_ATTEMPTS", 4),
+    base_delay=env_float("MCP_YOUTUBE_RETRY_BASE_DELAY", 0.5),
+    max_delay=env_float("MCP_YOUTUBE_RETRY_MAX_DELAY", 30.0),
+    retry_budget=env_float("MCP_YOUTUBE_RETRY_BUDGET", 60.0),
+)
+
+# Known-permanent upstream failures (transcripts disabled, no such language,
+# video unavailable), remembered briefly so retries fail without a round trip
+_negative_cache = TranscriptCache(
+    max_entries=env_int("MCP_YOUTUBE_NEGATIVE_CACHE_MAX_ENTRIES", 1024),
+    ttl=env_float("MCP_YOUTUBE_NEGATIVE_CACHE_TTL", 300.0),
+)
+
+# Hit/miss counters are read by operations.metrics at scrape time
+metrics.register_collector("cache", _cache.stats)
+metrics.register_collector("negative_cache", _negative_cache.stats)
+metrics.register_collector("refresh", _refresher.stats)
+
+# Fail fast while upstream is down (0 disables)
+_breaker = CircuitBreaker(
+    failure_threshold=env_int("MCP_YOUTUBE_BREAKER_THRESHOLD", 5),
+    reset_timeout=env_float("MCP_YOUTUBE_BREAKER_RESET", 30.0),
+)
+
+# Default parallelism for batch operations
+_batch_concurrency = env_int("MCP_YOUTUBE_BATCH_CONCURRENCY", 8)
+
+# Coalesce concurrent upstream requests for the same video
+_fetch_flight = SingleFlight()
+_list_flight = SingleFlight()
+
+# Optional persistent store shared across processes (disabled unless configured)
+_store: TranscriptStore | None = None
+if env_str("MCP_YOUTUBE_STORE_PATH"):
+    _store = TranscriptStore(
+        env_str("MCP_YOUTUBE_STORE_PATH"),
+        max_bytes=env_int("MCP_YOUTUBE_STORE_MAX_BYTES", 512 * 1024 * 1024),
+    )
+
+# Optional cross-video search index; every fetched transcript is added to it
+_corpus: CorpusIndex | None = None
+if env_str("MCP_YOUTUBE_CORPUS_PATH"):
+    _corpus = CorpusIndex(env_str("MCP_YOUTUBE_CORPUS_PATH"))
 
 
 def extract_video_id(url_or_id: str) -> str:
@@ -35,31 +118,399 @@ def extract_video_id(url_or_id: str) -> str:
     return url_or_id
 
 
-def _fetch(video_url: str, language: str = "en"):
-    """Fetch FetchedTranscript object (pass to formatters or iterate)."""
+def _cache_key(
+    video_url: str, language: Languages, translate: bool = False
+) -> tuple[str, str]:
+    return extract_video_id(video_url), languages.spec(
+        languages.preferences(language), translate
+    )
+
+
+def _fetch(
+    video_url: str, language: Languages = "en", translate: bool = False
+) -> Transcript:
+    """Fetch a compact Transcript.
+
+    ``language`` is a code or a preference list, resolved as described in
+    ``operations.languages``; ``translate`` allows falling back to a
+    translation. Served from the in-process cache, then the persistent store
+    (if enabled), before going upstream. Concurrent misses for the same key
+    share a single upstream request. An expired entry within the stale window
+    is served as-is while it is refreshed in the background.
+    """
+    key = _cache_key(video_url, language, translate)
+    transcript = _cached(key, _refresh_transcript)
+    if transcript is not None:
+        return transcript
+    return _fetch_flight.do(key, _load, key)
+
+
+def _cached(key: tuple[str, str | None], refresh: Callable[[Any], bool]) -> Any:
+    """Cached value for ``key`` or None; a stale one is queued for ``refresh(key)``."""
+    found = _cache.lookup(key, stale=_refresher.enabled)
+    if found is None:
+        return None
+    value, stale = found
+    if stale:
+        _refresher.request(key, lambda: refresh(key))
+    return value
+
+
+def _upstream(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call upstream through the circuit breaker and rate limiter."""
+    call = getattr(fn, "__name__", "call")
+    metrics.upstream_request(call)
+    try:
+        with metrics.stage(metrics.FETCH):
+            return _breaker.call(_limiter.call, fn, *args, **kwargs)
+    except Exception as e:
+        metrics.upstream_error(call, classify(e)[0])
+        raise
+
+
+def _remembering_failures(key: tuple[str, str | None], fn: Callable[[], Any]) -> Any:
+    """Run ``fn``, negatively caching permanent failures under ``key``.
+
+    ``key`` is ``(video_id, language spec)`` for fetches and
+    ``(video_id, None)`` for listings.
+    """
+    error = _negative_cache.get(key)
+    if error is not None:
+        raise detached(error)
+    try:
+        return fn()
+    except Exception as e:
+        if is_permanent(e):
+            _negative_cache.put(key, detached(e))
+        raise
+
+
+def _load(key: tuple[str, str]) -> Transcript:
+    """Cache-miss path for ``_fetch``; runs once per key at a time."""
+    # A previous flight may have filled the cache since our lookup.
+    transcript = _cache.peek(key)
+    if transcript is not None:
+        return transcript
+    video_id, spec = key
+    codes, translate = languages.parse_spec(spec)
+    transcript, how = _remembering_failures(
+        key, lambda: _resolve(video_id, codes, translate)
+    )
+    if _corpus is not None and not _corpus.contains(video_id, transcript.language_code):
+        _corpus.add(transcript)
+    _remember(key, transcript, how)
+    return transcript
+
+
+def _remember(key: tuple[str, str], transcript: Transcript, how: str) -> None:
+    keys = [key]
+    if transcript.language_code != key[1] and how != languages.TRANSLATION:
+        # Also serve later requests for exactly the language that matched.
+        # A translation is not that language's own track, so it is only
+        # served to requests that allow translating.
+        keys.append((key[0], transcript.language_code))
+    for k in keys:
+        _cache.put(k, transcript, transcript.nbytes())
+
+    def grew() -> None:
+        # Search indexes and normalized views count against the byte budget.
+        for k in keys:
+            _cache.resize(k, transcript, transcript.nbytes())
+
+    transcript.watch(grew)
+
+
+def _refresh_transcript(key: tuple[str, str]) -> bool:
+    """Refetch a stale transcript from upstream. Returns whether it changed.
+
+    An unchanged transcript keeps its cached object, and with it any derived
+    indexes; only its TTL is renewed.
+    """
+    video_id, spec = key
+    codes, translate = languages.parse_spec(spec)
+    old = _cache.peek(key, stale=True)
+    try:
+        transcript, how = _resolve_upstream(video_id, codes, translate)
+    except Exception as e:
+        if is_permanent(e):
+            # Gone upstream: stop serving the stale copy.
+            _cache.invalidate(key)
+        raise
+    changed = old is None or old.content_hash() != transcript.content_hash()
+    if not changed:
+        transcript = old
+    elif _corpus is not None:
+        _corpus.add(transcript)
+    _remember(key, transcript, how)
+    return changed
+
+
+def _resolve(
+    video_id: str, codes: Sequence[str], translate: bool
+) -> tuple[Transcript, str]:
+    """Store, then upstream (see ``_resolve_upstream``).
+
+    The store only answers single-code requests: for a preference list, the
+    first stored code is not necessarily the track ``languages.match`` would
+    pick, so lists are resolved against the video's listing.
+    """
+    if _store is not None and len(codes) == 1:
+        with metrics.stage(metrics.FETCH):
+            transcript = _store.get(video_id, codes[0])
+        if transcript is not None:
+            return transcript, languages.EXACT
+    return _resolve_upstream(video_id, codes, translate)
+
+
+def _resolve_upstream(
+    video_id: str, codes: Sequence[str], translate: bool
+) -> tuple[Transcript, str]:
+    """Upstream, with at most one listing per video; returns ``(transcript, how)``.
+
+    ``how`` is the ``languages.match`` result kind. Without a cached
+    TranscriptList, the library's own fetch lists and fetches the exact-match
+    track in one call. Only if that finds nothing is the listing it returned
+    used to try regional variants and translations. Native tracks are written
+    to the store; translations are not, since the store is keyed by language
+    and would otherwise answer plain requests for it.
+    """
+    how = languages.EXACT
+    transcript_list = _cache.peek((video_id, None))
+    if transcript_list is None:
+        try:
+            fetched = _upstream(_api.fetch, video_id, languages=list(codes))
+        except NoTranscriptFound as e:
+            transcript_list = getattr(e, "_transcript_data", None)
+            if transcript_list is None:
+                raise
+            _remember_list(video_id, transcript_list)
+    if transcript_list is not None:
+        track, how = languages.match(transcript_list, codes, translate)
+        fetched = _upstream(_api.bind(track).fetch)
+    with metrics.stage(metrics.PARSE):
+        transcript = Transcript.from_fetched(fetched)
+    if _store is not None and how != languages.TRANSLATION:
+        _store.put(transcript)
+    return transcript, how
+
+
+def cache_stats() -> dict[str, Any]:
+    """Return transcript cache size and hit/miss counters."""
+    return _cache.stats()
+
+
+def refresh_stats() -> dict[str, Any]:
+    """Background refresh counters: requested, refreshed, changed, unchanged, failed."""
+    return _refresher.stats()
+
+
+def configure_refresh(
+    budget: int | None = None,
+    interval: float | None = None,
+    stale_ttl: float | None = None,
+    workers: int | None = None,
+) -> None:
+    """Adjust stale-while-revalidate: refreshes per ``interval``, the stale window
+    and refresh threads.
+
+    A ``budget`` of 0 turns revalidation off; expired entries are then misses.
+    """
+    _refresher.configure(budget=budget, interval=interval, workers=workers)
+    _cache.configure(stale_ttl=stale_ttl)
+
+
+def configure_cache(
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+    ttl: float | None = None,
+) -> None:
+    """Adjust transcript cache limits at runtime (0 disables caching)."""
+    _cache.configure(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+
+
+def configure_store(path: str | None, max_bytes: int | None = None) -> None:
+    """Enable the persistent SQLite store at ``path`` (None disables it)."""
+    global _store
+    if _store is not None:
+        _store.close()
+    _store = None
+    if path:
+        _store = TranscriptStore(
+            path, max_bytes=max_bytes if max_bytes is not None else 512 * 1024 * 1024
+        )
+
+
+def configure_corpus(path: str | None) -> None:
+    """Enable the cross-video corpus index at ``path`` (None disables it)."""
+    global _corpus
+    if _corpus is not None:
+        _corpus.close()
+    _corpus = CorpusIndex(path) if path else None
+
+
+def configure_rate_limit(
+    rate: float | None = None,
+    burst: float | None = None,
+    max_attempts: int | None = None,
+    base_delay: float | None = None,
+    max_delay: float | None = None,
+    retry_budget: float | None = None,
+) -> None:
+    """Adjust the upstream rate limit (requests/s, 0 disables) and retry policy."""
+    _limiter.configure(
+        rate=rate,
+        burst=burst,
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        retry_budget=retry_budget,
+    )
+
+
+def configure_http(
+    pool_size: int | None = None,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    proxies: Sequence[str] | None = None,
+) -> None:
+    """Adjust the upstream connection pool, timeouts and proxy rotation."""
+    changes: dict[str, Any] = {
+        "pool_size": pool_size,
+        "connect_timeout": connect_timeout,
+        "read_timeout": read_timeout,
+        "proxies": tuple(proxies) if proxies is not None else None,
+    }
+    _api.configure(
+        _api.config._replace(**{k: v for k, v in changes.items() if v is not None})
+    )
+
+
+def rate_limit_stats() -> dict[str, Any]:
+    """Current adaptive rate plus call, retry and throttle counters."""
+    return _limiter.stats()
+
+
+def configure_circuit_breaker(
+    failure_threshold: int | None = None, reset_timeout: float | None = None
+) -> None:
+    """Adjust the upstream circuit breaker (threshold 0 disables it)."""
+    if failure_threshold is not None:
+        _breaker.failure_threshold = failure_threshold
+    if reset_timeout is not None:
+        _breaker.reset_timeout = reset_timeout
+    _breaker.reset()
+
+
+def upstream_stats() -> dict[str, Any]:
+    """Rate limiter, circuit breaker and negative cache state."""
+    return {
+        "http": _api.stats(),
+        "rate_limit": _limiter.stats(),
+        "circuit_breaker": _breaker.stats(),
+        "negative_cache": _negative_cache.stats(),
+    }
+
+
+def invalidate_cache(video_url: str, language: str | None = None) -> int:
+    """Drop cached transcripts for a video (one language or all). Returns count.
+
+    For one language, every entry that could serve it goes: preference-list
+    and translate keys naming it, and entries holding a track in it. Also
+    removes the video from the persistent store when enabled.
+    """
     video_id = extract_video_id(video_url)
-    return _api.fetch(video_id, languages=[language])
+    if _store is not None:
+        _store.delete(video_id, language)
+    _negative_cache.invalidate_video(video_id)
+    if language is None:
+        return _cache.invalidate_video(video_id)
 
+    def serves(key: tuple[str, str | None], value: Any) -> bool:
+        if key[1] is None:  # the listing
+            return False
+        return (
+            language in languages.parse_spec(key[1])[0]
+            or getattr(value, "language_code", None) == language
+        )
 
-def get_transcript(video_url: str, language: str = "en") -> str:
-    """Get full transcript as plain text."""
-    transcript = _fetch(video_url, language)
-    formatter = TextFormatter()
-    return formatter.format_transcript(transcript)
+    return _cache.invalidate_video(video_id, serves)
 
 
-def get_transcript_with_timestamps(video_url: str, language: str = "en") -> str:
-    """Get transcript with timestamps in JSON format."""
-    transcript = _fetch(video_url, language)
-    formatter = JSONFormatter()
-    return formatter.format_transcript(transcript)
+def clear_cache() -> None:
+    """Drop every cached transcript and remembered failure, and reset counters."""
+    _cache.clear()
+    _negative_cache.clear()
+    _refresher.clear()
 
 
-def list_available_transcripts(video_url: str) -> list[dict[str, Any]]:
-    """List all available transcript languages for a video."""
+def _list(video_url: str):
+    """Fetch the TranscriptList for a video, cached and coalesced."""
     video_id = extract_video_id(video_url)
-    transcript_list = _api.list(video_id)
+    transcript_list = _cached((video_id, None), _refresh_list)
+    if transcript_list is not None:
+        return transcript_list
+    return _list_flight.do(video_id, _load_list, video_id)
 
+
+def _load_list(video_id: str):
+    key = (video_id, None)
+    transcript_list = _cache.peek(key)
+    if transcript_list is None:
+        transcript_list = _remembering_failures(
+            key, lambda: _upstream(_api.list, video_id)
+        )
+        _remember_list(video_id, transcript_list)
+    return transcript_list
+
+
+def _remember_list(video_id: str, transcript_list) -> None:
+    # Cached alongside transcripts under (video_id, None); a listing is small.
+    _cache.put((video_id, None), transcript_list, 1024)
+
+
+def _list_hash(transcript_list) -> str:
+    return digest(
+        "|".join(
+            (
+                track.language_code,
+                str(track.is_generated),
+                str(track.is_translatable),
+                ",".join(lang.language_code for lang in track.translation_languages),
+            )
+        ).encode("utf-8")
+        for track in transcript_list
+    )
+
+
+def _refresh_list(key: tuple[str, None]) -> bool:
+    """Relist a stale video. Returns whether its tracks changed."""
+    video_id = key[0]
+    old = _cache.peek(key, stale=True)
+    try:
+        transcript_list = _upstream(_api.list, video_id)
+    except Exception as e:
+        if is_permanent(e):
+            _cache.invalidate(key)
+        raise
+    # Keep the new listing either way: its track URLs are the freshest.
+    _remember_list(video_id, transcript_list)
+    return old is None or _list_hash(old) != _list_hash(transcript_list)
+
+
+# Renderers: pure functions over an already-fetched transcript, shared with
+# the async operations layer.
+
+_search_entries = metrics.staged(metrics.SEARCH)(_search)
+
+
+@metrics.staged(metrics.FORMAT)
+def _render_text(transcript: Transcript) -> str:
+    # Lines are stored newline-joined, which is exactly the plain-text form.
+    return transcript.blob
+
+
+@metrics.staged(metrics.FORMAT)
+def _describe_transcripts(transcript_list) -> list[dict[str, Any]]:
     available = []
     for transcript in transcript_list:
         available.append(
@@ -73,38 +524,462 @@ def list_available_transcripts(video_url: str) -> list[dict[str, Any]]:
     return available
 
 
-def get_transcript_segment(
-    video_url: str, start_time: int, end_time: int, language: str = "en"
+SEGMENT_MODES = ("start", "overlap")
+
+
+@metrics.staged(metrics.FORMAT)
+def _segment_text(
+    transcript: Transcript, start_time: float, end_time: float, mode: str = "start"
 ) -> str:
-    """Get transcript segment between specific timestamps (seconds)."""
-    transcript = _fetch(video_url, language)
-    raw = transcript.to_raw_data()
-
-    filtered = [
-        entry["text"]
-        for entry in raw
-        if start_time <= entry["start"] <= end_time
+    if mode not in SEGMENT_MODES:
+        raise ValueError(f"mode must be one of {SEGMENT_MODES}, got {mode!r}")
+    indices = transcript.find_range(start_time, end_time, overlap=mode == "overlap")
+    return " ".join(transcript.text_at(i) for i in indices)
+
+
+def _segments(
+    transcript: Transcript, ranges: Iterable[Sequence[float]], mode: str = "start"
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "start_time": start_time,
+            "end_time": end_time,
+            "text": _segment_text(transcript, start_time, end_time, mode),
+        }
+        for start_time, end_time in ranges
     ]
-    return " ".join(filtered)
 
 
+@metrics.operation
+def get_transcript(
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    normalize: str = "none",
+) -> str:
+    """Get full transcript as plain text.
+
+    ``language`` may be a preference list such as ``["en-US", "en"]``; with
+    ``translate``, a translation is used when no listed language exists.
+    ``normalize`` cleans and merges caption lines (see ``operations.normalize``).
+    """
+    _normalize.check(normalize)
+    return _render_text(_normalize.apply(_fetch(video_url, language, translate), normalize))
+
+
+@metrics.operation
+def get_transcript_with_timestamps(
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    format: str = "json",
+    normalize: str = "none",
+) -> str:
+    """Get transcript with timestamps.
+
+    ``format`` is one of ``formats.FORMATS``: ``"json"`` (a list of
+    ``{text, start, duration}``), ``"compact"`` (``[[start, duration, text],
+    ...]``), ``"ndjson"``, ``"srt"`` or ``"vtt"``.
+    """
+    formats.check_format(format)
+    _normalize.check(normalize)
+    transcript = _normalize.apply(_fetch(video_url, language, translate), normalize)
+    return formats.render(transcript, format)
+
+
+def _page_request(
+    video_url: str,
+    language: Languages,
+    translate: bool,
+    max_chars: int | None,
+    max_tokens: int | None,
+    cursor: str | None,
+    kind: str,
+    normalize: str = "none",
+) -> tuple[str, str, str, int, int, str]:
+    """Resolve ``(video_id, language spec, kind, start, budget, normalize)`` for a page.
+
+    A cursor carries the budget it was cut with; ``max_chars``/``max_tokens``
+    override it when given.
+    """
+    budget = paging.char_budget(max_chars, max_tokens)
+    if cursor:
+        video_id, spec, kind, start, cursor_budget, normalize = paging.decode_cursor(cursor)
+        if video_url and extract_video_id(video_url) != video_id:
+            raise ValueError("cursor belongs to a different video")
+        budget = budget or cursor_budget
+    elif budget is None:
+        raise ValueError("max_chars or max_tokens must be a positive number")
+    else:
+        (video_id, spec), start = _cache_key(video_url, language, translate), 0
+    _normalize.check(normalize)
+    return video_id, spec, kind, start, budget, normalize
+
+
+@metrics.operation
+def get_transcript_page(
+    video_url: str,
+    language: Languages = "en",
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    timestamps: bool = False,
+    translate: bool = False,
+    normalize: str = "none",
+) -> dict[str, Any]:
+    """Get one budgeted page of a transcript.
+
+    The page holds whole lines up to ``max_chars`` characters (or roughly
+    ``max_tokens`` tokens), as plain text or, with ``timestamps``, a JSON
+    array. Pass the returned ``next_cursor`` back to continue; it keeps the
+    budget, and continuation pages are cut from the cached transcript,
+    normalized as the first page was. ``next_cursor`` is None on the last page.
+    """
+    video_id, spec, kind, start, budget, normalize = _page_request(
+        video_url,
+        language,
+        translate,
+        max_chars,
+        max_tokens,
+        cursor,
+        "json" if timestamps else "text",
+        normalize,
+    )
+    codes, translate = languages.parse_spec(spec)
+    transcript = _normalize.apply(_fetch(video_id, codes, translate), normalize)
+    return paging.page(transcript, kind, start, budget, spec, normalize)
+
+
+@metrics.operation
+def list_available_transcripts(video_url: str) -> list[dict[str, Any]]:
+    """List all available transcript languages for a video."""
+    return _describe_transcripts(_list(video_url))
+
+
+@metrics.operation
+def get_transcript_segment(
+    video_url: str,
+    start_time: int,
+    end_time: int,
+    language: Languages = "en",
+    mode: str = "start",
+) -> str:
+    """Get transcript segment between specific timestamps (seconds).
+
+    ``mode="start"`` keeps lines that start inside the window; ``"overlap"``
+    also keeps lines that straddle either window boundary.
+    """
+    return _segment_text(_fetch(video_url, language), start_time, end_time, mode)
+
+
+@metrics.operation
+def get_transcript_segments(
+    video_url: str,
+    ranges: Iterable[Sequence[float]],
+    language: Languages = "en",
+    mode: str = "start",
+) -> list[dict[str, Any]]:
+    """Get several ``(start_time, end_time)`` windows from one transcript."""
+    return _segments(_fetch(video_url, language), ranges, mode)
+
+
+@metrics.operation
 def search_transcript(
-    video_url: str, search_term: str, language: str = "en"
-) -> list[dict[str, str]]:
-    """Search for a term in transcript. Returns matching segments with timestamps."""
-    transcript = _fetch(video_url, language)
-    raw = transcript.to_raw_data()
-
-    matches = []
-    for entry in raw:
-        if search_term.lower() in entry["text"].lower():
-            timestamp = int(entry["start"])
-            minutes = timestamp // 60
-            seconds = timestamp % 60
-            matches.append(
-                {
-                    "timestamp": f"{minutes}:{seconds:02d}",
-                    "text": entry["text"],
-                }
-            )
-    return matches
+    video_url: str,
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    context: float = 0,
+    normalize: str = "none",
+) -> list[dict[str, Any]]:
+    """Search for a term in transcript. Returns matching segments with timestamps.
+
+    ``search_term`` may be a list to find several terms in one pass. Matching
+    is case-insensitive and phrases may span caption line boundaries; results
+    are in timestamp order. ``context`` adds the text within ±N seconds.
+    With ``normalize``, matches are segments of the normalized transcript.
+    """
+    _normalize.check(normalize)
+    transcript = _normalize.apply(_fetch(video_url, language), normalize)
+    return _search_entries(transcript, search_term, context)
+
+
+# Batch operations: fetch many videos through a bounded worker pool. Failures
+# are reported per item; results carry their input ``index``.
+
+
+def _batch_item(index: int, video_url: str, fn: Callable[[str], dict[str, Any]]):
+    video_id = extract_video_id(video_url)
+    try:
+        return {"index": index, "video_id": video_id, "ok": True, **fn(video_url)}
+    except Exception as e:
+        return {
+            "index": index,
+            "video_id": video_id,
+            "ok": False,
+            "error": str(e),
+            "error_code": classify(e)[0],
+        }
+
+
+def _iter_batch(
+    video_urls: Iterable[str],
+    fn: Callable[[str], dict[str, Any]],
+    max_concurrency: int | None,
+) -> Iterator[dict[str, Any]]:
+    workers = max(1, max_concurrency or _batch_concurrency)
+    # Inputs are consumed lazily and at most two results per worker are in
+    # flight or waiting for the consumer, so memory stays bounded however
+    # long the input is and however slowly results are consumed.
+    window = 2 * workers
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-youtube-batch")
+    pending: set[Future] = set()
+    try:
+        for i, url in enumerate(video_urls):
+            pending.add(pool.submit(_batch_item, i, url, fn))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+    finally:
+        # Consumer may stop early; drop work that has not started yet.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_transcripts_batch(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield plain-text transcripts for many videos as each one completes."""
+    return _iter_batch(
+        video_urls,
+        lambda url: {"transcript": get_transcript(url, language)},
+        max_concurrency,
+    )
+
+
+@metrics.operation
+def get_transcripts_batch(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> list[dict[str, Any]]:
+    """Get plain-text transcripts for many videos, in input order."""
+    results = list(iter_transcripts_batch(video_urls, language, max_concurrency))
+    return sorted(results, key=lambda r: r["index"])
+
+
+def iter_prefetch(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """Warm the cache (and store, if enabled) for many videos.
+
+    Yields one size summary per video as each completes; no transcript text.
+    """
+
+    def warm(url: str) -> dict[str, Any]:
+        transcript = _fetch(url, language)
+        return {
+            "language": transcript.language_code,
+            "segments": len(transcript),
+            "bytes": len(transcript.blob.encode("utf-8")),
+        }
+
+    return _iter_batch(video_urls, warm, max_concurrency)
+
+
+def iter_chunks(
+    video_url: str,
+    size: float = 256,
+    unit: str = "tokens",
+    overlap: float = 0,
+    language: Languages = "en",
+    translate: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield embedding-ready chunks of one transcript (see ``operations.chunking``).
+
+    Chunks are cut straight from the cached transcript, with no intermediate
+    JSON or per-line objects.
+    """
+    chunking.check(size, unit, overlap)
+    return chunking.chunks(_fetch(video_url, language, translate), size, unit, overlap, metadata)
+
+
+def iter_chunks_batch(
+    video_urls: Iterable[str],
+    size: float = 256,
+    unit: str = "tokens",
+    overlap: float = 0,
+    language: Languages = "en",
+    max_concurrency: int | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Chunk many videos, yielding one batch item per video as each is fetched.
+
+    Successful items carry ``chunks``, a lazy iterator over that video's
+    chunks; consume it before advancing. Inputs are read lazily and only a
+    few transcripts are held at a time, so corpora of any size stream in
+    bounded memory.
+    """
+    chunking.check(size, unit, overlap)
+    items = _iter_batch(
+        video_urls, lambda url: {"transcript": _fetch(url, language)}, max_concurrency
+    )
+    return _with_chunks(items, size, unit, overlap, metadata)
+
+
+def _with_chunks(
+    items: Iterator[dict[str, Any]],
+    size: float,
+    unit: str,
+    overlap: float,
+    metadata: dict[str, Any] | None,
+) -> Iterator[dict[str, Any]]:
+    for item in items:
+        if item["ok"]:
+            transcript = item.pop("transcript")
+            item["language_code"] = transcript.language_code
+            item["chunks"] = chunking.chunks(transcript, size, unit, overlap, metadata)
+        yield item
+
+
+def iter_search_transcripts_batch(
+    video_urls: Iterable[str],
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    max_concurrency: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield per-video search results as each video completes."""
+    return _iter_batch(
+        video_urls,
+        lambda url: {"matches": search_transcript(url, search_term, language)},
+        max_concurrency,
+    )
+
+
+@metrics.operation
+def search_transcripts_batch(
+    video_urls: Iterable[str],
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    max_concurrency: int | None = None,
+) -> list[dict[str, Any]]:
+    """Search for a term across many videos, in input order."""
+    results = list(
+        iter_search_transcripts_batch(video_urls, search_term, language, max_concurrency)
+    )
+    return sorted(results, key=lambda r: r["index"])
+
+
+# Multi-language: one listing, native tracks fetched in parallel, translations
+# only for the languages the video does not have.
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _language_result(code: str, transcript: Transcript, how: str) -> dict[str, Any]:
+    return {
+        "language": code,
+        "ok": True,
+        "match": how,
+        "language_code": transcript.language_code,
+        "is_generated": transcript.is_generated,
+        "transcript": _render_text(transcript),
+    }
+
+
+def _language_error(code: str, error: Exception) -> dict[str, Any]:
+    return {
+        "language": code,
+        "ok": False,
+        "error": str(error),
+        "error_code": classify(error)[0],
+    }
+
+
+def _language_item(video_id: str, transcript_list, code: str) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        _, how = languages.match(transcript_list, [code], translate=True)
+        # Native tracks share the plain "<code>" cache entry with get_transcript.
+        transcript = _fetch(video_id, code, translate=how == languages.TRANSLATION)
+        item = _language_result(code, transcript, how)
+    except Exception as e:
+        item = _language_error(code, e)
+    item["elapsed_ms"] = _elapsed_ms(started)
+    return item
+
+
+@metrics.operation
+def get_transcripts_multilang(
+    video_url: str, languages: Sequence[str], max_concurrency: int | None = None
+) -> dict[str, Any]:
+    """Get one video's transcript in several languages in one call.
+
+    The video is listed once; languages it has (exactly or as a regional
+    variant) are fetched in parallel, the rest are translated from an
+    available track. Each entry in ``languages`` reports its ``match``
+    (exact, regional or translation), timing and any error, in input order.
+    """
+    started = time.perf_counter()
+    video_id = extract_video_id(video_url)
+    codes = _preferences(languages)
+    transcript_list = _list(video_id)
+    workers = max(1, min(max_concurrency or _batch_concurrency, len(codes)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="mcp-youtube-multilang"
+    ) as pool:
+        items = list(
+            pool.map(lambda code: _language_item(video_id, transcript_list, code), codes)
+        )
+    return {"video_id": video_id, "languages": items, "elapsed_ms": _elapsed_ms(started)}
+
+
+# Corpus: ranked search across every indexed video, answered locally.
+
+
+def _require_corpus() -> CorpusIndex:
+    if _corpus is None:
+        raise RuntimeError(
+            "Corpus index is not enabled; set MCP_YOUTUBE_CORPUS_PATH "
+            "or call configure_corpus()"
+        )
+    return _corpus
+
+
+@metrics.operation
+def ingest_videos(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> list[dict[str, Any]]:
+    """Explicitly fetch and (re-)index videos into the corpus, in input order."""
+    corpus = _require_corpus()
+
+    def ingest(url: str) -> dict[str, Any]:
+        return {"passages": corpus.add(_fetch(url, language))}
+
+    results = list(_iter_batch(video_urls, ingest, max_concurrency))
+    return sorted(results, key=lambda r: r["index"])
+
+
+def remove_from_corpus(video_url: str, language: str | None = None) -> int:
+    """Delete a video's passages from the corpus. Returns the count removed."""
+    return _require_corpus().delete(extract_video_id(video_url), language)
+
+
+@metrics.operation
+def search_corpus(
+    query: str, top_k: int = 10, video_filter: Iterable[str] | None = None
+) -> list[dict[str, Any]]:
+    """BM25-ranked (video, timestamp, snippet) hits across all indexed videos.
+
+    Makes no upstream calls. ``video_filter`` restricts hits to the given
+    video URLs or IDs.
+    """
+    videos = [extract_video_id(v) for v in video_filter] if video_filter else None
+    return _require_corpus().search(query, top_k, videos)
+
+
+def corpus_stats() -> dict[str, Any]:
+    """Video, passage and token counts for the corpus index."""
+    return _require_corpus().stats()
@@ -0,0 +1,333 @@
+"""Async YouTube transcript operations.
+
+Mirrors operations.transcripts for asyncio callers. Cache hits are served
+inline; misses run the blocking upstream call on a bounded thread pool so the
+event loop is never stalled, and concurrent misses for the same key are
+coalesced before they take a worker slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Sequence, TypeVar
+
+from . import formats, languages, metrics, paging, transcripts
+from . import normalize as _normalize
+from .config import env_int
+from .errors import classify
+from .languages import Languages
+from .singleflight import SingleFlight
+
+T = TypeVar("T")
+
+# Max upstream calls in flight at once across all async callers
+_max_concurrency = env_int("MCP_YOUTUBE_MAX_CONCURRENCY", 16)
+_executor = ThreadPoolExecutor(
+    max_workers=_max_concurrency, thread_name_prefix="mcp-youtube"
+)
+_flight = SingleFlight()
+
+
+def configure_concurrency(max_concurrency: int) -> None:
+    """Replace the upstream worker pool with one of ``max_concurrency`` threads."""
+    global _executor, _max_concurrency
+    old = _executor
+    _max_concurrency = max_concurrency
+    _executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="mcp-youtube"
+    )
+    old.shutdown(wait=False)
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the bounded upstream pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def _fetch(video_url: str, language: Languages = "en", translate: bool = False):
+    """Async ``transcripts._fetch``: cache, then one coalesced upstream call."""
+    key = transcripts._cache_key(video_url, language, translate)
+    transcript = transcripts._cached(key, transcripts._refresh_transcript)
+    if transcript is not None:
+        return transcript
+    return await _flight.do_async(
+        key,
+        run_blocking,
+        transcripts._fetch_flight.do,
+        key,
+        transcripts._load,
+        key,
+    )
+
+
+async def _list(video_url: str):
+    video_id = transcripts.extract_video_id(video_url)
+    transcript_list = transcripts._cached((video_id, None), transcripts._refresh_list)
+    if transcript_list is not None:
+        return transcript_list
+    return await _flight.do_async(
+        ("list", video_id), run_blocking, transcripts._list, video_id
+    )
+
+
+@metrics.operation
+async def get_transcript(
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    normalize: str = "none",
+) -> str:
+    """Get full transcript as plain text."""
+    _normalize.check(normalize)
+    transcript = await _fetch(video_url, language, translate)
+    return transcripts._render_text(_normalize.apply(transcript, normalize))
+
+
+@metrics.operation
+async def get_transcript_with_timestamps(
+    video_url: str,
+    language: Languages = "en",
+    translate: bool = False,
+    format: str = "json",
+    normalize: str = "none",
+) -> str:
+    """Get transcript with timestamps as ``format`` (see ``formats.FORMATS``)."""
+    formats.check_format(format)
+    _normalize.check(normalize)
+    transcript = await _fetch(video_url, language, translate)
+    return formats.render(_normalize.apply(transcript, normalize), format)
+
+
+@metrics.operation
+async def get_transcript_page(
+    video_url: str,
+    language: Languages = "en",
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    timestamps: bool = False,
+    translate: bool = False,
+    normalize: str = "none",
+) -> dict[str, Any]:
+    """Get one budgeted page of a transcript (see ``transcripts.get_transcript_page``)."""
+    video_id, spec, kind, start, budget, normalize = transcripts._page_request(
+        video_url,
+        language,
+        translate,
+        max_chars,
+        max_tokens,
+        cursor,
+        "json" if timestamps else "text",
+        normalize,
+    )
+    codes, translate = languages.parse_spec(spec)
+    transcript = _normalize.apply(await _fetch(video_id, codes, translate), normalize)
+    return paging.page(transcript, kind, start, budget, spec, normalize)
+
+
+@metrics.operation
+async def list_available_transcripts(video_url: str) -> list[dict[str, Any]]:
+    """List all available transcript languages for a video."""
+    return transcripts._describe_transcripts(await _list(video_url))
+
+
+@metrics.operation
+async def get_transcript_segment(
+    video_url: str,
+    start_time: int,
+    end_time: int,
+    language: Languages = "en",
+    mode: str = "start",
+) -> str:
+    """Get transcript segment between specific timestamps (seconds)."""
+    return transcripts._segment_text(
+        await _fetch(video_url, language), start_time, end_time, mode
+    )
+
+
+@metrics.operation
+async def get_transcript_segments(
+    video_url: str,
+    ranges: Iterable[Sequence[float]],
+    language: Languages = "en",
+    mode: str = "start",
+) -> list[dict[str, Any]]:
+    """Get several ``(start_time, end_time)`` windows from one transcript."""
+    return transcripts._segments(await _fetch(video_url, language), ranges, mode)
+
+
+@metrics.operation
+async def search_transcript(
+    video_url: str,
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    context: float = 0,
+    normalize: str = "none",
+) -> list[dict[str, Any]]:
+    """Search for one or more terms in transcript, in timestamp order."""
+    _normalize.check(normalize)
+    transcript = _normalize.apply(await _fetch(video_url, language), normalize)
+    return transcripts._search_entries(transcript, search_term, context)
+
+
+async def _batch_item(
+    index: int, video_url: str, fn: Callable[[str], Awaitable[dict[str, Any]]]
+) -> dict[str, Any]:
+    video_id = transcripts.extract_video_id(video_url)
+    try:
+        return {"index": index, "video_id": video_id, "ok": True, **await fn(video_url)}
+    except Exception as e:
+        return {
+            "index": index,
+            "video_id": video_id,
+            "ok": False,
+            "error": str(e),
+            "error_code": classify(e)[0],
+        }
+
+
+async def _iter_batch(
+    video_urls: Iterable[str],
+    fn: Callable[[str], Awaitable[dict[str, Any]]],
+    max_concurrency: int | None,
+) -> AsyncIterator[dict[str, Any]]:
+    workers = max(1, max_concurrency or transcripts._batch_concurrency)
+    # As in transcripts._iter_batch: read the input lazily and keep at most
+    # two tasks per worker alive, so memory stays bounded however long the
+    # input is and however slowly results are consumed.
+    window = 2 * workers
+    semaphore = asyncio.Semaphore(workers)
+
+    async def guarded(index: int, video_url: str) -> dict[str, Any]:
+        async with semaphore:
+            return await _batch_item(index, video_url, fn)
+
+    pending: set[asyncio.Future] = set()
+    try:
+        for i, url in enumerate(video_urls):
+            pending.add(asyncio.ensure_future(guarded(i, url)))
+            if len(pending) >= window:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # Consumer may stop early; drop work that has not finished yet.
+        for task in pending:
+            task.cancel()
+
+
+async def _transcript_item(video_url: str, language: str) -> dict[str, Any]:
+    return {"transcript": await get_transcript(video_url, language)}
+
+
+async def _search_item(
+    video_url: str, search_term: str | Sequence[str], language: str
+) -> dict[str, Any]:
+    return {"matches": await search_transcript(video_url, search_term, language)}
+
+
+def iter_transcripts_batch(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield plain-text transcripts for many videos as each one completes."""
+    return _iter_batch(
+        video_urls, functools.partial(_transcript_item, language=language), max_concurrency
+    )
+
+
+@metrics.operation
+async def get_transcripts_batch(
+    video_urls: Iterable[str], language: Languages = "en", max_concurrency: int | None = None
+) -> list[dict[str, Any]]:
+    """Get plain-text transcripts for many videos, in input order."""
+    results = [r async for r in iter_transcripts_batch(video_urls, language, max_concurrency)]
+    return sorted(results, key=lambda r: r["index"])
+
+
+def iter_search_transcripts_batch(
+    video_urls: Iterable[str],
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    max_concurrency: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield per-video search results as each video completes."""
+    return _iter_batch(
+        video_urls,
+        functools.partial(_search_item, search_term=search_term, language=language),
+        max_concurrency,
+    )
+
+
+@metrics.operation
+async def search_transcripts_batch(
+    video_urls: Iterable[str],
+    search_term: str | Sequence[str],
+    language: Languages = "en",
+    max_concurrency: int | None = None,
+) -> list[dict[str, Any]]:
+    """Search for a term across many videos, in input order."""
+    results = [
+        r
+        async for r in iter_search_transcripts_batch(
+            video_urls, search_term, language, max_concurrency
+        )
+    ]
+    return sorted(results, key=lambda r: r["index"])
+
+
+async def _language_item(
+    video_id: str, transcript_list, code: str, semaphore: asyncio.Semaphore
+) -> dict[str, Any]:
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            _, how = languages.match(transcript_list, [code], translate=True)
+            transcript = await _fetch(
+                video_id, code, translate=how == languages.TRANSLATION
+            )
+            item = transcripts._language_result(code, transcript, how)
+        except Exception as e:
+            item = transcripts._language_error(code, e)
+        item["elapsed_ms"] = transcripts._elapsed_ms(started)
+        return item
+
+
+@metrics.operation
+async def get_transcripts_multilang(
+    video_url: str, languages: Sequence[str], max_concurrency: int | None = None
+) -> dict[str, Any]:
+    """Get one video's transcript in several languages in one call.
+
+    See ``transcripts.get_transcripts_multilang``.
+    """
+    started = time.perf_counter()
+    video_id = transcripts.extract_video_id(video_url)
+    codes = transcripts._preferences(languages)
+    transcript_list = await _list(video_id)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or transcripts._batch_concurrency))
+    items = await asyncio.gather(
+        *(_language_item(video_id, transcript_list, code, semaphore) for code in codes)
+    )
+    return {
+        "video_id": video_id,
+        "languages": list(items),
+        "elapsed_ms": transcripts._elapsed_ms(started),
+    }
+
+
+@metrics.operation
+async def search_corpus(
+    query: str, top_k: int = 10, video_filter: Iterable[str] | None = None
+) -> list[dict[str, Any]]:
+    """BM25-ranked hits across all indexed videos (local disk only)."""
+    return await run_blocking(transcripts.search_corpus, query, top_k, video_filter)
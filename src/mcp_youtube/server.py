@@ -1,73 +1,129 @@
 """YouTube MCP Server - backward-compatible @mcp.tool wrappers.
 
-Tool names match the original server.py for drop-in replacement.
+Tool names match the original server.py for drop-in replacement. Handlers are
+async and run the tool bodies in ``handlers`` (shared with the LangChain
+tools) against operations.transcripts_async, so a slow upstream fetch never
+blocks other clients on the HTTP transport. Failures are returned as
+JSON ``{"error": {"code", "message", "retryable"}}``.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
 
-from .operations import transcripts
+from . import handlers
+from .operations import metrics
+from .operations.lazy import LazyModule
+
+# Imported on first tool call: tool registration and listing need only fastmcp
+transcripts_async = LazyModule("mcp_youtube.operations.transcripts_async")
 
 mcp = FastMCP("youtube-mcp")
 
+_started = time.monotonic()
+
 
 @mcp.tool
-def get_transcript(video_url: str, language: str = "en") -> str:
+@metrics.tool("mcp")
+async def get_transcript(
+    video_url: str,
+    language: str | list[str] = "en",
+    translate: bool = False,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    normalize: str = "none",
+) -> str:
     """Get transcript for a YouTube video.
 
     Args:
         video_url: YouTube video URL or video ID
-        language: Language code (default: 'en'). Examples: 'en', 'es', 'fr', 'de', 'ja'
+        language: Language code (default: 'en'). Examples: 'en', 'es', 'fr', 'de', 'ja'.
+            A preference list such as ['en-US', 'en'] is tried in order, and
+            regional variants (en-US / en) also match
+        translate: If no listed language exists, translate an available track
+        max_chars: Return one page of at most this many characters
+        max_tokens: Return one page of roughly this many tokens
+        cursor: next_cursor from a previous page, to continue reading
+        normalize: 'none' (default), 'clean' (strip [Music]-style tags and words
+            repeated from the previous caption), 'sentences' (clean, then merge
+            fragments into sentences), or fixed windows such as '30s'
 
     Returns:
-        Full transcript as plain text
+        Full transcript as plain text, or with a budget or cursor a JSON page
+        {content, next_cursor, start_index, end_index, total_segments}
     """
-    try:
-        return transcripts.get_transcript(video_url, language)
-    except Exception as e:
-        return f"Error fetching transcript: {e}"
+    return await handlers.get_transcript.acall(
+        video_url, language, translate, max_chars, max_tokens, cursor, normalize
+    )
 
 
 @mcp.tool
-def get_transcript_with_timestamps(video_url: str, language: str = "en") -> str:
+@metrics.tool("mcp")
+async def get_transcript_with_timestamps(
+    video_url: str,
+    language: str | list[str] = "en",
+    translate: bool = False,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    format: str = "json",
+    normalize: str = "none",
+) -> str:
     """Get transcript with timestamps for a YouTube video.
 
     Args:
         video_url: YouTube video URL or video ID
-        language: Language code (default: 'en')
+        language: Language code or preference list (default: 'en')
+        translate: If no listed language exists, translate an available track
+        max_chars: Return one page of at most this many characters
+        max_tokens: Return one page of roughly this many tokens
+        cursor: next_cursor from a previous page, to continue reading
+        format: 'json' (default), 'compact' ([[start, duration, text], ...]),
+            'ndjson', 'srt' or 'vtt'. Pages are always JSON
+        normalize: 'none' (default), 'clean' (strip [Music]-style tags and words
+            repeated from the previous caption), 'sentences' (clean, then merge
+            fragments into sentences), or fixed windows such as '30s'
 
     Returns:
-        Transcript with timestamps in JSON format
+        Transcript with timestamps in the requested format, or with a budget
+        or cursor a JSON page whose content is a JSON array of that page's lines
     """
-    try:
-        return transcripts.get_transcript_with_timestamps(video_url, language)
-    except Exception as e:
-        return f"Error fetching transcript: {e}"
+    return await handlers.get_transcript_with_timestamps.acall(
+        video_url, language, translate, max_chars, max_tokens, cursor, format, normalize
+    )
 
 
 @mcp.tool
-def list_available_transcripts(video_url: str) -> str:
+@metrics.tool("mcp")
+async def list_available_transcripts(video_url: str, compact: bool = False) -> str:
     """List all available transcript languages for a video.
 
     Args:
         video_url: YouTube video URL or video ID
+        compact: Return single-line JSON instead of indented JSON
 
     Returns:
         List of available language codes and names
     """
-    try:
-        result = transcripts.list_available_transcripts(video_url)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error listing transcripts: {e}"
+    return await handlers.list_available_transcripts.acall(video_url, compact)
 
 
 @mcp.tool
-def get_transcript_segment(
-    video_url: str, start_time: int, end_time: int, language: str = "en"
+@metrics.tool("mcp")
+async def get_transcript_segment(
+    video_url: str,
+    start_time: int,
+    end_time: int,
+    language: str | list[str] = "en",
+    mode: str = "start",
 ) -> str:
     """Get transcript segment between specific timestamps.
 
@@ -75,40 +131,230 @@ def get_transcript_segment(
         video_url: YouTube video URL or video ID
         start_time: Start time in seconds
         end_time: End time in seconds
-        language: Language code (default: 'en')
+        language: Language code or preference list (default: 'en')
+        mode: 'start' (lines starting in the window, default) or 'overlap'
+            (lines overlapping the window, including ones cut by its edges)
 
     Returns:
         Transcript segment as plain text
     """
-    try:
-        return transcripts.get_transcript_segment(video_url, start_time, end_time, language)
-    except Exception as e:
-        return f"Error fetching transcript segment: {e}"
+    return await handlers.get_transcript_segment.acall(
+        video_url, start_time, end_time, language, mode
+    )
+
+
+@mcp.tool
+@metrics.tool("mcp")
+async def get_transcript_segments(
+    video_url: str,
+    ranges: list[tuple[float, float]],
+    language: str | list[str] = "en",
+    mode: str = "start",
+) -> str:
+    """Get several time windows from one video transcript in a single call.
+
+    Args:
+        video_url: YouTube video URL or video ID
+        ranges: List of [start_time, end_time] pairs in seconds
+        language: Language code or preference list (default: 'en')
+        mode: 'start' (lines starting in each window, default) or 'overlap'
+
+    Returns:
+        JSON list of {start_time, end_time, text}, one per range
+    """
+    return await handlers.get_transcript_segments.acall(video_url, ranges, language, mode)
 
 
 @mcp.tool
-def search_transcript(video_url: str, search_term: str, language: str = "en") -> str:
+@metrics.tool("mcp")
+async def search_transcript(
+    video_url: str,
+    search_term: str | list[str],
+    language: str | list[str] = "en",
+    context: float = 0,
+    compact: bool = False,
+    normalize: str = "none",
+) -> str:
     """Search for a term in video transcript and return matching segments with timestamps.
 
+    Matching is case-insensitive and phrases may span caption line boundaries.
+
     Args:
         video_url: YouTube video URL or video ID
-        search_term: Term to search for
-        language: Language code (default: 'en')
+        search_term: Term to search for, or a list of terms to find in one pass
+        language: Language code or preference list (default: 'en')
+        context: Also return the text within this many seconds of each match
+        compact: Return single-line JSON instead of indented JSON
+        normalize: Normalize captions before searching, as in get_transcript
+            ('none', 'clean', 'sentences' or e.g. '30s'); matches are then
+            whole normalized segments
 
     Returns:
-        Matching segments with timestamps
+        Matching segments with timestamps, in timestamp order
     """
-    try:
-        matches = transcripts.search_transcript(video_url, search_term, language)
-        if not matches:
-            return f"No matches found for '{search_term}'"
-        return json.dumps(matches, indent=2)
-    except Exception as e:
-        return f"Error searching transcript: {e}"
+    return await handlers.search_transcript.acall(
+        video_url, search_term, language, context, compact, normalize
+    )
+
+
+@mcp.tool
+@metrics.tool("mcp")
+async def search_corpus(
+    query: str, top_k: int = 10, video_filter: list[str] | None = None
+) -> str:
+    """Search across every locally indexed video transcript, ranked by relevance.
+
+    Answers from the local corpus index without contacting YouTube. Videos are
+    indexed when their transcripts are fetched by any other tool.
+
+    Args:
+        query: Words to search for
+        top_k: Max number of hits to return (default: 10)
+        video_filter: Optional list of video URLs or IDs to restrict the search to
+
+    Returns:
+        JSON list of {video_id, timestamp, start, end, score, snippet}, best first
+    """
+    return await handlers.search_corpus.acall(query, top_k, video_filter)
+
+
+def _progress_message(item: dict) -> str:
+    """Short per-video status line for batch progress notifications."""
+    summary = {k: item[k] for k in ("index", "video_id", "ok", "error") if k in item}
+    if "matches" in item:
+        summary["matches"] = len(item["matches"])
+    return json.dumps(summary)
+
+
+async def _collect_batch(results, total: int, ctx: Context | None) -> list[dict]:
+    collected = []
+    async for item in results:
+        collected.append(item)
+        if ctx is not None:
+            await ctx.report_progress(len(collected), total, _progress_message(item))
+    return sorted(collected, key=lambda r: r["index"])
+
+
+@mcp.tool
+@metrics.tool("mcp")
+async def get_transcripts_batch(
+    video_urls: list[str],
+    language: str | list[str] = "en",
+    max_concurrency: int | None = None,
+    ctx: Context | None = None,
+) -> str:
+    """Get transcripts for many YouTube videos in one call.
+
+    Videos are fetched in parallel; one failing video does not fail the batch.
+    Progress notifications report each video as it completes.
+
+    Args:
+        video_urls: YouTube video URLs or video IDs
+        language: Language code or preference list (default: 'en')
+        max_concurrency: Max videos fetched at once
+            (default: MCP_YOUTUBE_BATCH_CONCURRENCY, 8)
+
+    Returns:
+        JSON list in input order of {video_id, ok, transcript | error}
+    """
+    results = transcripts_async.iter_transcripts_batch(
+        video_urls, language, max_concurrency
+    )
+    return json.dumps(await _collect_batch(results, len(video_urls), ctx), indent=2)
+
+
+@mcp.tool
+@metrics.tool("mcp")
+async def search_transcripts_batch(
+    video_urls: list[str],
+    search_term: str | list[str],
+    language: str | list[str] = "en",
+    max_concurrency: int | None = None,
+    ctx: Context | None = None,
+) -> str:
+    """Search for a term across many YouTube videos in one call.
+
+    Videos are fetched in parallel; one failing video does not fail the batch.
+    Progress notifications report each video as it completes.
+
+    Args:
+        video_urls: YouTube video URLs or video IDs
+        search_term: Term to search for, or a list of terms
+        language: Language code or preference list (default: 'en')
+        max_concurrency: Max videos fetched at once
+            (default: MCP_YOUTUBE_BATCH_CONCURRENCY, 8)
+
+    Returns:
+        JSON list in input order of {video_id, ok, matches | error}
+    """
+    results = transcripts_async.iter_search_transcripts_batch(
+        video_urls, search_term, language, max_concurrency
+    )
+    return json.dumps(await _collect_batch(results, len(video_urls), ctx), indent=2)
+
+
+@mcp.tool
+@metrics.tool("mcp")
+async def get_transcripts_multilang(
+    video_url: str, languages: list[str], max_concurrency: int | None = None
+) -> str:
+    """Get one YouTube video's transcript in several languages in one call.
+
+    The video is listed once; languages it has are fetched in parallel and
+    the rest are machine-translated from an available track.
+
+    Args:
+        video_url: YouTube video URL or video ID
+        languages: Language codes, e.g. ['en', 'es', 'de', 'ja']
+        max_concurrency: Max languages fetched at once
+            (default: MCP_YOUTUBE_BATCH_CONCURRENCY, 8)
+
+    Returns:
+        JSON {video_id, elapsed_ms, languages: [{language, ok, match,
+        transcript | error, elapsed_ms}]} in input order
+    """
+    return await handlers.get_transcripts_multilang.acall(video_url, languages, max_concurrency)
+
+
+@mcp.resource("metrics://mcp-youtube", mime_type="application/json")
+def server_metrics() -> str:
+    """Tool, operation and stage latency histograms; upstream and cache counters."""
+    return json.dumps(metrics.snapshot(), indent=2)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint (HTTP transports only)."""
+    return PlainTextResponse(
+        metrics.prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> JSONResponse:
+    """Liveness probe for load balancers (HTTP transports only)."""
+    return JSONResponse(
+        {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_s": round(time.monotonic() - _started, 1),
+            "ready": transcripts_async.loaded,
+        }
+    )
+
+
+def preload() -> threading.Thread:
+    """Import the fetch stack in the background while the client connects."""
+    thread = threading.Thread(
+        target=transcripts_async.load, name="mcp-youtube-preload", daemon=True
+    )
+    thread.start()
+    return thread
 
 
 def main():
     """Entry point for MCP stdio server."""
+    preload()
     mcp.run()
 
 
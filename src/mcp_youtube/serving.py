@@ -0,0 +1,199 @@
+"""Multi-worker streamable-HTTP serving of the MCP server.
+
+    mcp-youtube serve --http --workers 4 --port 8000
+
+Each uvicorn worker process builds its own app through ``create_app``. MCP
+sessions are stateless and responses are plain JSON (no SSE stream), so any
+worker can answer any request and the processes can sit behind an ordinary
+load balancer. Per worker:
+
+- at most ``MCP_YOUTUBE_HTTP_MAX_CONCURRENCY`` requests run at once, up to
+  ``MCP_YOUTUBE_HTTP_MAX_QUEUE`` more wait for a slot, and the rest are
+  rejected at once with a 503 and ``Retry-After``;
+- requests running (or queued) longer than ``MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT``
+  get a 504;
+- on SIGTERM/SIGINT the worker stops accepting and lets in-flight requests
+  finish for up to ``MCP_YOUTUBE_HTTP_SHUTDOWN_TIMEOUT`` seconds.
+
+Caches, rate limits and metrics are per worker; set ``MCP_YOUTUBE_STORE_PATH``
+to share fetched transcripts between them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+
+from .operations.config import env_float, env_int, env_str
+
+# ASGI callables, untyped to avoid depending on a particular ASGI typing package
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+APP_FACTORY = "mcp_youtube.serving:create_app"
+MCP_PATH = "/mcp"
+
+# Paths that bypass the concurrency limit, so probes and scrapes work under load
+UNLIMITED_PATHS = ("/health", "/metrics")
+
+
+def _error_body(message: str, code: str) -> bytes:
+    # Same shape as tool errors (operations.errors.error_response)
+    return json.dumps({"error": {"message": message, "code": code, "retryable": True}}).encode(
+        "utf-8"
+    )
+
+
+TIMEOUT_BODY = _error_body("Request timed out", "TIMEOUT")
+OVERLOADED_BODY = _error_body("Server is at capacity, retry later", "OVERLOADED")
+
+
+async def _send_error(
+    send: Send, status: int, body: bytes, headers: tuple[tuple[bytes, bytes], ...] = ()
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class ConcurrencyLimit:
+    """ASGI middleware running at most ``max_requests`` requests at once.
+
+    Up to ``max_queued`` further requests wait for a slot in arrival order;
+    past that, requests get an immediate 503 with ``Retry-After``.
+    """
+
+    def __init__(
+        self, app: Callable[..., Awaitable[None]], max_requests: int, max_queued: int = 0
+    ):
+        self.app = app
+        self.max_requests = max(1, max_requests)
+        self.max_queued = max(0, max_queued)
+        self.pending = 0  # running + queued
+        self._slots: Optional[asyncio.Semaphore] = None  # bound to the worker's loop
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in UNLIMITED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        if self.pending >= self.max_requests + self.max_queued:
+            await _send_error(send, 503, OVERLOADED_BODY, ((b"retry-after", b"1"),))
+            return
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_requests)
+        self.pending += 1
+        try:
+            async with self._slots:
+                await self.app(scope, receive, send)
+        finally:
+            self.pending -= 1
+
+
+class RequestTimeout:
+    """ASGI middleware answering 504 when a request outlives ``timeout`` seconds.
+
+    If the response has already started it is cut off instead. ``timeout`` of
+    0 disables the limit.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], timeout: float):
+        self.app = app
+        self.timeout = timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.timeout:
+            await self.app(scope, receive, send)
+            return
+        started = False
+
+        async def tracking_send(message: dict[str, Any]) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await asyncio.wait_for(self.app(scope, receive, tracking_send), self.timeout)
+        except asyncio.TimeoutError:
+            if not started:
+                await _send_error(send, 504, TIMEOUT_BODY)
+
+
+def create_app() -> Starlette:
+    """uvicorn app factory: the MCP server as a stateless streamable-HTTP app."""
+    from . import server
+
+    app = server.mcp.http_app(
+        path=env_str("MCP_YOUTUBE_HTTP_PATH", MCP_PATH),
+        stateless_http=True,
+        json_response=True,
+        # Outermost first: time spent queued counts towards the request timeout.
+        middleware=[
+            Middleware(
+                RequestTimeout, timeout=env_float("MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT", 60.0)
+            ),
+            Middleware(
+                ConcurrencyLimit,
+                max_requests=env_int("MCP_YOUTUBE_HTTP_MAX_CONCURRENCY", 64),
+                max_queued=env_int("MCP_YOUTUBE_HTTP_MAX_QUEUE", 256),
+            ),
+        ],
+    )
+    server.preload()
+    return app
+
+
+def serve(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    request_timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    max_queue: Optional[int] = None,
+    backlog: Optional[int] = None,
+    shutdown_timeout: Optional[float] = None,
+    app: str = APP_FACTORY,
+) -> None:
+    """Run ``workers`` uvicorn processes serving ``app`` until interrupted.
+
+    Unset arguments fall back to the ``MCP_YOUTUBE_HTTP_*`` environment.
+    """
+    import uvicorn
+
+    # Workers are fresh processes; they read the factory's settings from the environment.
+    for name, value in (
+        ("MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT", request_timeout),
+        ("MCP_YOUTUBE_HTTP_MAX_CONCURRENCY", max_concurrency),
+        ("MCP_YOUTUBE_HTTP_MAX_QUEUE", max_queue),
+    ):
+        if value is not None:
+            os.environ[name] = str(value)
+    uvicorn.run(
+        app,
+        factory=True,
+        host=host or env_str("MCP_YOUTUBE_HTTP_HOST", "127.0.0.1"),
+        port=port or env_int("MCP_YOUTUBE_HTTP_PORT", 8000),
+        workers=workers or env_int("MCP_YOUTUBE_HTTP_WORKERS", 1),
+        backlog=backlog or env_int("MCP_YOUTUBE_HTTP_BACKLOG", 2048),
+        timeout_graceful_shutdown=(
+            shutdown_timeout
+            if shutdown_timeout is not None
+            else env_float("MCP_YOUTUBE_HTTP_SHUTDOWN_TIMEOUT", 30.0)
+        ),
+        log_level=env_str("MCP_YOUTUBE_HTTP_LOG_LEVEL", "info"),
+    )
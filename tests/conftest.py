@@ -0,0 +1,58 @@
+"""Shared fixtures and test helpers."""
+
+from typing import Any, Iterable, Sequence, Union
+
+import pytest
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from mcp_youtube.operations import transcripts
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+# Raw-data dicts (as FetchedTranscript.to_raw_data()) or (start, duration, text)
+Row = Union[dict[str, Any], Sequence[Any]]
+
+
+class FakeClock:
+    """Deterministic time for caches, breakers and limiters: sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_fetched(
+    rows: Iterable[Row] = ((0.0, 2.0, "Hello world"),),
+    video_id: str = VIDEO_ID,
+    language_code: str = "en",
+    is_generated: bool = False,
+) -> FetchedTranscript:
+    """A real FetchedTranscript (cacheable, re-iterable) built from ``rows``."""
+    snippets = [
+        FetchedTranscriptSnippet(**row)
+        if isinstance(row, dict)
+        else FetchedTranscriptSnippet(text=row[2], start=row[0], duration=row[1])
+        for row in rows
+    ]
+    return FetchedTranscript(
+        snippets=snippets,
+        video_id=video_id,
+        language="English",
+        language_code=language_code,
+        is_generated=is_generated,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_transcript_cache():
+    """Keep cached transcripts from leaking between tests."""
+    transcripts.clear_cache()
+    yield
+    transcripts.clear_cache()
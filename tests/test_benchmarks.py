@@ -0,0 +1,54 @@
+"""Smoke tests for the offline benchmark suite and its fake upstream."""
+
+import json
+
+import pytest
+from youtube_transcript_api import VideoUnavailable, YouTubeRequestFailed
+
+from benchmarks import compare, suite
+from benchmarks.fake_upstream import FakeTranscriptApi, segments_for
+from mcp_youtube.operations import languages
+
+
+def test_fake_upstream_lengths_and_listing():
+    api = FakeTranscriptApi(latency=0, minutes={"long": 720})
+    assert len(api.fetch("long").snippets) == segments_for(720) == 14400
+    assert len(api.fetch("short").snippets) == api.segments
+    track = languages.resolve(api.list("short"), ["fr"], translate=True)
+    assert track.fetch().language_code == "fr"
+
+
+def test_fake_upstream_failures_are_seeded():
+    def outcomes(api):
+        result = []
+        for i in range(200):
+            try:
+                api.list(f"v{i}")
+                result.append("ok")
+            except (YouTubeRequestFailed, VideoUnavailable) as e:
+                result.append(type(e).__name__)
+        return result
+
+    first = outcomes(FakeTranscriptApi(latency=0, transient_rate=0.1, unavailable_rate=0.1))
+    again = outcomes(FakeTranscriptApi(latency=0, transient_rate=0.1, unavailable_rate=0.1))
+    assert first == again
+    assert 0 < first.count("YouTubeRequestFailed") < 60
+    assert 0 < first.count("VideoUnavailable") < 60
+
+
+@pytest.mark.parametrize("layer", ["operations", "mcp"])
+def test_suite_quick_run_writes_results(tmp_path, layer):
+    out = tmp_path / "results.json"
+    suite.main(
+        ["--quick", "--layers", layer, "--lengths", "1", "--latency", "0", "-o", str(out)]
+    )
+    data = json.loads(out.read_text())
+    rows = data["results"]
+    assert {row["scenario"] for row in rows} == {"cold", "warm", "mixed"}
+    ops = {row["operation"] for row in rows if row["scenario"] == "warm"}
+    assert set(suite.OPERATIONS) <= ops
+    warm = [row for row in rows if row["scenario"] == "warm"]
+    assert all(row["errors"] == 0 for row in warm)
+
+    regressed = compare.compare(*[compare._load(str(out))[1]] * 2, threshold=1.25)
+    assert not any(row["regressed"] for row in regressed)
@@ -0,0 +1,108 @@
+"""Tests for the in-process transcript cache."""
+
+from mcp_youtube.operations.cache import TranscriptCache
+
+from .conftest import FakeClock
+
+
+def test_hit_and_miss_counters():
+    cache = TranscriptCache()
+    assert cache.get(("vid", "en")) is None
+    cache.put(("vid", "en"), "value", 10)
+    assert cache.get(("vid", "en")) == "value"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 10
+
+
+def test_lru_eviction_by_entry_count():
+    cache = TranscriptCache(max_entries=2)
+    cache.put(("a", "en"), 1)
+    cache.put(("b", "en"), 2)
+    cache.get(("a", "en"))  # a is now most recently used
+    cache.put(("c", "en"), 3)
+    assert ("a", "en") in cache
+    assert ("b", "en") not in cache
+    assert ("c", "en") in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_eviction_by_byte_budget():
+    cache = TranscriptCache(max_bytes=100)
+    cache.put(("a", "en"), 1, 60)
+    cache.put(("b", "en"), 2, 60)
+    assert ("a", "en") not in cache
+    assert cache.stats()["bytes"] == 60
+
+
+def test_oversized_entry_not_cached():
+    cache = TranscriptCache(max_bytes=100)
+    cache.put(("a", "en"), 1, 101)
+    assert len(cache) == 0
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = TranscriptCache(ttl=10, clock=clock)
+    cache.put(("a", "en"), 1)
+    clock.now = 9.9
+    assert cache.get(("a", "en")) == 1
+    clock.now = 10.0
+    assert cache.get(("a", "en")) is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_override():
+    clock = FakeClock()
+    cache = TranscriptCache(ttl=10, clock=clock)
+    cache.put(("a", "en"), 1, ttl=1)
+    clock.now = 2
+    assert cache.get(("a", "en")) is None
+
+
+def test_invalidate_and_clear():
+    cache = TranscriptCache()
+    cache.put(("a", "en"), 1)
+    cache.put(("a", "es"), 2)
+    cache.put(("b", "en"), 3)
+    assert cache.invalidate(("b", "en")) is True
+    assert cache.invalidate(("b", "en")) is False
+    assert cache.invalidate_video("a") == 2
+    assert len(cache) == 0
+    cache.put(("c", "en"), 1)
+    cache.get(("c", "en"))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 0
+
+
+def test_zero_ttl_disables_cache():
+    cache = TranscriptCache(ttl=0)
+    cache.put(("a", "en"), 1)
+    assert cache.get(("a", "en")) is None
+
+
+def test_configure_shrinks_in_place():
+    cache = TranscriptCache()
+    for i in range(5):
+        cache.put((str(i), "en"), i)
+    cache.configure(max_entries=2)
+    assert len(cache) == 2
+    assert ("4", "en") in cache
+
+
+def test_resize_reaccounts_and_evicts():
+    cache = TranscriptCache(max_bytes=100)
+    value = object()
+    cache.put(("a", "en"), 1, 30)
+    cache.put(("b", "en"), value, 30)
+    cache.resize(("b", "en"), value, 60)
+    assert cache.stats()["bytes"] == 90
+    cache.resize(("b", "en"), object(), 10)  # entry holds another value: ignored
+    assert cache.stats()["bytes"] == 90
+    cache.resize(("b", "en"), value, 80)
+    assert ("a", "en") not in cache and cache.stats()["bytes"] == 80
+    cache.resize(("b", "en"), value, 200)
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
@@ -0,0 +1,155 @@
+"""Tests for embedding-ready transcript chunks and the ``chunk`` CLI command."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import VideoUnavailable
+
+from mcp_youtube import cli
+from mcp_youtube.operations import chunking, transcripts
+from mcp_youtube.operations.compact import Transcript
+
+from .conftest import make_fetched
+
+# Ten 4-char lines, one every 2 seconds: "l000" .. "l009"
+ROWS = [(2.0 * i, 2.5, f"l{i:03d}") for i in range(10)]
+
+
+def _transcript(rows=ROWS, video_id="aaaaaaaaaaa"):
+    return Transcript.from_rows(rows, video_id=video_id, language_code="en")
+
+
+def _fetched(video_id, languages=None):
+    if video_id == "badbadbadba":
+        raise VideoUnavailable(video_id)
+    return make_fetched(ROWS, video_id=video_id)
+
+
+def _lines(chunks):
+    return [(c["first_line"], c["last_line"]) for c in chunks]
+
+
+def test_chars_chunks_hold_whole_lines():
+    chunks = list(chunking.chunks(_transcript(), size=14, unit="chars"))
+    # "l000 l001 l002" is exactly 14 chars.
+    assert _lines(chunks) == [(0, 2), (3, 5), (6, 8), (9, 9)]
+    assert chunks[0]["text"] == "l000 l001 l002"
+    assert chunks[0]["start"] == 0.0 and chunks[0]["end"] == 6.5
+    assert chunks[1]["id"] == "aaaaaaaaaaa:en:1"
+    assert chunks[1]["url"] == "https://www.youtube.com/watch?v=aaaaaaaaaaa&t=6s"
+    assert chunks[-1]["tokens"] == 1
+
+
+def test_tokens_and_seconds_units():
+    # 4 tokens = 16 chars: three lines fit.
+    assert _lines(chunking.chunks(_transcript(), 4, "tokens")) == _lines(
+        chunking.chunks(_transcript(), 16, "chars")
+    )
+    assert _lines(chunking.chunks(_transcript(), 5, "seconds")) == [
+        (0, 2), (3, 5), (6, 8), (9, 9)
+    ]
+
+
+def test_overlap_repeats_trailing_lines():
+    chunks = list(chunking.chunks(_transcript(), size=14, unit="chars", overlap=4))
+    assert _lines(chunks) == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 9)]
+    assert [c["index"] for c in chunks] == [0, 1, 2, 3, 4]
+
+
+def test_oversized_line_is_its_own_chunk():
+    rows = [(0.0, 1.0, "x" * 50), (1.0, 1.0, "short")]
+    chunks = list(chunking.chunks(_transcript(rows), size=10, unit="chars"))
+    assert [c["text"] for c in chunks] == ["x" * 50, "short"]
+
+
+def test_metadata_is_merged_into_every_chunk():
+    chunks = list(chunking.chunks(_transcript(), 100, "chars", metadata={"source": "talks"}))
+    assert all(c["source"] == "talks" for c in chunks)
+
+
+@pytest.mark.parametrize(
+    "size, unit, overlap",
+    [(0, "tokens", 0), (10, "words", 0), (10, "tokens", 10), (10, "tokens", -1)],
+)
+def test_invalid_arguments_rejected_before_fetch(size, unit, overlap):
+    with patch.object(transcripts._api, "fetch") as fetch:
+        with pytest.raises(ValueError):
+            transcripts.iter_chunks("aaaaaaaaaaa", size, unit, overlap)
+        with pytest.raises(ValueError):
+            transcripts.iter_chunks_batch(["aaaaaaaaaaa"], size, unit, overlap)
+    fetch.assert_not_called()
+
+
+def test_iter_chunks_batch_reports_failures():
+    with patch.object(transcripts._api, "fetch", side_effect=_fetched):
+        items = {
+            item["video_id"]: (item, list(item.get("chunks", ())))
+            for item in transcripts.iter_chunks_batch(
+                ["aaaaaaaaaaa", "badbadbadba"], size=14, unit="chars"
+            )
+        }
+    ok, chunks = items["aaaaaaaaaaa"]
+    assert ok["ok"] and ok["language_code"] == "en" and len(chunks) == 4
+    assert items["badbadbadba"][0]["error_code"] == "VIDEO_UNAVAILABLE"
+
+
+def test_batch_reads_inputs_lazily():
+    read = []
+
+    def urls():
+        for i in range(100):
+            read.append(i)
+            yield f"v{i:010d}"
+
+    release = threading.Event()
+
+    def slow(url):
+        release.wait(5)
+        return {}
+
+    results = transcripts._iter_batch(urls(), slow, max_concurrency=2)
+    threading.Timer(0.05, release.set).start()
+    next(results)
+    # A window of two pending results per worker, not the whole input.
+    assert len(read) <= 5
+    results.close()
+
+
+@pytest.fixture
+def chunk_input(tmp_path):
+    path = tmp_path / "videos.txt"
+    path.write_text("aaaaaaaaaaa\nhttps://youtu.be/bbbbbbbbbbb\nbadbadbadba\n")
+    return str(path)
+
+
+def test_cli_chunk_writes_jsonl(tmp_path, chunk_input, capsys):
+    out = tmp_path / "chunks.jsonl"
+    args = ["chunk", chunk_input, "-o", str(out), "--size", "14", "--unit", "chars"]
+    with patch.object(transcripts._api, "fetch", side_effect=_fetched):
+        assert cli.main([*args, "--meta", "corpus=talks", "-q"]) == 1
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert len(rows) == 8
+    assert {r["video_id"] for r in rows} == {"aaaaaaaaaaa", "bbbbbbbbbbb"}
+    assert all(r["corpus"] == "talks" for r in rows)
+    summary = json.loads(capsys.readouterr().err)
+    assert summary["chunked"] == 2 and summary["failed"] == 1 and summary["chunks"] == 8
+
+
+def test_cli_chunk_resume_appends_only_new_videos(tmp_path, chunk_input, capsys):
+    out = tmp_path / "chunks.jsonl"
+    journal = str(tmp_path / "journal.jsonl")
+    args = ["chunk", chunk_input, "-o", str(out), "--unit", "chars", "--size", "14"]
+    with patch.object(transcripts._api, "fetch", side_effect=_fetched):
+        cli.main([*args, "--resume", journal, "-q"])
+    transcripts.clear_cache()
+    with patch.object(transcripts._api, "fetch", side_effect=_fetched) as m:
+        cli.main([*args, "--resume", journal, "-q"])
+    assert [c.args[0] for c in m.call_args_list] == ["badbadbadba"]
+    assert len(out.read_text().splitlines()) == 8
+
+
+def test_cli_chunk_rejects_bad_metadata(chunk_input):
+    with pytest.raises(SystemExit):
+        cli.main(["chunk", chunk_input, "--meta", "novalue", "-q"])
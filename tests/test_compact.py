@@ -0,0 +1,96 @@
+"""Tests for the compact columnar Transcript."""
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from mcp_youtube.operations.compact import Transcript
+
+ROWS = [
+    (0.0, 2.0, "Hello world"),
+    (2.0, 3.0, "multi\nline caption"),
+    (5.0, 1.5, ""),
+    (6.5, 1.0, "héllo ünïcode"),
+]
+
+
+def test_rows_roundtrip():
+    t = Transcript.from_rows(ROWS, video_id="vid", language_code="en")
+    assert len(t) == 4
+    assert [t.text_at(i) for i in range(4)] == [r[2] for r in ROWS]
+    assert [(s.start, s.duration, s.text) for s in t] == ROWS
+    assert t[-1].text == "héllo ünïcode"
+
+
+def test_blob_is_plain_text_form():
+    t = Transcript.from_rows(ROWS)
+    assert t.blob == "\n".join(r[2] for r in ROWS)
+
+
+def test_from_fetched_matches_raw_data():
+    fetched = FetchedTranscript(
+        snippets=[FetchedTranscriptSnippet(text=x, start=s, duration=d) for s, d, x in ROWS],
+        video_id="vid",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    t = Transcript.from_fetched(fetched)
+    assert t.to_raw_data() == fetched.to_raw_data()
+    assert (t.video_id, t.language, t.language_code, t.is_generated) == (
+        "vid",
+        "English",
+        "en",
+        True,
+    )
+
+
+def test_bytes_roundtrip():
+    t = Transcript.from_rows(ROWS)
+    loaded = Transcript.from_bytes(t.to_bytes(), video_id="vid")
+    assert list(loaded) == list(t)
+    assert loaded.video_id == "vid"
+
+
+def test_empty_transcript():
+    t = Transcript.from_rows([])
+    assert len(t) == 0
+    assert t.blob == ""
+    assert list(Transcript.from_bytes(t.to_bytes())) == []
+
+
+def test_slice():
+    t = Transcript.from_rows(ROWS)
+    assert [s.text for s in t.slice(1, 3)] == ["multi\nline caption", ""]
+
+
+def _brute_force(t, a, b, overlap):
+    if overlap:
+        return [i for i, s in enumerate(t) if s.start <= b and s.start + s.duration >= a]
+    return [i for i, s in enumerate(t) if a <= s.start <= b]
+
+
+def test_find_range_matches_linear_scan():
+    import random
+
+    rng = random.Random(7)
+    rows, start = [], 0.0
+    for _ in range(500):
+        duration = rng.uniform(0.5, 8.0)  # long lines overlap their successors
+        rows.append((start, duration, "x"))
+        start += rng.uniform(0.2, 3.0)
+    t = Transcript.from_rows(rows)
+    for _ in range(200):
+        a = rng.uniform(-5, start + 5)
+        b = a + rng.uniform(0, 60)
+        for overlap in (False, True):
+            assert t.find_range(a, b, overlap) == _brute_force(t, a, b, overlap)
+
+
+def test_find_range_inclusive_bounds_and_empty_window():
+    t = Transcript.from_rows(ROWS)
+    assert t.find_range(2.0, 5.0) == [1, 2]
+    assert t.find_range(5.0, 2.0) == []
+
+
+def test_unsorted_rows_are_sorted():
+    t = Transcript.from_rows([(5.0, 1.0, "b"), (0.0, 1.0, "a")])
+    assert [s.text for s in t] == ["a", "b"]
@@ -0,0 +1,95 @@
+"""Tests for the cross-video BM25 corpus index."""
+
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.corpus import CorpusIndex, passages
+
+
+def _transcript(video_id, lines, language_code="en"):
+    return Transcript.from_rows(
+        ((i * 10.0, 5.0, text) for i, text in enumerate(lines)),
+        video_id=video_id,
+        language_code=language_code,
+    )
+
+
+TALKS = {
+    "aaaaaaaaaaa": ["intro to python packaging", "wheels and sdists", "closing remarks"],
+    "bbbbbbbbbbb": ["rust ownership explained", "borrow checker tips", "python bindings with pyo3"],
+    "ccccccccccc": ["cooking pasta", "tomato sauce basics", "more pasta"],
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    index = CorpusIndex(str(tmp_path / "corpus.db"), window=15)
+    for video_id, lines in TALKS.items():
+        index.add(_transcript(video_id, lines))
+    yield index
+    index.close()
+
+
+def test_passages_group_lines_by_window():
+    t = _transcript("v", ["a", "b", "c", "d"])
+    assert [p[2] for p in passages(t, window=15)] == ["a b", "c d"]
+
+
+def test_ranked_hits(corpus):
+    hits = corpus.search("pasta")
+    assert [h["video_id"] for h in hits] == ["ccccccccccc", "ccccccccccc"]
+    assert hits[0]["score"] >= hits[1]["score"]
+    assert {"timestamp", "start", "end", "snippet"} <= set(hits[0])
+
+
+def test_multi_term_query_prefers_more_matches(corpus):
+    hits = corpus.search("python pyo3 bindings")
+    assert hits[0]["video_id"] == "bbbbbbbbbbb"
+    assert hits[0]["timestamp"] == "0:20"
+
+
+def test_video_filter_and_top_k(corpus):
+    hits = corpus.search("python", video_filter=["aaaaaaaaaaa"])
+    assert {h["video_id"] for h in hits} == {"aaaaaaaaaaa"}
+    assert len(corpus.search("python", top_k=1)) == 1
+
+
+def test_reindex_replaces_and_delete_removes(corpus):
+    before = corpus.stats()
+    corpus.add(_transcript("ccccccccccc", ["only soup now"]))
+    assert corpus.search("pasta") == []
+    assert corpus.search("soup")[0]["video_id"] == "ccccccccccc"
+    assert corpus.delete("bbbbbbbbbbb") == 2
+    stats = corpus.stats()
+    assert stats["videos"] == 2
+    assert stats["passages"] == before["passages"] - 3
+    assert corpus.search("borrow") == []
+
+
+def test_fetched_transcripts_are_indexed_and_searchable(tmp_path):
+    fetched = FetchedTranscript(
+        snippets=[FetchedTranscriptSnippet(text="never gonna give you up", start=0.0, duration=2.0)],
+        video_id="dQw4w9WgXcQ",
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+    transcripts.configure_corpus(str(tmp_path / "corpus.db"))
+    try:
+        with patch.object(transcripts._api, "fetch", return_value=fetched):
+            transcripts.get_transcript("dQw4w9WgXcQ")
+        with patch.object(transcripts._api, "fetch", side_effect=AssertionError):
+            hits = transcripts.search_corpus("give up", video_filter=["https://youtu.be/dQw4w9WgXcQ"])
+        assert hits[0]["video_id"] == "dQw4w9WgXcQ"
+        assert transcripts.corpus_stats()["videos"] == 1
+    finally:
+        transcripts.configure_corpus(None)
+
+
+def test_search_corpus_requires_configuration():
+    with pytest.raises(RuntimeError, match="MCP_YOUTUBE_CORPUS_PATH"):
+        transcripts.search_corpus("anything")
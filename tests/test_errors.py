@@ -0,0 +1,197 @@
+"""Tests for error classification, negative caching and the circuit breaker."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from youtube_transcript_api import (
+    IpBlocked,
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeRequestFailed,
+)
+
+from mcp_youtube.operations import errors, transcripts
+from mcp_youtube.operations.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from mcp_youtube.operations.errors import CircuitOpenError
+
+from .conftest import FakeClock
+
+
+def _failing(exc):
+    def fn(*args, **kwargs):
+        raise exc
+
+    return fn
+
+
+@pytest.fixture
+def single_attempt():
+    transcripts.configure_rate_limit(max_attempts=1)
+    transcripts.configure_circuit_breaker(failure_threshold=5)
+    yield
+    transcripts.configure_rate_limit(rate=10.0, max_attempts=4)
+    transcripts.configure_circuit_breaker(failure_threshold=5)
+
+
+# ---------------------------------------------------------------------------
+# classification
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "exc, code, retryable",
+    [
+        (TranscriptsDisabled("x"), errors.TRANSCRIPTS_DISABLED, False),
+        (NoTranscriptFound("x", ["en"], []), errors.NO_TRANSCRIPT, False),
+        (VideoUnavailable("x"), errors.VIDEO_UNAVAILABLE, False),
+        (IpBlocked("x"), errors.RATE_LIMITED, True),
+        (YouTubeRequestFailed("x", Exception("503")), errors.UPSTREAM_ERROR, True),
+        (CircuitOpenError(10), errors.CIRCUIT_OPEN, True),
+        (ValueError("bad"), errors.INVALID_ARGUMENT, False),
+        (RuntimeError("boom"), errors.INTERNAL_ERROR, False),
+    ],
+)
+def test_classify(exc, code, retryable):
+    assert errors.classify(exc) == (code, retryable)
+
+
+def test_error_response_is_structured_and_keeps_message():
+    body = json.loads(errors.error_response("Error fetching transcript", VideoUnavailable("x")))
+    assert body["error"]["code"] == errors.VIDEO_UNAVAILABLE
+    assert body["error"]["retryable"] is False
+    assert body["error"]["message"].startswith("Error fetching transcript: ")
+
+
+# ---------------------------------------------------------------------------
+# negative cache
+# ---------------------------------------------------------------------------
+
+
+def test_permanent_failure_is_negatively_cached(single_attempt):
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(TranscriptsDisabled("dQw4w9WgXcQ"))
+    ) as mock_fetch:
+        for _ in range(3):
+            with pytest.raises(TranscriptsDisabled):
+                transcripts.get_transcript("dQw4w9WgXcQ")
+    assert mock_fetch.call_count == 1
+
+
+def test_negative_cache_hits_do_not_grow_traceback(single_attempt):
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(TranscriptsDisabled("dQw4w9WgXcQ"))
+    ):
+        depths = []
+        for _ in range(20):
+            with pytest.raises(TranscriptsDisabled) as info:
+                transcripts.get_transcript("dQw4w9WgXcQ")
+            depths.append(len(info.traceback))
+            assert info.value.video_id == "dQw4w9WgXcQ"
+    remembered = transcripts._negative_cache.peek(("dQw4w9WgXcQ", "en"))
+    assert remembered.__traceback__ is None
+    assert len(set(depths[1:])) == 1
+
+
+def test_transient_failure_is_not_negatively_cached(single_attempt):
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(IpBlocked("dQw4w9WgXcQ"))
+    ) as mock_fetch:
+        for _ in range(2):
+            with pytest.raises(IpBlocked):
+                transcripts.get_transcript("dQw4w9WgXcQ")
+    assert mock_fetch.call_count == 2
+
+
+def test_invalidate_cache_forgets_negative_entry(single_attempt):
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(TranscriptsDisabled("dQw4w9WgXcQ"))
+    ) as mock_fetch:
+        with pytest.raises(TranscriptsDisabled):
+            transcripts.get_transcript("dQw4w9WgXcQ")
+        transcripts.invalidate_cache("dQw4w9WgXcQ")
+        with pytest.raises(TranscriptsDisabled):
+            transcripts.get_transcript("dQw4w9WgXcQ")
+    assert mock_fetch.call_count == 2
+
+
+def test_batch_items_carry_error_codes(single_attempt):
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(VideoUnavailable("badbadbadba"))
+    ):
+        [item] = transcripts.get_transcripts_batch(["badbadbadba"])
+    assert item["ok"] is False
+    assert item["error_code"] == errors.VIDEO_UNAVAILABLE
+
+
+# ---------------------------------------------------------------------------
+# circuit breaker
+# ---------------------------------------------------------------------------
+
+
+def test_breaker_opens_after_consecutive_transient_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    fail = _failing(IpBlocked("x"))
+    for _ in range(3):
+        with pytest.raises(IpBlocked):
+            breaker.call(fail)
+    assert breaker.state == OPEN
+    calls = []
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.call(calls.append, 1)
+    assert calls == []
+    assert info.value.retry_after == 10
+
+
+def test_breaker_half_open_trial_closes_or_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    with pytest.raises(IpBlocked):
+        breaker.call(_failing(IpBlocked("x")))
+    clock.now = 11
+    with pytest.raises(IpBlocked):
+        breaker.call(_failing(IpBlocked("x")))
+    assert breaker.state == OPEN
+    clock.now = 22
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_breaker_lets_one_trial_through_while_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    with pytest.raises(IpBlocked):
+        breaker.call(_failing(IpBlocked("x")))
+    clock.now = 11
+
+    def trial():
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "concurrent")
+        return "ok"
+
+    assert breaker.call(trial) == "ok"
+
+
+def test_permanent_errors_do_not_trip_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    with pytest.raises(TranscriptsDisabled):
+        breaker.call(_failing(TranscriptsDisabled("x")))
+    assert breaker.state == CLOSED
+
+
+def test_fetch_fails_fast_when_circuit_open(single_attempt):
+    transcripts.configure_circuit_breaker(failure_threshold=2)
+    with patch.object(
+        transcripts._api, "fetch", side_effect=_failing(IpBlocked("x"))
+    ) as mock_fetch:
+        for video_id in ("aaaaaaaaaaa", "bbbbbbbbbbb"):
+            with pytest.raises(IpBlocked):
+                transcripts.get_transcript(video_id)
+        with pytest.raises(CircuitOpenError):
+            transcripts.get_transcript("ccccccccccc")
+    assert mock_fetch.call_count == 2
+    assert transcripts.upstream_stats()["circuit_breaker"]["state"] == OPEN
@@ -0,0 +1,109 @@
+"""Tests for the incremental transcript output formats."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_youtube.langchain_tools import (
+    yt_get_transcript_with_timestamps,
+    yt_search_transcript,
+)
+from mcp_youtube.operations import formats
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.transcripts import get_transcript_with_timestamps
+
+ROWS = [
+    (0.0, 2.5, "Hello world"),
+    (2.5, 3.0, 'She said "hi"'),
+    (3661.25, 1.5, "café – ünïcode"),
+]
+
+
+def _transcript(rows=ROWS):
+    return Transcript.from_rows(rows, video_id="dQw4w9WgXcQ")
+
+
+def test_json_matches_json_dumps_of_raw_data():
+    transcript = _transcript()
+    assert formats.render(transcript) == json.dumps(transcript.to_raw_data())
+
+
+def test_compact_and_ndjson_round_trip():
+    transcript = _transcript()
+    compact = formats.render(transcript, "compact")
+    expected = [[start, duration, text] for start, duration, text in ROWS]
+    assert compact == json.dumps(expected, separators=(",", ":"))
+    lines = formats.render(transcript, "ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == transcript.to_raw_data()
+
+
+def test_srt_and_vtt_cues():
+    transcript = _transcript()
+    srt = formats.render(transcript, "srt")
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:02,500\nHello world\n\n2\n")
+    assert "3\n01:01:01,250 --> 01:01:02,750\ncafé – ünïcode\n\n" in srt
+    vtt = formats.render(transcript, "vtt")
+    assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\nHello world\n\n")
+    assert "01:01:01.250 --> 01:01:02.750" in vtt
+
+
+@pytest.mark.parametrize("fmt", formats.FORMATS)
+def test_chunks_join_to_the_same_output(fmt):
+    rows = [(float(i), 1.0, f"line {i}") for i in range(1000)]
+    transcript = _transcript(rows)
+    chunks = list(formats.iter_chunks(transcript, fmt, chunk_lines=64))
+    assert len(chunks) >= 1000 // 64
+    assert "".join(chunks) == formats.render(transcript, fmt)
+    out = io.StringIO()
+    assert formats.write(transcript, out, fmt) == len(out.getvalue())
+    assert out.getvalue() == "".join(chunks)
+
+
+def test_empty_transcript():
+    transcript = _transcript([])
+    assert json.loads(formats.render(transcript)) == []
+    assert json.loads(formats.render(transcript, "compact")) == []
+    assert formats.render(transcript, "ndjson") == ""
+    assert formats.render(transcript, "vtt") == "WEBVTT\n\n"
+
+
+def test_unknown_format_fails_before_fetching():
+    with patch("mcp_youtube.operations.transcripts._fetch") as mock_fetch:
+        with pytest.raises(ValueError, match="format must be one of"):
+            get_transcript_with_timestamps("dQw4w9WgXcQ", format="xml")
+    mock_fetch.assert_not_called()
+
+
+def test_get_transcript_with_timestamps_format():
+    with patch("mcp_youtube.operations.transcripts._fetch", return_value=_transcript()):
+        assert get_transcript_with_timestamps("dQw4w9WgXcQ", format="srt").startswith("1\n")
+
+
+def test_dumps_compact():
+    value = [{"language": "English", "language_code": "en"}]
+    assert formats.dumps(value) == json.dumps(value, indent=2)
+    assert formats.dumps(value, compact=True) == '[{"language":"English","language_code":"en"}]'
+
+
+@patch("mcp_youtube.handlers.transcripts.get_transcript_with_timestamps")
+def test_langchain_format_and_compact(mock_op):
+    mock_op.return_value = "WEBVTT\n\n"
+    result = yt_get_transcript_with_timestamps.invoke({"video_url": "abc123", "format": "vtt"})
+    assert result == "WEBVTT\n\n"
+    mock_op.assert_called_once_with("abc123", "en", False, "vtt", "none")
+
+    paged = yt_get_transcript_with_timestamps.invoke(
+        {"video_url": "abc123", "max_chars": 100, "format": "srt"}
+    )
+    assert json.loads(paged)["error"]["code"] == "INVALID_ARGUMENT"
+
+    with patch(
+        "mcp_youtube.handlers.transcripts.search_transcript",
+        return_value=[{"start": 1.0, "text": "match"}],
+    ):
+        result = yt_search_transcript.invoke(
+            {"video_url": "abc123", "search_term": "match", "compact": True}
+        )
+    assert result == '[{"start":1.0,"text":"match"}]'
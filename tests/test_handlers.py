@@ -0,0 +1,51 @@
+"""Tests for the tool bodies shared by the MCP server and LangChain tools."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from mcp_youtube import handlers, server
+from mcp_youtube.langchain_tools import yt_get_transcript_with_timestamps
+
+PAGE = {"content": "Hello", "next_cursor": None}
+
+
+def test_sync_and_async_dispatch_pages_alike():
+    async def apage(*args):
+        return PAGE
+
+    with (
+        patch("mcp_youtube.handlers.transcripts.get_transcript_page", return_value=PAGE) as page,
+        patch("mcp_youtube.handlers.transcripts_async.get_transcript_page", apage),
+    ):
+        sync = handlers.get_transcript("abc", max_chars=10)
+        result = asyncio.run(handlers.get_transcript.acall("abc", max_chars=10))
+    assert sync == result == json.dumps(PAGE, indent=2)
+    page.assert_called_once_with("abc", "en", 10, None, None, False, False, "none")
+
+
+def test_every_entry_point_reports_the_same_error():
+    args = {"video_url": "abc", "max_chars": 10, "format": "srt"}
+    results = [
+        yt_get_transcript_with_timestamps.invoke(args),
+        asyncio.run(yt_get_transcript_with_timestamps.ainvoke(args)),
+        asyncio.run(server.get_transcript_with_timestamps(**args)),
+    ]
+    assert len(set(results)) == 1
+    error = json.loads(results[0])["error"]
+    assert error["code"] == "INVALID_ARGUMENT"
+    assert "pages are JSON only" in error["message"]
+
+
+def test_no_matches_message_is_shared():
+    async def none(*args):
+        return []
+
+    with (
+        patch("mcp_youtube.handlers.transcripts.search_corpus", return_value=[]),
+        patch("mcp_youtube.handlers.transcripts_async.search_corpus", none),
+    ):
+        sync = handlers.search_corpus("rare")
+        result = asyncio.run(server.search_corpus("rare"))
+    assert sync == result == "No matches found for 'rare'"
+
@@ -0,0 +1,108 @@
+"""Tests for the pooled, thread-safe upstream HTTP client."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import requests
+
+from benchmarks.bench_http_pool import _CountingHandler, local_server
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.http import HttpConfig, ProxyRotation, UpstreamClient
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("MCP_YOUTUBE_HTTP_POOL_SIZE", "4")
+    monkeypatch.setenv("MCP_YOUTUBE_HTTP_READ_TIMEOUT", "2.5")
+    monkeypatch.setenv("MCP_YOUTUBE_PROXIES", "http://a:1, http://b:2")
+    config = HttpConfig.from_env()
+    assert config.pool_size == 4
+    assert config.read_timeout == 2.5
+    assert config.connect_timeout == HttpConfig().connect_timeout
+    assert config.proxies == ("http://a:1", "http://b:2")
+
+
+def test_session_applies_default_timeout_and_rotates_proxies():
+    client = UpstreamClient(
+        HttpConfig(connect_timeout=1.0, read_timeout=3.0, proxies=("http://a:1", "http://b:2"))
+    )
+    with patch.object(requests.Session, "request") as mock_request:
+        session = client.session()
+        session.get("https://www.youtube.com/")
+        session.get("https://www.youtube.com/", timeout=9)
+    first, second = (call.kwargs for call in mock_request.call_args_list)
+    assert first["timeout"] == (1.0, 3.0)
+    assert second["timeout"] == 9
+    assert first["proxies"]["https"] == "http://a:1"
+    assert second["proxies"]["https"] == "http://b:2"
+
+
+def test_proxy_rotation_is_round_robin():
+    rotation = ProxyRotation(["p1", "p2"])
+    assert [rotation.next()["http"] for _ in range(3)] == ["p1", "p2", "p1"]
+
+
+def test_each_thread_gets_its_own_api_over_one_pool():
+    client = UpstreamClient(HttpConfig(pool_size=4))
+    seen = []
+
+    def grab():
+        session, api = client._thread_api()
+        seen.append((session, api, session.get_adapter("https://www.youtube.com/")))
+
+    threads = [threading.Thread(target=grab) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(api) for _, api, _ in seen}) == 3
+    assert len({id(adapter) for _, _, adapter in seen}) == 1
+    assert client.stats()["sessions"] == 3
+
+
+def test_configure_rebuilds_sessions():
+    client = UpstreamClient(HttpConfig(pool_size=2))
+    before = client.session()
+    client.configure(HttpConfig(pool_size=8))
+    assert client.session() is not before
+    assert client.session().get_adapter("http://x/")._pool_maxsize == 8
+
+
+def test_connections_are_reused_across_threads():
+    client = UpstreamClient(HttpConfig(pool_size=4))
+    with local_server() as url:
+        _CountingHandler.connections = 0
+        threads = [
+            threading.Thread(
+                target=lambda: [client.session().get(url).content for _ in range(10)]
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert _CountingHandler.connections <= 4
+
+
+def test_configure_http_keeps_unspecified_settings():
+    original = transcripts._api.config
+    try:
+        transcripts.configure_http(read_timeout=7.0)
+        assert transcripts._api.config.read_timeout == 7.0
+        assert transcripts._api.config.pool_size == original.pool_size
+    finally:
+        transcripts._api.configure(original)
+
+
+def test_bind_fetches_through_the_calling_threads_session():
+    client = UpstreamClient()
+    track = SimpleNamespace(_http_client=client.session(), language_code="en")
+    bound = []
+    thread = threading.Thread(target=lambda: bound.append((client.bind(track), client.session())))
+    thread.start()
+    thread.join()
+    (copy, session), = bound
+    assert copy._http_client is session
+    assert session is not track._http_client
+    assert copy.language_code == "en"
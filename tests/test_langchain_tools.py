@@ -1,14 +1,22 @@
 """Tests for YouTube LangChain tool wrappers."""
 
+import asyncio
+import json
 from unittest.mock import patch
 
+from mcp_youtube import langchain_tools
 from mcp_youtube.langchain_tools import (
     TOOLS,
     yt_get_transcript,
     yt_get_transcript_with_timestamps,
     yt_list_available_transcripts,
     yt_get_transcript_segment,
+    yt_get_transcript_segments,
     yt_search_transcript,
+    yt_get_transcripts_batch,
+    yt_search_transcripts_batch,
+    yt_get_transcripts_multilang,
+    yt_search_corpus,
 )
 
 
@@ -16,7 +24,7 @@ class TestToolRegistration:
     """Verify all tools are properly registered and have correct metadata."""
 
     def test_tools_list_length(self):
-        assert len(TOOLS) == 5
+        assert len(TOOLS) == 10
 
     def test_all_tools_have_yt_prefix(self):
         for t in TOOLS:
@@ -37,7 +45,12 @@ class TestToolRegistration:
             "yt_get_transcript_with_timestamps",
             "yt_list_available_transcripts",
             "yt_get_transcript_segment",
+            "yt_get_transcript_segments",
             "yt_search_transcript",
+            "yt_get_transcripts_batch",
+            "yt_search_transcripts_batch",
+            "yt_get_transcripts_multilang",
+            "yt_search_corpus",
         }
         assert names == expected
 
@@ -45,14 +58,21 @@ class TestToolRegistration:
 class TestToolInvocation:
     """Verify tools correctly delegate to operations layer."""
 
-    @patch("mcp_youtube.langchain_tools.transcripts.get_transcript")
+    @patch("mcp_youtube.handlers.transcripts.get_transcript")
     def test_get_transcript(self, mock_op):
         mock_op.return_value = "Hello world"
         result = yt_get_transcript.invoke({"video_url": "abc123", "language": "en"})
         assert result == "Hello world"
-        mock_op.assert_called_once_with("abc123", "en")
+        mock_op.assert_called_once_with("abc123", "en", False, "none")
 
-    @patch("mcp_youtube.langchain_tools.transcripts.get_transcript_with_timestamps")
+    @patch("mcp_youtube.handlers.transcripts.get_transcript_page")
+    def test_get_transcript_paged(self, mock_op):
+        mock_op.return_value = {"content": "Hello", "next_cursor": "abc"}
+        result = yt_get_transcript.invoke({"video_url": "abc123", "max_tokens": 50})
+        assert '"next_cursor": "abc"' in result
+        mock_op.assert_called_once_with("abc123", "en", None, 50, None, False, False, "none")
+
+    @patch("mcp_youtube.handlers.transcripts.get_transcript_with_timestamps")
     def test_get_transcript_with_timestamps(self, mock_op):
         mock_op.return_value = '[{"text": "Hi"}]'
         result = yt_get_transcript_with_timestamps.invoke(
@@ -60,13 +80,13 @@ class TestToolInvocation:
         )
         assert "Hi" in result
 
-    @patch("mcp_youtube.langchain_tools.transcripts.list_available_transcripts")
+    @patch("mcp_youtube.handlers.transcripts.list_available_transcripts")
     def test_list_available_transcripts(self, mock_op):
         mock_op.return_value = [{"language": "English", "language_code": "en"}]
         result = yt_list_available_transcripts.invoke({"video_url": "abc123"})
         assert "English" in result
 
-    @patch("mcp_youtube.langchain_tools.transcripts.get_transcript_segment")
+    @patch("mcp_youtube.handlers.transcripts.get_transcript_segment")
     def test_get_transcript_segment(self, mock_op):
         mock_op.return_value = "segment text"
         result = yt_get_transcript_segment.invoke(
@@ -74,7 +94,16 @@ class TestToolInvocation:
         )
         assert result == "segment text"
 
-    @patch("mcp_youtube.langchain_tools.transcripts.search_transcript")
+    @patch("mcp_youtube.handlers.transcripts.get_transcript_segments")
+    def test_get_transcript_segments(self, mock_op):
+        mock_op.return_value = [{"start_time": 0, "end_time": 10, "text": "seg"}]
+        result = yt_get_transcript_segments.invoke(
+            {"video_url": "abc123", "ranges": [[0, 10]], "mode": "overlap"}
+        )
+        assert '"text": "seg"' in result
+        mock_op.assert_called_once_with("abc123", [(0.0, 10.0)], "en", "overlap")
+
+    @patch("mcp_youtube.handlers.transcripts.search_transcript")
     def test_search_transcript_found(self, mock_op):
         mock_op.return_value = [{"timestamp": "0:05", "text": "match"}]
         result = yt_search_transcript.invoke(
@@ -82,7 +111,7 @@ class TestToolInvocation:
         )
         assert "match" in result
 
-    @patch("mcp_youtube.langchain_tools.transcripts.search_transcript")
+    @patch("mcp_youtube.handlers.transcripts.search_transcript")
     def test_search_transcript_not_found(self, mock_op):
         mock_op.return_value = []
         result = yt_search_transcript.invoke(
@@ -90,8 +119,88 @@ class TestToolInvocation:
         )
         assert "No matches found" in result
 
-    @patch("mcp_youtube.langchain_tools.transcripts.get_transcript")
+    @patch("mcp_youtube.handlers.transcripts.get_transcripts_batch")
+    def test_get_transcripts_batch(self, mock_op):
+        mock_op.return_value = [{"index": 0, "video_id": "abc123", "ok": True, "transcript": "hi"}]
+        result = yt_get_transcripts_batch.invoke({"video_urls": ["abc123"]})
+        assert '"transcript": "hi"' in result
+        # No max_concurrency: the operation falls back to MCP_YOUTUBE_BATCH_CONCURRENCY.
+        mock_op.assert_called_once_with(["abc123"], "en", None)
+
+    @patch("mcp_youtube.handlers.transcripts.search_transcripts_batch")
+    def test_search_transcripts_batch(self, mock_op):
+        mock_op.return_value = [{"index": 0, "video_id": "abc123", "ok": True, "matches": []}]
+        result = yt_search_transcripts_batch.invoke(
+            {"video_urls": ["abc123"], "search_term": "x", "max_concurrency": 2}
+        )
+        assert "abc123" in result
+        mock_op.assert_called_once_with(["abc123"], "x", "en", 2)
+
+    @patch("mcp_youtube.handlers.transcripts.get_transcripts_multilang")
+    def test_get_transcripts_multilang(self, mock_op):
+        mock_op.return_value = {"video_id": "abc123", "languages": []}
+        result = yt_get_transcripts_multilang.invoke(
+            {"video_url": "abc123", "languages": ["en", "fr"]}
+        )
+        assert '"video_id": "abc123"' in result
+        mock_op.assert_called_once_with("abc123", ["en", "fr"], None)
+
+    @patch("mcp_youtube.handlers.transcripts.search_corpus")
+    def test_search_corpus(self, mock_op):
+        mock_op.return_value = [{"video_id": "abc123", "timestamp": "1:00", "snippet": "hit"}]
+        result = yt_search_corpus.invoke({"query": "hit", "top_k": 3})
+        assert "abc123" in result
+        mock_op.assert_called_once_with("hit", 3, None)
+
+    @patch("mcp_youtube.handlers.transcripts.get_transcript")
     def test_error_handling(self, mock_op):
         mock_op.side_effect = RuntimeError("API down")
         result = yt_get_transcript.invoke({"video_url": "abc123", "language": "en"})
         assert "Error" in result
+
+
+class TestAsyncTools:
+    """ainvoke / abatch run the native coroutines under the shared limit."""
+
+    def test_ainvoke_uses_async_operation(self):
+        async def fake(video_url, language, translate, normalize):
+            return f"async {video_url}"
+
+        with patch("mcp_youtube.handlers.transcripts_async.get_transcript", fake), patch(
+            "mcp_youtube.handlers.transcripts.get_transcript"
+        ) as sync_op:
+            result = asyncio.run(yt_get_transcript.ainvoke({"video_url": "abc123"}))
+        assert result == "async abc123"
+        sync_op.assert_not_called()
+
+    def test_ainvoke_error_handling(self):
+        async def fail(*args):
+            raise RuntimeError("API down")
+
+        with patch("mcp_youtube.handlers.transcripts_async.search_transcript", fail):
+            result = asyncio.run(
+                yt_search_transcript.ainvoke({"video_url": "abc123", "search_term": "x"})
+            )
+        assert json.loads(result)["error"]["code"] == "INTERNAL_ERROR"
+
+    def test_abatch_respects_shared_concurrency_limit(self):
+        running = peak = 0
+
+        async def slow(video_url, language, translate, normalize):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return video_url
+
+        langchain_tools.configure_concurrency(3)
+        try:
+            with patch("mcp_youtube.handlers.transcripts_async.get_transcript", slow):
+                results = asyncio.run(
+                    yt_get_transcript.abatch([{"video_url": f"v{i}"} for i in range(20)])
+                )
+        finally:
+            langchain_tools.configure_concurrency(32)
+        assert results == [f"v{i}" for i in range(20)]
+        assert peak == 3
@@ -0,0 +1,304 @@
+"""Tests for language preference resolution and TranscriptList caching."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    NoTranscriptFound,
+)
+
+from mcp_youtube.operations import languages, transcripts, transcripts_async
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+class FakeTrack:
+    """Stand-in for youtube_transcript_api.Transcript."""
+
+    def __init__(self, code, generated=False, translatable=False, translated_from=None):
+        self.video_id = VIDEO_ID
+        self.language = code.upper()
+        self.language_code = code
+        self.is_generated = generated
+        self.is_translatable = translatable
+        self.translation_languages = (
+            [SimpleNamespace(language_code=c) for c in ("fr", "de", "ja")]
+            if translatable
+            else []
+        )
+        self.translated_from = translated_from
+        self.translations = []
+        # Shared with copies, which is how transcripts rebinds a track's session
+        self.fetched_via = []
+
+    @property
+    def fetches(self):
+        return len(self.fetched_via)
+
+    def translate(self, code):
+        self.translations.append(code)
+        return FakeTrack(code, generated=True, translated_from=self)
+
+    def fetch(self):
+        self.fetched_via.append(getattr(self, "_http_client", None))
+        return FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(
+                    text=f"{self.language_code} text", start=0.0, duration=1.0
+                )
+            ],
+            video_id=self.video_id,
+            language=self.language,
+            language_code=self.language_code,
+            is_generated=self.is_generated,
+        )
+
+
+class FakeList(list):
+    video_id = VIDEO_ID
+
+
+def _listing():
+    return FakeList(
+        [
+            FakeTrack("en", translatable=True),
+            FakeTrack("es-MX"),
+            FakeTrack("en", generated=True),
+            FakeTrack("de", generated=True),
+        ]
+    )
+
+
+# ---------------------------------------------------------------------------
+# resolve
+# ---------------------------------------------------------------------------
+
+
+def test_preferences_normalizes_and_dedupes():
+    assert languages.preferences("en") == ("en",)
+    assert languages.preferences(["de", " en ", "de", ""]) == ("de", "en")
+    with pytest.raises(ValueError):
+        languages.preferences([])
+
+
+def test_spec_round_trip():
+    assert languages.spec(("en",)) == "en"
+    assert languages.parse_spec(languages.spec(("de", "en"), True)) == (("de", "en"), True)
+
+
+def test_exact_match_prefers_manual_track():
+    track = languages.resolve(_listing(), ["en"])
+    assert track.language_code == "en" and not track.is_generated
+
+
+def test_preference_order_is_respected():
+    track = languages.resolve(_listing(), ["ja", "de", "en"])
+    assert track.language_code == "de"
+
+
+def test_regional_variant_matches_both_ways():
+    assert languages.resolve(_listing(), ["en-US"]).language_code == "en"
+    assert languages.resolve(_listing(), ["es"]).language_code == "es-MX"
+
+
+def test_exact_match_beats_regional_variant_of_earlier_preference():
+    # "en-GB" has no exact track, but "de" does; exact matches are tried first.
+    assert languages.resolve(_listing(), ["en-GB", "de"]).language_code == "de"
+
+
+def test_translation_only_when_requested():
+    with pytest.raises(NoTranscriptFound):
+        languages.resolve(_listing(), ["fr"])
+    track = languages.resolve(_listing(), ["fr"], translate=True)
+    assert track.language_code == "fr"
+    assert track.translated_from.language_code == "en"
+
+
+# ---------------------------------------------------------------------------
+# fetch path
+# ---------------------------------------------------------------------------
+
+
+def test_cached_listing_serves_several_languages_without_relisting():
+    listing = _listing()
+    with (
+        patch.object(transcripts._api, "list", return_value=listing) as mock_list,
+        patch.object(transcripts._api, "fetch", side_effect=AssertionError),
+    ):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        assert transcripts.get_transcript(VIDEO_ID, ["de", "en"]) == "de text"
+        assert transcripts.get_transcript(VIDEO_ID, "en-US") == "en text"
+        assert transcripts.get_transcript(VIDEO_ID, "fr", translate=True) == "fr text"
+    assert mock_list.call_count == 1
+
+
+def test_no_exact_match_falls_back_without_second_listing():
+    listing = _listing()
+
+    def fetch(video_id, languages):
+        raise NoTranscriptFound(video_id, languages, listing)
+
+    with (
+        patch.object(transcripts._api, "fetch", side_effect=fetch) as mock_fetch,
+        patch.object(transcripts._api, "list", side_effect=AssertionError),
+    ):
+        assert transcripts.get_transcript(VIDEO_ID, "en-US") == "en text"
+        # The listing is now cached: another language resolves locally.
+        assert transcripts.get_transcript(VIDEO_ID, "es") == "es-MX text"
+    assert mock_fetch.call_count == 1
+
+
+def test_resolved_transcript_is_cached_under_matched_language():
+    with patch.object(transcripts._api, "list", return_value=_listing()):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        transcripts.get_transcript(VIDEO_ID, "en-US")
+    assert (VIDEO_ID, "en") in transcripts._cache
+
+
+def test_translation_does_not_answer_plain_requests():
+    with patch.object(transcripts._api, "list", return_value=_listing()):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        assert transcripts.get_transcript(VIDEO_ID, "fr", translate=True) == "fr text"
+        assert (VIDEO_ID, "fr") not in transcripts._cache
+        with pytest.raises(NoTranscriptFound):
+            transcripts.get_transcript(VIDEO_ID, "fr")
+
+
+def test_translation_is_not_persisted_to_store(tmp_path):
+    listing = _listing()
+
+    def fetch(video_id, languages):
+        raise NoTranscriptFound(video_id, languages, listing)
+
+    transcripts.configure_store(str(tmp_path / "store.db"))
+    try:
+        with patch.object(transcripts._api, "fetch", side_effect=fetch):
+            transcripts.get_transcript(VIDEO_ID, "fr", translate=True)
+            transcripts.get_transcript(VIDEO_ID, "de")
+            assert transcripts._store.get(VIDEO_ID, "fr") is None
+            assert transcripts._store.get(VIDEO_ID, "de") is not None
+            transcripts.clear_cache()
+            with pytest.raises(NoTranscriptFound):
+                transcripts.get_transcript(VIDEO_ID, "fr")
+    finally:
+        transcripts.configure_store(None)
+
+
+def test_store_does_not_override_preference_order(tmp_path):
+    transcripts.configure_store(str(tmp_path / "store.db"))
+    try:
+        with patch.object(transcripts._api, "list", return_value=_listing()):
+            transcripts.list_available_transcripts(VIDEO_ID)
+            assert transcripts.get_transcript(VIDEO_ID, "en") == "en text"
+            assert transcripts.get_transcript(VIDEO_ID, ["de", "en"]) == "de text"
+    finally:
+        transcripts.configure_store(None)
+
+
+def test_invalidate_language_drops_every_key_serving_it():
+    listing = _listing()
+    with patch.object(transcripts._api, "list", return_value=listing):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        transcripts.get_transcript(VIDEO_ID, ["en-US", "en"])
+        transcripts.get_transcript(VIDEO_ID, "en", translate=True)
+        transcripts.get_transcript(VIDEO_ID, "de")
+        # "en-US,en", "en|translate" and the plain "en" entry; "de" and the listing stay.
+        assert transcripts.invalidate_cache(VIDEO_ID, "en") == 3
+        assert (VIDEO_ID, "de") in transcripts._cache
+        fetches = listing[0].fetches
+        transcripts.get_transcript(VIDEO_ID, ["en-US", "en"])
+    assert listing[0].fetches == fetches + 1
+
+
+def test_unmatched_preferences_raise_and_are_negatively_cached():
+    listing = _listing()
+    with patch.object(transcripts._api, "list", return_value=listing):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        for _ in range(2):
+            with pytest.raises(NoTranscriptFound):
+                transcripts.get_transcript(VIDEO_ID, ["ja", "ko"])
+    assert sum(track.fetches for track in listing) == 0
+    assert transcripts._negative_cache.peek((VIDEO_ID, "ja,ko")) is not None
+
+
+# ---------------------------------------------------------------------------
+# multi-language fan-out
+# ---------------------------------------------------------------------------
+
+
+def _check_multilang(result, listing):
+    items = {item["language"]: item for item in result["languages"]}
+    assert [item["language"] for item in result["languages"]] == ["en", "de", "fr", "ko"]
+    assert items["en"]["match"] == "exact" and items["en"]["transcript"] == "en text"
+    assert items["de"]["match"] == "exact"
+    assert items["fr"]["match"] == "translation" and items["fr"]["transcript"] == "fr text"
+    assert items["ko"]["ok"] is False and items["ko"]["error_code"] == "NO_TRANSCRIPT"
+    assert all("elapsed_ms" in item for item in result["languages"])
+    # Only the missing, translatable language was translated.
+    assert set(listing[0].translations) == {"fr"}
+
+
+def test_multilang_lists_once_and_translates_only_missing():
+    listing = _listing()
+    with (
+        patch.object(transcripts._api, "list", return_value=listing) as mock_list,
+        patch.object(transcripts._api, "fetch", side_effect=AssertionError),
+    ):
+        result = transcripts.get_transcripts_multilang(VIDEO_ID, ["en", "de", "fr", "ko"])
+    assert mock_list.call_count == 1
+    assert result["video_id"] == VIDEO_ID
+    _check_multilang(result, listing)
+
+
+def test_multilang_async():
+    listing = _listing()
+    with (
+        patch.object(transcripts._api, "list", return_value=listing) as mock_list,
+        patch.object(transcripts._api, "fetch", side_effect=AssertionError),
+    ):
+        result = asyncio.run(
+            transcripts_async.get_transcripts_multilang(VIDEO_ID, ["en", "de", "fr", "ko"])
+        )
+    assert mock_list.call_count == 1
+    _check_multilang(result, listing)
+
+
+def test_multilang_reuses_cached_languages():
+    listing = _listing()
+    with patch.object(transcripts._api, "list", return_value=listing):
+        transcripts.get_transcripts_multilang(VIDEO_ID, ["en", "de"])
+        transcripts.get_transcripts_multilang(VIDEO_ID, ["en", "de"])
+    assert listing[0].fetches == 1
+    assert listing[3].fetches == 1
+
+
+def test_multilang_translation_does_not_answer_plain_requests():
+    with patch.object(transcripts._api, "list", return_value=_listing()):
+        result = transcripts.get_transcripts_multilang(VIDEO_ID, ["en", "fr"])
+        assert [item["match"] for item in result["languages"]] == ["exact", "translation"]
+        assert transcripts.get_transcript(VIDEO_ID, "en") == "en text"
+        with pytest.raises(NoTranscriptFound):
+            transcripts.get_transcript(VIDEO_ID, "fr")
+
+
+def test_multilang_reuses_plain_cache_entries():
+    listing = _listing()
+    with patch.object(transcripts._api, "list", return_value=listing):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        transcripts.get_transcript(VIDEO_ID, "en")
+        transcripts.get_transcripts_multilang(VIDEO_ID, ["en"])
+        asyncio.run(transcripts_async.get_transcripts_multilang(VIDEO_ID, ["en"]))
+    assert listing[0].fetches == 1
+
+
+def test_cached_listing_tracks_fetch_through_the_calling_threads_session():
+    listing = _listing()
+    with patch.object(transcripts._api, "list", return_value=listing):
+        transcripts.list_available_transcripts(VIDEO_ID)
+        transcripts.get_transcript(VIDEO_ID, "de")
+    assert listing[3].fetched_via == [transcripts._api.session()]
@@ -0,0 +1,47 @@
+"""Tests for deferred imports of the fetch stack."""
+
+import subprocess
+import sys
+
+from benchmarks.bench_import import FETCH_STACK, parse_importtime
+from mcp_youtube.operations.lazy import LazyModule
+
+
+def _imported_by(module):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name for name, _, _, _ in parse_importtime(proc.stderr)}
+
+
+def test_server_import_does_not_load_fetch_stack():
+    imported = _imported_by("mcp_youtube.server")
+    assert "fastmcp" in imported
+    assert not imported & set(FETCH_STACK)
+
+
+def test_cli_import_is_light():
+    imported = _imported_by("mcp_youtube.cli")
+    assert not imported & {"fastmcp", "langchain_core", *FETCH_STACK}
+
+
+def test_lazy_module_loads_on_first_attribute_access():
+    module = LazyModule("json.tool")
+    sys.modules.pop("json.tool", None)
+    assert not module.loaded
+    assert callable(module.main)
+    assert module.loaded and "json.tool" in sys.modules
+
+
+def test_lazy_module_is_patchable(monkeypatch):
+    from mcp_youtube import handlers, langchain_tools
+
+    monkeypatch.setattr(handlers.transcripts, "get_transcript", lambda *a: "patched")
+    assert langchain_tools.yt_get_transcript.invoke({"video_url": "abc"}) == "patched"
+    monkeypatch.undo()
+    from mcp_youtube.operations import transcripts
+
+    assert transcripts.get_transcript.__name__ == "get_transcript"
@@ -0,0 +1,117 @@
+"""Tests for latency histograms, counters and their exposition."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import (
+    VideoUnavailable,
+)
+
+from mcp_youtube.langchain_tools import yt_get_transcript
+from mcp_youtube.operations import metrics, transcripts
+
+from .conftest import make_fetched
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.configure(True)
+    metrics.reset()
+    yield
+    metrics.configure(True)
+    metrics.reset()
+
+
+def _series(snapshot, kind, name, **labels):
+    for item in snapshot[kind].get(name, []):
+        if all(item["labels"].get(k) == v for k, v in labels.items()):
+            return item
+    return None
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = metrics.Histogram()
+    for value in (0.0001, 0.003, 0.003, 100.0):
+        hist.observe(value)
+    data = hist.snapshot()
+    buckets = dict(data["buckets"])
+    assert data["count"] == 4
+    assert buckets[0.0005] == 1
+    assert buckets[0.005] == 3
+    assert buckets[60.0] == 3
+    assert buckets[float("inf")] == 4
+
+
+def test_operation_stages_and_upstream_are_recorded():
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()):
+        transcripts.get_transcript(VIDEO_ID)
+        transcripts.get_transcript(VIDEO_ID)
+    snap = metrics.snapshot()
+    op = _series(snap, "histograms", "operation_duration_seconds", operation="get_transcript")
+    assert op["count"] == 2
+    for stage, count in (("fetch", 1), ("parse", 1), ("format", 2)):
+        assert _series(snap, "histograms", "stage_duration_seconds", stage=stage)["count"] == count
+    assert snap["counters"]["upstream_requests_total"][0]["value"] == 1
+    assert snap["collectors"]["cache"]["hits"] >= 1
+
+
+def test_async_operations_are_recorded():
+    from mcp_youtube.operations import transcripts_async
+
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()):
+        asyncio.run(transcripts_async.get_transcript_with_timestamps(VIDEO_ID))
+    op = _series(
+        metrics.snapshot(),
+        "histograms",
+        "operation_duration_seconds",
+        operation="get_transcript_with_timestamps",
+    )
+    assert op["count"] == 1
+
+
+def test_tool_errors_are_attributed_to_the_tool():
+    transcripts.configure_rate_limit(max_attempts=1)
+    try:
+        with patch.object(
+            transcripts._api, "fetch", side_effect=VideoUnavailable(VIDEO_ID)
+        ):
+            result = json.loads(yt_get_transcript.invoke({"video_url": VIDEO_ID}))
+    finally:
+        transcripts.configure_rate_limit(rate=10.0, max_attempts=4)
+    assert result["error"]["code"] == "VIDEO_UNAVAILABLE"
+    snap = metrics.snapshot()
+    error = _series(snap, "counters", "tool_errors_total", tool="yt_get_transcript")
+    assert error["labels"] == {
+        "layer": "langchain",
+        "tool": "yt_get_transcript",
+        "code": "VIDEO_UNAVAILABLE",
+    }
+    assert _series(snap, "counters", "upstream_errors_total", code="VIDEO_UNAVAILABLE")
+    tool = _series(snap, "histograms", "tool_duration_seconds", tool="yt_get_transcript")
+    assert tool["count"] == 1
+
+
+def test_prometheus_text_format():
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()):
+        transcripts.get_transcript(VIDEO_ID)
+    text = metrics.prometheus()
+    assert "# TYPE mcp_youtube_operation_duration_seconds histogram" in text
+    assert 'mcp_youtube_operation_duration_seconds_bucket{le="+Inf",operation="get_transcript"} 1' in text
+    assert 'mcp_youtube_upstream_requests_total{call="call"} 1' in text
+    assert "# TYPE mcp_youtube_cache_misses_total counter" in text
+    assert "# TYPE mcp_youtube_cache_stale_hits_total counter" in text
+    assert "# TYPE mcp_youtube_refresh_refreshed_total counter" in text
+    assert "# TYPE mcp_youtube_refresh_pending gauge" in text
+
+
+def test_disabled_metrics_record_nothing():
+    metrics.configure(False)
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()):
+        transcripts.get_transcript(VIDEO_ID)
+    snap = metrics.snapshot()
+    assert snap["histograms"] == {}
+    assert snap["counters"] == {}
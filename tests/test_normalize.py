@@ -0,0 +1,140 @@
+"""Tests for caption normalization of auto-generated transcripts."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_youtube import server
+from mcp_youtube.operations import normalize, transcripts, transcripts_async
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.transcripts import (
+    get_transcript,
+    get_transcript_page,
+    search_transcript,
+)
+
+# Rolling auto-generated fragments: each repeats the tail of the previous one.
+ROWS = [
+    (0.0, 3.0, "[Music]"),
+    (3.0, 2.5, "so today we're going"),
+    (4.5, 3.0, "we're going to talk about"),
+    (7.0, 2.0, "to talk about caching."),
+    (9.0, 1.0, "caching."),
+    (10.0, 2.0, "it is ♪ hard"),
+    (12.5, 2.0, "really hard"),
+    (40.0, 3.0, "(audience laughter)"),
+    (44.0, 2.0, "next topic"),
+]
+
+
+def _transcript(rows=ROWS):
+    return Transcript.from_rows(rows, video_id="dQw4w9WgXcQ", language_code="en")
+
+
+def test_none_is_identity():
+    transcript = _transcript()
+    assert normalize.apply(transcript) is transcript
+
+
+def test_clean_strips_noise_and_repeated_words():
+    clean = normalize.apply(_transcript(), "clean")
+    assert list(clean.texts()) == [
+        "so today we're going",
+        "to talk about",
+        "caching.",
+        "it is hard",
+        "really hard",
+        "next topic",
+    ]
+    # The full repeat of "caching." keeps that line on screen until it ends.
+    assert clean[2].start == 7.0 and clean[2].duration == 3.0
+
+
+def test_repeats_far_apart_in_time_are_kept():
+    rows = [(0.0, 1.0, "very good"), (10.0, 1.0, "good")]
+    assert list(normalize.apply(_transcript(rows), "clean").texts()) == ["very good", "good"]
+
+
+def test_sentences_merge_to_punctuation_and_pauses():
+    sentences = normalize.apply(_transcript(), "sentences")
+    assert list(sentences) == [
+        ("so today we're going to talk about caching.", 3.0, 7.0),
+        ("it is hard really hard", 10.0, 4.5),
+        ("next topic", 44.0, 2.0),
+    ]
+
+
+def test_unpunctuated_sentences_are_capped():
+    rows = [(float(i), 1.0, f"w{i}") for i in range(100)]
+    sentences = normalize.apply(_transcript(rows), "sentences")
+    assert all(d <= normalize.MAX_SENTENCE_SECONDS for d in sentences.durations)
+    assert " ".join(sentences.texts()) == " ".join(f"w{i}" for i in range(100))
+
+
+def test_fixed_windows():
+    # Each window spans 3 seconds from its first line's start.
+    windows = normalize.apply(_transcript(), "3s")
+    assert list(windows) == [
+        ("so today we're going to talk about", 3.0, 4.5),
+        ("caching.", 7.0, 3.0),
+        ("it is hard really hard", 10.0, 4.5),
+        ("next topic", 44.0, 2.0),
+    ]
+
+
+def test_built_once_per_transcript():
+    transcript = _transcript()
+    with patch("mcp_youtube.operations.normalize._clean", wraps=normalize._clean) as clean:
+        first = normalize.apply(transcript, "sentences")
+        assert normalize.apply(transcript, "sentences") is first
+    assert clean.call_count == 1
+
+
+def test_derived_views_count_against_cache_bytes():
+    transcript = _transcript()
+    transcripts._remember(("dQw4w9WgXcQ", "en"), transcript, "exact")
+    base = transcripts.cache_stats()["bytes"]
+    clean = normalize.apply(transcript, "clean")
+    with patch("mcp_youtube.operations.transcripts._fetch", return_value=transcript):
+        search_transcript("dQw4w9WgXcQ", "hard", normalize="clean")
+    assert "search_index" in clean._derived
+    # The clean view, including its search index, is added to the entry's size.
+    assert transcripts.cache_stats()["bytes"] == transcript.nbytes() == base + clean.nbytes()
+
+
+@pytest.mark.parametrize("mode", ["words", "s", "-5s", ""])
+def test_invalid_mode_rejected_before_fetch(mode):
+    with patch("mcp_youtube.operations.transcripts._fetch") as fetch:
+        with pytest.raises(ValueError):
+            get_transcript("dQw4w9WgXcQ", normalize=mode)
+    fetch.assert_not_called()
+
+
+def test_operations_apply_normalization():
+    with patch("mcp_youtube.operations.transcripts._fetch", return_value=_transcript()):
+        text = get_transcript("dQw4w9WgXcQ", normalize="clean")
+        assert "[Music]" not in text and text.count("caching") == 1
+        matches = search_transcript("dQw4w9WgXcQ", "talk about", normalize="sentences")
+    assert [m["text"] for m in matches] == ["so today we're going to talk about caching."]
+
+
+def test_pages_keep_the_mode():
+    with patch("mcp_youtube.operations.transcripts._fetch", return_value=_transcript()):
+        first = get_transcript_page("dQw4w9WgXcQ", max_chars=50, normalize="sentences")
+        rest = get_transcript_page("", max_chars=50, cursor=first["next_cursor"])
+    assert first["total_segments"] == rest["total_segments"] == 3
+    assert first["content"] == "so today we're going to talk about caching."
+    assert rest["content"].startswith("it is hard")
+
+
+def test_async_and_mcp_tool():
+    async def fake_fetch(*args):
+        return _transcript()
+
+    with patch.object(transcripts_async, "_fetch", fake_fetch):
+        text = asyncio.run(server.get_transcript("dQw4w9WgXcQ", normalize="sentences"))
+        error = asyncio.run(server.get_transcript("dQw4w9WgXcQ", normalize="words"))
+    assert text.splitlines()[0] == "so today we're going to talk about caching."
+    assert json.loads(error)["error"]["code"] == "INVALID_ARGUMENT"
@@ -4,15 +4,25 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.compact import Transcript
 from mcp_youtube.operations.transcripts import (
+    cache_stats,
     extract_video_id,
     get_transcript,
+    get_transcripts_batch,
+    iter_transcripts_batch,
+    search_transcripts_batch,
     get_transcript_segment,
+    get_transcript_segments,
     get_transcript_with_timestamps,
+    invalidate_cache,
     list_available_transcripts,
     search_transcript,
 )
 
+from .conftest import make_fetched
+
 # ---------------------------------------------------------------------------
 # extract_video_id
 # ---------------------------------------------------------------------------
@@ -66,33 +76,20 @@ FAKE_RAW_DATA = [
 ]
 
 
-def _make_mock_transcript(raw_data=None):
-    """Create a mock FetchedTranscript with to_raw_data() and iterable Snippet objects."""
+def _make_transcript(raw_data=None):
+    """Create a compact Transcript from raw dict rows."""
     if raw_data is None:
         raw_data = FAKE_RAW_DATA
-
-    mock = MagicMock()
-    mock.to_raw_data.return_value = raw_data
-
-    # Build snippet-like objects so TextFormatter can do `line.text`
-    snippets = []
-    for entry in raw_data:
-        s = MagicMock()
-        s.text = entry["text"]
-        s.start = entry["start"]
-        s.duration = entry["duration"]
-        snippets.append(s)
-    mock.__iter__ = MagicMock(return_value=iter(snippets))
-
-    return mock
+    return Transcript.from_rows(
+        (entry["start"], entry["duration"], entry["text"]) for entry in raw_data
+    )
 
 
 def _patch_fetch(raw_data=None):
-    """Patch _fetch to return a mock transcript."""
-    mock_transcript = _make_mock_transcript(raw_data)
+    """Patch _fetch to return a fixed transcript."""
     return patch(
         "mcp_youtube.operations.transcripts._fetch",
-        return_value=mock_transcript,
+        return_value=_make_transcript(raw_data),
     )
 
 
@@ -111,7 +108,6 @@ def test_get_transcript():
 def test_get_transcript_with_timestamps():
     with _patch_fetch():
         result = get_transcript_with_timestamps("dQw4w9WgXcQ")
-        # JSONFormatter calls .to_raw_data() on the FetchedTranscript
         assert "Hello world" in result
         assert "0.0" in result
 
@@ -155,6 +151,30 @@ def test_get_transcript_segment_empty():
         assert result == ""
 
 
+def test_get_transcript_segment_overlap_mode():
+    with _patch_fetch():
+        # "This is a test" runs 2.0-5.0: it starts before 3 but overlaps [3, 4].
+        assert get_transcript_segment("dQw4w9WgXcQ", 3, 4) == ""
+        assert get_transcript_segment("dQw4w9WgXcQ", 3, 4, mode="overlap") == "This is a test"
+        assert (
+            get_transcript_segment("dQw4w9WgXcQ", 1, 5, mode="overlap")
+            == "Hello world This is a test Goodbye"
+        )
+
+
+def test_get_transcript_segment_invalid_mode():
+    with _patch_fetch(), pytest.raises(ValueError):
+        get_transcript_segment("dQw4w9WgXcQ", 0, 3, mode="nearest")
+
+
+def test_get_transcript_segments_multi_range():
+    with _patch_fetch() as mock_fetch:
+        result = get_transcript_segments("dQw4w9WgXcQ", [(0, 1), (4, 6), (50, 60)])
+        assert [r["text"] for r in result] == ["Hello world", "Goodbye", ""]
+        assert result[1]["start_time"] == 4
+        assert mock_fetch.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # search_transcript
 # ---------------------------------------------------------------------------
@@ -178,3 +198,83 @@ def test_search_transcript_case_insensitive():
     with _patch_fetch():
         matches = search_transcript("dQw4w9WgXcQ", "HELLO")
         assert len(matches) == 1
+
+
+# ---------------------------------------------------------------------------
+# transcript cache
+# ---------------------------------------------------------------------------
+
+
+def _make_fetched_transcript(video_id="dQw4w9WgXcQ"):
+    return make_fetched(FAKE_RAW_DATA, video_id=video_id)
+
+
+def test_repeated_calls_hit_cache():
+    with patch.object(
+        transcripts._api, "fetch", return_value=_make_fetched_transcript()
+    ) as mock_fetch:
+        get_transcript("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        search_transcript("dQw4w9WgXcQ", "hello")
+        get_transcript_segment("https://youtu.be/dQw4w9WgXcQ", 0, 3)
+        assert mock_fetch.call_count == 1
+        stats = cache_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+
+def test_cache_keyed_by_language():
+    with patch.object(
+        transcripts._api, "fetch", return_value=_make_fetched_transcript()
+    ) as mock_fetch:
+        get_transcript("dQw4w9WgXcQ", "en")
+        get_transcript("dQw4w9WgXcQ", "es")
+        assert mock_fetch.call_count == 2
+
+
+def test_invalidate_cache_forces_refetch():
+    with patch.object(
+        transcripts._api, "fetch", return_value=_make_fetched_transcript()
+    ) as mock_fetch:
+        get_transcript("dQw4w9WgXcQ")
+        assert invalidate_cache("https://youtu.be/dQw4w9WgXcQ") == 1
+        get_transcript("dQw4w9WgXcQ")
+        assert mock_fetch.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# batch operations
+# ---------------------------------------------------------------------------
+
+
+def _fetch_or_fail(video_id, languages=("en",)):
+    if video_id == "badbadbadba":
+        raise RuntimeError("Transcripts disabled")
+    return _make_fetched_transcript(video_id=video_id)
+
+
+def test_get_transcripts_batch_preserves_order_and_isolates_failures():
+    urls = ["aaaaaaaaaaa", "badbadbadba", "https://youtu.be/ccccccccccc"]
+    with patch.object(transcripts._api, "fetch", side_effect=_fetch_or_fail):
+        results = get_transcripts_batch(urls, max_concurrency=3)
+    assert [r["video_id"] for r in results] == ["aaaaaaaaaaa", "badbadbadba", "ccccccccccc"]
+    assert [r["ok"] for r in results] == [True, False, True]
+    assert "Hello world" in results[0]["transcript"]
+    assert "Transcripts disabled" in results[1]["error"]
+
+
+def test_search_transcripts_batch():
+    with patch.object(transcripts._api, "fetch", side_effect=_fetch_or_fail):
+        results = search_transcripts_batch(["aaaaaaaaaaa", "badbadbadba"], "goodbye")
+    assert results[0]["matches"] == [{"timestamp": "0:05", "start": 5.0, "text": "Goodbye"}]
+    assert results[1]["ok"] is False
+
+
+def test_iter_transcripts_batch_streams_all_items():
+    urls = [f"video{i:06d}" for i in range(10)]
+    with patch.object(transcripts._api, "fetch", side_effect=_fetch_or_fail):
+        items = list(iter_transcripts_batch(urls, max_concurrency=4))
+    assert sorted(item["index"] for item in items) == list(range(10))
+
+
+def test_batch_empty_input():
+    assert get_transcripts_batch([]) == []
@@ -0,0 +1,160 @@
+"""Tests for the async operations layer."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from mcp_youtube import server
+from mcp_youtube.operations import transcripts, transcripts_async
+
+from .conftest import make_fetched
+
+FAKE_RAW_DATA = [
+    {"text": "Hello world", "start": 0.0, "duration": 2.0},
+    {"text": "This is a test", "start": 2.0, "duration": 3.0},
+    {"text": "Goodbye", "start": 5.0, "duration": 1.5},
+]
+
+
+class SlowApi:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, video_id, languages=("en",)):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return make_fetched(FAKE_RAW_DATA, video_id=video_id, language_code=languages[0])
+
+
+def test_async_operations_match_sync():
+    api = SlowApi(delay=0)
+    with patch.object(transcripts._api, "fetch", side_effect=api.fetch):
+
+        async def main():
+            return (
+                await transcripts_async.get_transcript("dQw4w9WgXcQ"),
+                await transcripts_async.get_transcript_segment("dQw4w9WgXcQ", 0, 3),
+                await transcripts_async.search_transcript("dQw4w9WgXcQ", "hello"),
+            )
+
+        text, segment, matches = asyncio.run(main())
+    assert text == "Hello world\nThis is a test\nGoodbye"
+    assert segment == "Hello world This is a test"
+    assert matches == [{"timestamp": "0:00", "start": 0.0, "text": "Hello world"}]
+    assert api.calls == 1
+
+
+def test_list_available_transcripts_async():
+    mock_t = MagicMock(language="English", language_code="en", is_generated=False)
+    mock_t.is_translatable = True
+    with patch.object(transcripts._api, "list", return_value=[mock_t]):
+        result = asyncio.run(transcripts_async.list_available_transcripts("dQw4w9WgXcQ"))
+    assert result[0]["language_code"] == "en"
+
+
+def test_event_loop_not_blocked_by_upstream():
+    api = SlowApi(delay=0.3)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def main():
+        await asyncio.gather(transcripts_async.get_transcript("dQw4w9WgXcQ"), ticker())
+
+    with patch.object(transcripts._api, "fetch", side_effect=api.fetch):
+        asyncio.run(main())
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    assert max(gaps) < 0.2
+
+
+def test_bounded_concurrency():
+    api = SlowApi(delay=0.05)
+    transcripts_async.configure_concurrency(3)
+    try:
+
+        async def main():
+            await asyncio.gather(
+                *(transcripts_async.get_transcript(f"video{i:06d}") for i in range(12))
+            )
+
+        with patch.object(transcripts._api, "fetch", side_effect=api.fetch):
+            asyncio.run(main())
+    finally:
+        transcripts_async.configure_concurrency(16)
+    assert api.calls == 12
+    assert api.peak <= 3
+
+
+def test_concurrent_same_video_coalesced():
+    api = SlowApi(delay=0.1)
+
+    async def main():
+        return await asyncio.gather(
+            *(transcripts_async.get_transcript("dQw4w9WgXcQ") for _ in range(20))
+        )
+
+    with patch.object(transcripts._api, "fetch", side_effect=api.fetch):
+        results = asyncio.run(main())
+    assert api.calls == 1
+    assert len(set(results)) == 1
+
+
+def test_async_batch_preserves_order_and_isolates_failures():
+    def fetch_or_fail(video_id, languages=("en",)):
+        if video_id == "badbadbadba":
+            raise RuntimeError("boom")
+        return SlowApi(delay=0).fetch(video_id, languages)
+
+    urls = ["aaaaaaaaaaa", "badbadbadba", "ccccccccccc"]
+    with patch.object(transcripts._api, "fetch", side_effect=fetch_or_fail):
+        results = asyncio.run(transcripts_async.get_transcripts_batch(urls, max_concurrency=2))
+    assert [r["video_id"] for r in results] == urls
+    assert [r["ok"] for r in results] == [True, False, True]
+    assert results[1]["error"] == "boom"
+
+
+def test_batch_tool_defaults_to_configured_concurrency():
+    api = SlowApi(delay=0.05)
+    urls = [f"video{i:06d}" for i in range(6)]
+    with (
+        patch.object(transcripts, "_batch_concurrency", 2),
+        patch.object(transcripts._api, "fetch", side_effect=api.fetch),
+    ):
+        asyncio.run(server.get_transcripts_batch(urls))
+    assert api.calls == 6
+    assert api.peak <= 2
+
+
+def test_async_batch_reads_input_lazily():
+    consumed = []
+
+    def urls():
+        for i in range(20):
+            consumed.append(i)
+            yield f"video{i:06d}"
+
+    async def main():
+        results = []
+        async for result in transcripts_async.iter_transcripts_batch(urls(), max_concurrency=2):
+            results.append(result)
+            # Two workers keep at most four tasks alive: the one just yielded,
+            # and up to three more read ahead of it.
+            assert len(consumed) <= len(results) + 3
+        return results
+
+    with patch.object(transcripts._api, "fetch", side_effect=SlowApi(delay=0).fetch):
+        results = asyncio.run(main())
+    assert sorted(r["index"] for r in results) == list(range(20))
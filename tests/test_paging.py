@@ -0,0 +1,101 @@
+"""Tests for cursor-paginated, budgeted transcript pages."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_youtube.langchain_tools import yt_get_transcript
+from mcp_youtube.operations import paging, transcripts
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.transcripts import get_transcript_page
+
+from .conftest import make_fetched
+
+ROWS = [(float(i), 1.0, f"line number {i}") for i in range(50)]
+
+
+def _fetched():
+    return make_fetched(ROWS)
+
+
+def _read_all(video_url, **kwargs):
+    pages = [get_transcript_page(video_url, **kwargs)]
+    while pages[-1]["next_cursor"]:
+        pages.append(
+            get_transcript_page(video_url, cursor=pages[-1]["next_cursor"], **kwargs)
+        )
+    return pages
+
+
+def test_text_pages_reassemble_full_transcript_within_budget():
+    with patch.object(transcripts._api, "fetch", return_value=_fetched()) as mock_fetch:
+        pages = _read_all("dQw4w9WgXcQ", max_chars=100)
+        full = transcripts.get_transcript("dQw4w9WgXcQ")
+    assert len(pages) > 1
+    assert all(len(p["content"]) <= 100 for p in pages)
+    assert "\n".join(p["content"] for p in pages) == full
+    assert pages[-1]["end_index"] == pages[-1]["total_segments"] == len(ROWS)
+    # Continuation pages are cut from the cached transcript.
+    assert mock_fetch.call_count == 1
+
+
+def test_json_pages_are_valid_arrays_and_cover_every_line():
+    with patch.object(transcripts._api, "fetch", return_value=_fetched()):
+        pages = _read_all("dQw4w9WgXcQ", max_tokens=100, timestamps=True)
+    rows = [row for p in pages for row in json.loads(p["content"])]
+    assert [r["text"] for r in rows] == [text for _, _, text in ROWS]
+    assert all(len(p["content"]) <= 100 * paging.CHARS_PER_TOKEN for p in pages)
+
+
+def test_budget_smaller_than_a_line_still_advances():
+    t = Transcript.from_rows(ROWS[:3], video_id="dQw4w9WgXcQ")
+    page = paging.page(t, "text", 0, 1, "en")
+    assert page["content"] == "line number 0"
+    assert page["end_index"] == 1
+
+
+def test_cursor_round_trip_and_validation():
+    cursor = paging.encode_cursor("dQw4w9WgXcQ", "en", "json", 7, 400)
+    assert paging.decode_cursor(cursor) == ("dQw4w9WgXcQ", "en", "json", 7, 400, "none")
+    normalized = paging.encode_cursor("dQw4w9WgXcQ", "en", "json", 7, 400, "sentences")
+    assert paging.decode_cursor(normalized)[5] == "sentences"
+    with pytest.raises(ValueError):
+        paging.decode_cursor("not a cursor")
+    with pytest.raises(ValueError):
+        get_transcript_page("aaaaaaaaaaa", max_chars=10, cursor=cursor)
+
+
+def test_cursor_alone_continues_with_its_budget():
+    with patch.object(transcripts._api, "fetch", return_value=_fetched()):
+        first = get_transcript_page("dQw4w9WgXcQ", max_chars=100)
+        rest = get_transcript_page("", cursor=first["next_cursor"])
+        wider = get_transcript_page("", max_chars=300, cursor=first["next_cursor"])
+    assert rest["start_index"] == first["end_index"]
+    assert 0 < len(rest["content"]) <= 100
+    assert len(wider["content"]) > 200
+
+
+def test_cursor_alone_through_langchain_tool():
+    with patch.object(transcripts._api, "fetch", return_value=_fetched()):
+        first = json.loads(
+            yt_get_transcript.invoke({"video_url": "dQw4w9WgXcQ", "max_chars": 100})
+        )
+        rest = json.loads(
+            yt_get_transcript.invoke(
+                {"video_url": "dQw4w9WgXcQ", "cursor": first["next_cursor"]}
+            )
+        )
+    assert rest["start_index"] == first["end_index"]
+
+
+def test_page_requires_a_budget():
+    with pytest.raises(ValueError):
+        get_transcript_page("dQw4w9WgXcQ")
+
+
+def test_char_budget_takes_the_tighter_limit():
+    assert paging.char_budget(None, None) is None
+    assert paging.char_budget(500, None) == 500
+    assert paging.char_budget(None, 100) == 400
+    assert paging.char_budget(300, 100) == 300
@@ -0,0 +1,142 @@
+"""Tests for the adaptive upstream rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    IpBlocked,
+    TranscriptsDisabled,
+    YouTubeRequestFailed,
+)
+
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.ratelimit import RateLimiter
+
+from .conftest import FakeClock
+
+
+class ScheduledFetcher:
+    """Fake upstream that throttles on the calls listed in ``schedule``."""
+
+    def __init__(self, schedule):
+        self.schedule = set(schedule)
+        self.calls = 0
+
+    def __call__(self, video_id="dQw4w9WgXcQ", languages=("en",)):
+        self.calls += 1
+        if self.calls in self.schedule:
+            raise IpBlocked(video_id)
+        return "ok"
+
+
+def _limiter(clock, **kwargs):
+    options = dict(rate=10.0, burst=2.0, base_delay=0.5, rng=lambda: 1.0)
+    options.update(kwargs)
+    return RateLimiter(clock=clock, sleep=clock.sleep, **options)
+
+
+def test_bucket_allows_burst_then_paces_at_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    for _ in range(5):
+        limiter.acquire()
+    # Two calls ride the burst; the next three wait 1/rate each.
+    assert clock.sleeps == pytest.approx([0.1, 0.1, 0.1])
+
+
+def test_throttled_call_is_retried_with_exponential_backoff():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    fetch = ScheduledFetcher(schedule=[1, 2])
+    assert limiter.call(fetch) == "ok"
+    assert fetch.calls == 3
+    assert limiter.stats()["retries"] == 2
+    assert limiter.stats()["throttled"] == 2
+    assert [s for s in clock.sleeps if s >= 0.5] == [0.5, 1.0]
+
+
+def test_rate_decreases_on_throttle_and_recovers_on_success():
+    clock = FakeClock()
+    limiter = _limiter(clock, increase=1.0, decrease=0.5)
+    limiter.call(ScheduledFetcher(schedule=[1, 2]))
+    # Two halvings, then one additive step after the success.
+    assert limiter.rate == pytest.approx(10.0 * 0.25 + 1.0)
+    for _ in range(10):
+        limiter.call(ScheduledFetcher(schedule=[]))
+    assert limiter.rate == 10.0
+
+
+def test_retry_budget_exhausted_reraises():
+    clock = FakeClock()
+    limiter = _limiter(clock, max_attempts=3)
+    fetch = ScheduledFetcher(schedule=range(1, 100))
+    with pytest.raises(IpBlocked):
+        limiter.call(fetch)
+    assert fetch.calls == 3
+
+    fetch = ScheduledFetcher(schedule=range(1, 100))
+    with pytest.raises(IpBlocked):
+        _limiter(FakeClock(), max_attempts=10, retry_budget=1.0).call(fetch)
+    assert fetch.calls == 2
+
+
+def test_permanent_errors_are_not_retried():
+    limiter = _limiter(FakeClock())
+    calls = []
+
+    def disabled():
+        calls.append(1)
+        raise TranscriptsDisabled("dQw4w9WgXcQ")
+
+    with pytest.raises(TranscriptsDisabled):
+        limiter.call(disabled)
+    assert len(calls) == 1
+    assert limiter.rate == 10.0
+
+
+def test_transient_errors_retry_without_slowing_down():
+    limiter = _limiter(FakeClock())
+    outcomes = iter([YouTubeRequestFailed("dQw4w9WgXcQ", Exception("502")), "ok"])
+
+    def flaky():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert limiter.call(flaky) == "ok"
+    assert limiter.stats()["throttled"] == 0
+
+
+def test_jitter_spreads_retries():
+    limiter = RateLimiter(base_delay=1.0, max_delay=4.0, rng=lambda: 0.25)
+    assert limiter.backoff(1) == 0.25
+    assert limiter.backoff(5) == 1.0  # capped at max_delay before jitter
+
+
+def test_fetch_path_retries_through_shared_limiter():
+    fetched = FetchedTranscript(
+        snippets=[FetchedTranscriptSnippet(text="Hello world", start=0.0, duration=1.0)],
+        video_id="dQw4w9WgXcQ",
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+    schedule = iter([IpBlocked("dQw4w9WgXcQ"), fetched])
+
+    def fetch(video_id, languages):
+        outcome = next(schedule)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    transcripts.configure_rate_limit(base_delay=0.0)
+    try:
+        with patch.object(transcripts._api, "fetch", side_effect=fetch) as mock_fetch:
+            assert "Hello world" in transcripts.get_transcript("dQw4w9WgXcQ")
+        assert mock_fetch.call_count == 2
+    finally:
+        transcripts.configure_rate_limit(rate=10.0, base_delay=0.5)
@@ -0,0 +1,176 @@
+"""Tests for stale-while-revalidate caching and the background refresh scheduler."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import VideoUnavailable
+
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.cache import TranscriptCache
+from mcp_youtube.operations.refresh import RefreshScheduler
+
+from .conftest import FakeClock, make_fetched
+
+VIDEO = "dQw4w9WgXcQ"
+
+
+def _listing(*codes):
+    return [
+        SimpleNamespace(
+            language_code=code,
+            is_generated=False,
+            is_translatable=False,
+            translation_languages=[],
+        )
+        for code in codes
+    ]
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch.object(transcripts._cache, "_clock", clock):
+        yield clock
+
+
+def test_cache_lookup_serves_stale_within_window():
+    clock = FakeClock()
+    cache = TranscriptCache(ttl=10, stale_ttl=5, clock=clock)
+    cache.put(("a", "en"), 1)
+    assert cache.lookup(("a", "en")) == (1, False)
+    clock.now = 12
+    assert cache.get(("a", "en")) is None
+    assert cache.peek(("a", "en"), stale=True) == 1
+    assert cache.lookup(("a", "en")) == (1, True)
+    clock.now = 15
+    assert cache.lookup(("a", "en")) is None
+    assert len(cache) == 0
+    assert cache.stats()["stale_hits"] == 1
+
+
+def _wait_for(predicate, timeout=5.0):
+    """Poll until background workers make ``predicate`` true."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for refresh workers"
+        time.sleep(0.001)
+
+
+def _advance(scheduler, clock, seconds):
+    """Move the injected clock on and wake workers waiting for the next window."""
+    clock.now += seconds
+    with scheduler._cond:
+        scheduler._cond.notify_all()
+
+
+def test_scheduler_budget_per_interval():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(budget=2, interval=60, clock=clock)
+    ran = []
+    for key in "abcd":
+        assert scheduler.request(key, lambda key=key: ran.append(key) or True)
+    _wait_for(lambda: len(ran) == 2 and not scheduler.stats()["running"])
+    # Budget spent: the rest waits for the next window.
+    assert scheduler.stats()["pending"] == 2
+    _advance(scheduler, clock, 60)
+    assert scheduler.wait_idle(5)
+    assert sorted(ran) == list("abcd")
+    assert scheduler.stats()["refreshed"] == scheduler.stats()["changed"] == 4
+
+
+def test_scheduler_coalesces_and_prefers_hot_keys():
+    clock = FakeClock()
+    release = threading.Event()
+    scheduler = RefreshScheduler(budget=1, interval=60, clock=clock)
+    ran = []
+    scheduler.request("busy", lambda: release.wait(5) and False)
+    _wait_for(lambda: scheduler.stats()["running"] == 1)
+    assert not scheduler.request("busy", lambda: True)  # already running
+    scheduler.request("cold", lambda: ran.append("cold") or False)
+    for _ in range(3):
+        scheduler.request("hot", lambda: ran.append("hot") or False)
+    release.set()
+    _wait_for(lambda: not scheduler.stats()["running"])
+    _advance(scheduler, clock, 60)
+    _wait_for(lambda: ran == ["hot"])
+    _advance(scheduler, clock, 60)
+    assert scheduler.wait_idle(5)
+    assert ran == ["hot", "cold"]
+    stats = scheduler.stats()
+    assert stats["requested"] == 6 and stats["coalesced"] == 3
+    assert stats["refreshed"] == 3 and stats["changed"] == 0 and stats["unchanged"] == 3
+
+
+def test_scheduler_clear_resets_budget_window():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(budget=1, interval=60, clock=clock)
+    ran = []
+    scheduler.request("a", lambda: ran.append("a") or True)
+    assert scheduler.wait_idle(5)
+    scheduler.clear()
+    # Same window on the clock, but clear() handed out a fresh budget.
+    scheduler.request("b", lambda: ran.append("b") or True)
+    assert scheduler.wait_idle(5)
+    assert ran == ["a", "b"]
+
+
+def test_stale_transcript_served_then_refreshed(clock):
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()) as fetch:
+        first = transcripts._fetch(VIDEO)
+        clock.now = transcripts._cache.ttl + 1
+        # Served at once from the stale entry; the refetch happens in the background.
+        assert transcripts._fetch(VIDEO) is first
+        assert transcripts._refresher.wait_idle(5)
+        assert fetch.call_count == 2
+        # Unchanged content keeps the cached object and renews its TTL.
+        assert transcripts._fetch(VIDEO) is first
+        fetch.return_value = make_fetched([(0.0, 2.0, "Hello again")])
+        clock.now += transcripts._cache.ttl + 1
+        transcripts._fetch(VIDEO)
+        assert transcripts._refresher.wait_idle(5)
+    assert transcripts._fetch(VIDEO).blob == "Hello again"
+    stats = transcripts.refresh_stats()
+    assert stats["refreshed"] == 2 and stats["changed"] == 1 and stats["unchanged"] == 1
+    assert transcripts.cache_stats()["stale_hits"] == 2
+
+
+def test_stale_listing_refresh_detects_new_tracks(clock):
+    with patch.object(transcripts._api, "list", return_value=_listing("en")) as listing:
+        transcripts._list(VIDEO)
+        clock.now = transcripts._cache.ttl + 1
+        transcripts._list(VIDEO)
+        assert transcripts._refresher.wait_idle(5)
+        listing.return_value = _listing("en", "de")
+        clock.now += transcripts._cache.ttl + 1
+        transcripts._list(VIDEO)
+        assert transcripts._refresher.wait_idle(5)
+    assert [t.language_code for t in transcripts._list(VIDEO)] == ["en", "de"]
+    assert transcripts.refresh_stats()["changed"] == 1
+
+
+def test_refresh_of_removed_video_drops_stale_entry(clock):
+    with patch.object(transcripts._api, "fetch", return_value=make_fetched()) as fetch:
+        transcripts._fetch(VIDEO)
+        fetch.side_effect = VideoUnavailable(VIDEO)
+        clock.now = transcripts._cache.ttl + 1
+        transcripts._fetch(VIDEO)
+        assert transcripts._refresher.wait_idle(5)
+        assert transcripts.refresh_stats()["failed"] == 1
+        with pytest.raises(VideoUnavailable):
+            transcripts._fetch(VIDEO)
+
+
+def test_zero_budget_treats_expired_entries_as_misses(clock):
+    transcripts.configure_refresh(budget=0)
+    try:
+        with patch.object(transcripts._api, "fetch", return_value=make_fetched()) as fetch:
+            first = transcripts._fetch(VIDEO)
+            clock.now = transcripts._cache.ttl + 1
+            assert transcripts._fetch(VIDEO) is not first
+            assert fetch.call_count == 2
+        assert transcripts.refresh_stats()["requested"] == 0
+    finally:
+        transcripts.configure_refresh(budget=10)
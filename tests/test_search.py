@@ -0,0 +1,59 @@
+"""Tests for the per-transcript search index."""
+
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.search import index_for, search
+
+ROWS = [
+    (0.0, 2.0, "We're no strangers"),
+    (2.0, 2.0, "to love, you know the rules"),
+    (4.0, 2.0, "and so do I. Never"),
+    (6.0, 2.0, "gonna give you up"),
+    (65.0, 2.0, "never GONNA let you down"),
+]
+
+
+def _transcript():
+    return Transcript.from_rows(ROWS)
+
+
+def test_single_term_case_insensitive():
+    results = search(_transcript(), "RULES")
+    assert results == [{"timestamp": "0:02", "start": 2.0, "text": "to love, you know the rules"}]
+
+
+def test_phrase_across_line_boundary():
+    results = search(_transcript(), "never gonna")
+    assert [r["start"] for r in results] == [4.0, 65.0]
+    assert results[0]["text"] == "and so do I. Never gonna give you up"
+
+
+def test_multiple_terms_one_pass_in_time_order():
+    results = search(_transcript(), ["down", "strangers", "love"])
+    assert [r["start"] for r in results] == [0.0, 2.0, 65.0]
+    assert results[0]["terms"] == ["strangers"]
+    assert results[2]["terms"] == ["down"]
+
+
+def test_terms_on_same_line_merge():
+    results = search(_transcript(), ["love", "rules"])
+    assert len(results) == 1
+    assert results[0]["terms"] == ["love", "rules"]
+
+
+def test_context_window():
+    # Match spans 2.0-4.0; lines starting within [0.0, 6.0] are included.
+    results = search(_transcript(), "rules", context=2)
+    assert results[0]["context"] == (
+        "We're no strangers to love, you know the rules and so do I. Never gonna give you up"
+    )
+
+
+def test_no_match_and_empty_terms():
+    assert search(_transcript(), "rickroll") == []
+    assert search(_transcript(), ["", "   "]) == []
+
+
+def test_index_built_once_and_cached_on_transcript():
+    t = _transcript()
+    assert index_for(t) is index_for(t)
+    assert index_for(t).text.startswith("we're no strangers to love")
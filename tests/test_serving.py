@@ -0,0 +1,131 @@
+"""Tests for the multi-worker streamable-HTTP serving mode."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import httpx
+from starlette.testclient import TestClient
+
+from mcp_youtube import cli, serving
+
+HEADERS = {"accept": "application/json, text/event-stream"}
+
+
+def _app(delay: float):
+    async def app(scope, receive, send):
+        await asyncio.sleep(delay)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def _get(app) -> httpx.Response:
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/")
+
+    return asyncio.run(main())
+
+
+def test_request_timeout_passes_fast_requests():
+    response = _get(serving.RequestTimeout(_app(0), timeout=1.0))
+    assert response.status_code == 200
+
+
+def test_request_timeout_answers_504():
+    async def slow(scope, receive, send):
+        await asyncio.sleep(5)
+
+    response = _get(serving.RequestTimeout(slow, timeout=0.05))
+    assert response.status_code == 504
+    assert response.json()["error"] == {
+        "message": "Request timed out",
+        "code": "TIMEOUT",
+        "retryable": True,
+    }
+
+
+def test_request_timeout_disabled():
+    response = _get(serving.RequestTimeout(_app(0.05), timeout=0))
+    assert response.status_code == 200
+
+
+def test_concurrency_limit_queues_then_rejects():
+    running = peak = 0
+
+    async def app(scope, receive, send):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    limited = serving.ConcurrencyLimit(app, max_requests=2, max_queued=3)
+
+    async def main():
+        transport = httpx.ASGITransport(app=limited)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(client.get("/mcp") for _ in range(8)))
+            health = await client.get("/health")
+        return responses, health
+
+    responses, health = asyncio.run(main())
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses == [200] * 5 + [503] * 3
+    assert peak == 2
+    rejected = next(r for r in responses if r.status_code == 503)
+    assert rejected.headers["retry-after"] == "1"
+    assert rejected.json()["error"]["code"] == "OVERLOADED"
+    assert health.status_code == 200  # probes bypass the limit
+    assert limited.pending == 0
+
+
+def test_app_is_stateless_json_with_health():
+    with patch("mcp_youtube.server.preload"), TestClient(serving.create_app()) as client:
+        health = client.get("/health").json()
+        assert health["status"] == "ok" and health["pid"] > 0
+        # No initialize / session id needed: any worker can take any request.
+        response = client.post(
+            serving.MCP_PATH,
+            json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+            headers=HEADERS,
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert "mcp-session-id" not in response.headers
+    names = {tool["name"] for tool in response.json()["result"]["tools"]}
+    assert {"get_transcript", "search_transcript"} <= names
+
+
+def test_cli_serve_http_options():
+    with patch("mcp_youtube.serving.serve") as serve:
+        cli.main(["serve", "--http", "-w", "4", "--port", "9000", "--timeout", "5"])
+    serve.assert_called_once_with(
+        host=None,
+        port=9000,
+        workers=4,
+        request_timeout=5.0,
+        max_concurrency=None,
+        max_queue=None,
+        backlog=None,
+        shutdown_timeout=None,
+    )
+
+
+def test_serve_passes_limits_to_uvicorn(monkeypatch):
+    monkeypatch.setenv("MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT", "60")
+    monkeypatch.setenv("MCP_YOUTUBE_HTTP_MAX_CONCURRENCY", "64")
+    with patch("uvicorn.run") as run:
+        serving.serve(workers=3, request_timeout=12, max_concurrency=8, shutdown_timeout=0)
+    (app,), kwargs = run.call_args
+    assert app == serving.APP_FACTORY and kwargs["factory"] is True
+    assert kwargs["workers"] == 3
+    assert kwargs["timeout_graceful_shutdown"] == 0
+    # Worker processes pick their limits up from the environment.
+    assert os.environ["MCP_YOUTUBE_HTTP_REQUEST_TIMEOUT"] == "12"
+    assert os.environ["MCP_YOUTUBE_HTTP_MAX_CONCURRENCY"] == "8"
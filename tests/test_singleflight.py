@@ -0,0 +1,167 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.singleflight import SingleFlight
+
+
+class SlowFetcher:
+    """Fake upstream that sleeps and counts calls."""
+
+    def __init__(self, delay=0.2, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, video_id, languages=("en",)):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hello world", start=0.0, duration=2.0)],
+            video_id=video_id,
+            language="English",
+            language_code=languages[0],
+            is_generated=False,
+        )
+
+    async def fetch_async(self, video_id):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return video_id
+
+
+def _run_threads(fn, n=10):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        return [f.exception() or f.result() for f in futures]
+
+
+def test_threads_share_one_call():
+    flight = SingleFlight()
+    fetcher = SlowFetcher()
+    results = _run_threads(lambda: flight.do("k", fetcher, "vid"))
+    assert fetcher.calls == 1
+    assert all(r is results[0] for r in results)
+    assert flight.in_flight() == 0
+    assert flight.stats()["followers"] == 9
+
+
+def test_threads_share_exception():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(error=RuntimeError("upstream down"))
+    results = _run_threads(lambda: flight.do("k", fetcher, "vid"))
+    assert fetcher.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_distinct_keys_not_coalesced():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(delay=0.05)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        a = pool.submit(flight.do, "a", fetcher, "a")
+        b = pool.submit(flight.do, "b", fetcher, "b")
+        a.result(), b.result()
+    assert fetcher.calls == 2
+
+
+def test_sequential_calls_not_coalesced():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(delay=0)
+    flight.do("k", fetcher, "vid")
+    flight.do("k", fetcher, "vid")
+    assert fetcher.calls == 2
+
+
+def test_async_tasks_share_one_call():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(delay=0.1)
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async("k", fetcher.fetch_async, "vid") for _ in range(20))
+        )
+
+    results = asyncio.run(main())
+    assert fetcher.calls == 1
+    assert results == ["vid"] * 20
+    assert flight.in_flight() == 0
+
+
+def test_async_tasks_share_exception():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(delay=0.05, error=ValueError("nope"))
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async("k", fetcher.fetch_async, "vid") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert fetcher.calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_async_waiter_cancellation_does_not_cancel_others():
+    flight = SingleFlight()
+    fetcher = SlowFetcher(delay=0.1)
+
+    async def main():
+        first = asyncio.ensure_future(flight.do_async("k", fetcher.fetch_async, "vid"))
+        second = asyncio.ensure_future(flight.do_async("k", fetcher.fetch_async, "vid"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "vid"
+    assert fetcher.calls == 1
+
+
+def test_fetch_coalesces_concurrent_misses():
+    fetcher = SlowFetcher()
+    with patch.object(transcripts._api, "fetch", side_effect=fetcher):
+        results = _run_threads(lambda: transcripts.get_transcript("dQw4w9WgXcQ"))
+    assert fetcher.calls == 1
+    assert results == ["Hello world"] * 10
+
+
+def test_list_coalesces_concurrent_calls():
+    fetcher = SlowFetcher()
+
+    def slow_list(video_id):
+        fetcher.calls += 1
+        time.sleep(0.2)
+        return []
+
+    with patch.object(transcripts._api, "list", side_effect=slow_list):
+        results = _run_threads(
+            lambda: transcripts.list_available_transcripts("dQw4w9WgXcQ")
+        )
+    assert fetcher.calls == 1
+    assert results == [[]] * 10
+
+
+def test_fetch_shares_upstream_exception():
+    fetcher = SlowFetcher(error=RuntimeError("blocked"))
+    with patch.object(transcripts._api, "fetch", side_effect=fetcher):
+        results = _run_threads(lambda: transcripts.get_transcript("dQw4w9WgXcQ"))
+    assert fetcher.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        with patch.object(transcripts._api, "fetch", side_effect=fetcher):
+            transcripts.get_transcript("dQw4w9WgXcQ")
+    assert fetcher.calls == 2
@@ -0,0 +1,168 @@
+"""Tests for the persistent SQLite transcript store and its CLI commands."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from youtube_transcript_api import (
+    VideoUnavailable,
+)
+
+from mcp_youtube import cli
+from mcp_youtube.operations import transcripts
+from mcp_youtube.operations.compact import Transcript
+from mcp_youtube.operations.store import TranscriptStore
+
+from .conftest import make_fetched
+
+FAKE_RAW_DATA = [
+    {"text": "Hello world", "start": 0.0, "duration": 2.0},
+    {"text": "This is a test", "start": 2.0, "duration": 3.0},
+]
+
+
+def _fetched(**kwargs):
+    return make_fetched(FAKE_RAW_DATA, **kwargs)
+
+
+def _transcript(**kwargs):
+    return Transcript.from_fetched(_fetched(**kwargs))
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = TranscriptStore(str(tmp_path / "store.db"))
+    yield s
+    s.close()
+
+
+def test_roundtrip(store):
+    store.put(_transcript())
+    loaded = store.get("dQw4w9WgXcQ", "en")
+    assert loaded.to_raw_data() == FAKE_RAW_DATA
+    assert loaded.language == "English"
+    assert loaded.is_generated is False
+    assert store.get("dQw4w9WgXcQ", "es") is None
+
+
+def test_manual_preferred_over_generated(store):
+    store.put(_transcript(is_generated=True))
+    store.put(_transcript(is_generated=False))
+    assert store.get("dQw4w9WgXcQ", "en").is_generated is False
+    assert store.stats()["entries"] == 2
+
+
+def test_wal_mode(store):
+    store.put(_transcript())
+    mode = store._conn().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_size_based_eviction(store):
+    store.put(_transcript(video_id="aaaaaaaaaaa"))
+    store.put(_transcript(video_id="bbbbbbbbbbb"))
+    store.get("aaaaaaaaaaa", "en")  # touch a so b is least recently used
+    one_row = store.stats()["bytes"] // 2
+    assert store.prune(max_bytes=one_row) == 1
+    assert store.get("aaaaaaaaaaa", "en") is not None
+    assert store.get("bbbbbbbbbbb", "en") is None
+
+
+def test_shared_between_instances(store, tmp_path):
+    store.put(_transcript())
+    other = TranscriptStore(store.path)
+    assert other.get("dQw4w9WgXcQ", "en") is not None
+    other.close()
+
+
+def test_cold_process_served_without_network(tmp_path):
+    path = str(tmp_path / "store.db")
+    transcripts.configure_store(path)
+    try:
+        with patch.object(transcripts._api, "fetch", return_value=_fetched()) as m:
+            transcripts.get_transcript("dQw4w9WgXcQ")
+            assert m.call_count == 1
+
+        # Simulate a fresh process: empty in-memory cache, new store handle.
+        transcripts.clear_cache()
+        transcripts.configure_store(path)
+        with patch.object(transcripts._api, "fetch", side_effect=AssertionError) as m:
+            assert "Hello world" in transcripts.get_transcript("dQw4w9WgXcQ")
+            assert m.call_count == 0
+    finally:
+        transcripts.configure_store(None)
+
+
+def test_cli_stats_and_export(store, capsys):
+    store.put(_transcript())
+    assert cli.main(["cache", "--db", store.path, "stats"]) == 0
+    assert json.loads(capsys.readouterr().out)["entries"] == 1
+
+    assert cli.main(["cache", "--db", store.path, "export"]) == 0
+    record = json.loads(capsys.readouterr().out.splitlines()[0])
+    assert record["video_id"] == "dQw4w9WgXcQ"
+    assert record["segments"][0] == [0.0, 2.0, "Hello world"]
+
+
+def test_cli_prune(store, capsys):
+    store.put(_transcript())
+    assert cli.main(["cache", "--db", store.path, "prune", "--max-bytes", "0"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["removed"] == 1
+    assert result["entries"] == 0
+
+
+@pytest.fixture
+def prefetch_input(tmp_path):
+    path = tmp_path / "videos.txt"
+    path.write_text(
+        "# workshop videos\n"
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa\n"
+        "https://youtu.be/bbbbbbbbbbb  # duplicate below\n"
+        "bbbbbbbbbbb\n"
+        "\n"
+        "badbadbadba\n"
+    )
+    return str(path)
+
+
+def _fake_fetch(video_id, languages):
+    if video_id == "badbadbadba":
+        raise VideoUnavailable(video_id)
+    return _fetched(video_id=video_id)
+
+
+def test_cli_prefetch_fills_store(tmp_path, prefetch_input, capsys):
+    db = str(tmp_path / "store.db")
+    try:
+        with patch.object(transcripts._api, "fetch", side_effect=_fake_fetch) as m:
+            assert cli.main(["prefetch", prefetch_input, "--db", db, "-q"]) == 1
+        assert m.call_count == 3
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["videos"] == 3
+        assert summary["fetched"] == 2
+        assert summary["failed"] == 1
+        assert summary["bytes"] == 2 * len("Hello world\nThis is a test")
+        assert summary["failures"][0]["error_code"] == "VIDEO_UNAVAILABLE"
+        assert transcripts._store.get("bbbbbbbbbbb", "en") is not None
+    finally:
+        transcripts.configure_store(None)
+
+
+def test_cli_prefetch_resume_skips_finished(tmp_path, prefetch_input, capsys):
+    db = str(tmp_path / "store.db")
+    journal = str(tmp_path / "journal.jsonl")
+    args = ["prefetch", prefetch_input, "--db", db, "--resume", journal, "-q"]
+    try:
+        with patch.object(transcripts._api, "fetch", side_effect=_fake_fetch):
+            cli.main(args)
+        capsys.readouterr()
+        transcripts.clear_cache()
+        with patch.object(transcripts._api, "fetch", side_effect=_fake_fetch) as m:
+            cli.main(args)
+        # Only the failed video is retried.
+        assert [c.args[0] for c in m.call_args_list] == ["badbadbadba"]
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["skipped"] == 2
+    finally:
+        transcripts.configure_store(None)